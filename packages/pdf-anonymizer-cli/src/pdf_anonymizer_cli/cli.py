@@ -1,32 +1,51 @@
 import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import typer
 from dotenv import load_dotenv
 from pdf_anonymizer_core.conf import (
+    DEFAULT_CHECKPOINT_DIR,
     DEFAULT_LOG_FILE,
+    AppConfig,
     ConfigProfile,
     EntityProfile,
+    PlaceholderOrder,
     PromptEnum,
     get_config_for_profile,
     get_provider_and_model_name,
     operators_for_entity_profile,
     types_for_entity_profile,
 )
-from pdf_anonymizer_core.core import anonymize_file, anonymize_tabular_file
+from pdf_anonymizer_core.coordinator import MappingCoordinator, start_coordinator
+from pdf_anonymizer_core.core import (
+    anonymize_csv_stream,
+    anonymize_file,
+    anonymize_tabular_file,
+)
 from pdf_anonymizer_core.gazetteers import load_phrase_list
 from pdf_anonymizer_core.llm_provider import configure_cache
 from pdf_anonymizer_core.mapping_crypto import resolve_mapping_passphrase
+from pdf_anonymizer_core.mapping_store import (
+    MappingStore,
+    SQLiteMappingStore,
+    is_mapping_store,
+)
+from pdf_anonymizer_core.model_limits import token_budget_chunk_size
 from pdf_anonymizer_core.operators import parse_operator_specs
 from pdf_anonymizer_core.prompts import detailed, hipaa, simple
-from pdf_anonymizer_core.tables import is_tabular_path, load_review_text
+from pdf_anonymizer_core.tables import is_tabular_path, load_review_text, load_table
 from pdf_anonymizer_core.utils import (
+    anonymized_output_path,
     consolidate_mapping,
     deanonymize_file,
     load_seed_mapping,
+    save_mapping,
     save_results,
 )
 from pdf_anonymizer_core.risk import assess_linkage_risk, write_risk_report
@@ -50,6 +69,228 @@ def load_environment() -> None:
         load_dotenv(env_path)
 
 
+@dataclass
+class _RunJob:
+    """Settings shared by every file of one ``run`` (picklable for --jobs)."""
+
+    config: AppConfig
+    prompt_template: str
+    anonymized_entities: Optional[List[str]]
+    operators: Optional[Dict[str, str]]
+    fake_secret: Optional[str]
+    keep_list: Optional[List[str]]
+    deny_list: Optional[List[str]]
+    use_llm: bool
+    stream_csv: bool
+    checkpoint_dir: Optional[str]
+    resume: bool
+    overlap_once: bool
+    premask: bool
+    passphrase: Optional[str]
+    ephemeral_mapping: bool
+    verify: bool
+    verify_llm: bool
+    risk: bool
+    placeholder_order: PlaceholderOrder
+
+
+def _configure_llm_cache(config: AppConfig) -> None:
+    """Configure LLM caching with values from configuration."""
+    configure_cache(
+        enabled=config.enable_cache,
+        cache_dir=config.cache_dir,
+        cache_file=config.cache_file,
+        max_bytes=config.cache_max_bytes,
+        max_age_seconds=config.cache_max_age_seconds,
+    )
+
+
+def _init_worker(job: _RunJob) -> None:
+    """Pool initializer: open the run's LLM cache in the worker process."""
+    if job.use_llm:
+        _configure_llm_cache(job.config)
+
+
+def _anonymize_one(
+    file_path: Path,
+    job: _RunJob,
+    seed_mapping: Optional[Dict[str, str]] = None,
+    coordinator: Optional[MappingCoordinator] = None,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Optional[Dict[str, str]]:
+    """Anonymize, save, verify and score one file.
+
+    Returns the file's original -> written mapping, or None when no text
+    could be extracted. Raises ``ValueError`` like the core functions.
+    """
+    if job.stream_csv and file_path.suffix.lower() == ".csv":
+        anonymized_output_file = anonymized_output_path(str(file_path))
+        final_mapping, _entity_texts = anonymize_csv_stream(
+            file_path=str(file_path),
+            output_path=anonymized_output_file,
+            characters_to_anonymize=job.config.chunk_size,
+            prompt_template=job.prompt_template,
+            model_name=job.config.model_name,
+            anonymized_entities=job.anonymized_entities,
+            regex_patterns=job.config.regex_patterns,
+            max_retries=job.config.max_retries,
+            base_retry_delay=job.config.base_retry_delay,
+            max_retry_delay=job.config.max_retry_delay,
+            operators=job.operators,
+            fake_secret=job.fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=job.keep_list,
+            deny_list=job.deny_list,
+            use_llm=job.use_llm,
+            max_concurrency=job.config.max_concurrency,
+            coordinator=coordinator,
+            placeholder_order=job.placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+        logging.info(f"Anonymization for {file_path} complete!")
+        logging.info(f"Anonymized text saved into '{anonymized_output_file}'")
+        if job.ephemeral_mapping:
+            logging.info("Ephemeral mapping: vocabulary was not written to disk.")
+        else:
+            mapping_file = save_mapping(
+                {v: k for k, v in final_mapping.items()},
+                str(file_path),
+                job.passphrase,
+            )
+            if mapping_file.endswith(".enc"):
+                logging.info(f"Encrypted mapping saved into '{mapping_file}'")
+            else:
+                logging.info(f"Mapping vocabulary saved into '{mapping_file}'")
+        if job.verify or job.verify_llm or job.risk:
+            logging.info("--stream-csv: skipping --verify / --risk for this file.")
+        return final_mapping
+
+    entity_texts = None
+    table_doc = None
+    if is_tabular_path(str(file_path)):
+        # One load: the anonymized cells and styled workbook go
+        # straight to save_results.
+        table_doc = load_table(str(file_path), keep_workbook=True)
+        full_anonymized_text, final_mapping, entity_texts = anonymize_tabular_file(
+            file_path=str(file_path),
+            characters_to_anonymize=job.config.chunk_size,
+            prompt_template=job.prompt_template,
+            model_name=job.config.model_name,
+            anonymized_entities=job.anonymized_entities,
+            chunk_overlap=job.config.chunk_overlap,
+            regex_patterns=job.config.regex_patterns,
+            max_retries=job.config.max_retries,
+            base_retry_delay=job.config.base_retry_delay,
+            max_retry_delay=job.config.max_retry_delay,
+            operators=job.operators,
+            fake_secret=job.fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=job.keep_list,
+            deny_list=job.deny_list,
+            use_llm=job.use_llm,
+            max_concurrency=job.config.max_concurrency,
+            document=table_doc,
+            coordinator=coordinator,
+            placeholder_order=job.placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+    else:
+        full_anonymized_text, final_mapping = anonymize_file(
+            file_path=str(file_path),
+            characters_to_anonymize=job.config.chunk_size,
+            prompt_template=job.prompt_template,
+            model_name=job.config.model_name,
+            anonymized_entities=job.anonymized_entities,
+            chunk_overlap=job.config.chunk_overlap,
+            regex_patterns=job.config.regex_patterns,
+            max_retries=job.config.max_retries,
+            base_retry_delay=job.config.base_retry_delay,
+            max_retry_delay=job.config.max_retry_delay,
+            operators=job.operators,
+            fake_secret=job.fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=job.keep_list,
+            deny_list=job.deny_list,
+            use_llm=job.use_llm,
+            max_concurrency=job.config.max_concurrency,
+            extract_workers=job.config.extract_workers,
+            checkpoint_dir=job.checkpoint_dir,
+            resume=job.resume,
+            overlap_once=job.overlap_once,
+            premask=job.premask,
+            coordinator=coordinator,
+            placeholder_order=job.placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+
+    if full_anonymized_text is None or final_mapping is None:
+        return None
+
+    # The mapping from anonymize_file is original -> placeholder.
+    # We will standardize on placeholder -> original for subsequent steps.
+    placeholder_to_original = {v: k for k, v in final_mapping.items()}
+
+    logging.info("Consolidating mapping...")
+    full_anonymized_text, consolidated_placeholder_map = consolidate_mapping(
+        full_anonymized_text, placeholder_to_original
+    )
+
+    anonymized_output_file, mapping_file = save_results(
+        full_anonymized_text,
+        consolidated_placeholder_map,
+        str(file_path),
+        mapping_passphrase=job.passphrase,
+        ephemeral_mapping=job.ephemeral_mapping,
+        entity_texts=entity_texts,
+        orig_to_written=final_mapping if is_tabular_path(str(file_path)) else None,
+        table=table_doc,
+    )
+    if table_doc is not None:
+        table_doc.close()
+    logging.info(f"Anonymization for {file_path} complete!")
+    logging.info(f"Anonymized text saved into '{anonymized_output_file}'")
+    if job.ephemeral_mapping or not mapping_file:
+        logging.info("Ephemeral mapping: vocabulary was not written to disk.")
+    elif mapping_file.endswith(".enc"):
+        logging.info(f"Encrypted mapping saved into '{mapping_file}'")
+    else:
+        logging.info(f"Mapping vocabulary saved into '{mapping_file}'")
+
+    if job.verify or job.verify_llm:
+        report = verify_anonymized_text(
+            full_anonymized_text,
+            anonymized_file=anonymized_output_file,
+            regex_patterns=job.config.regex_patterns,
+            use_llm=job.verify_llm,
+            model_name=job.config.model_name if job.verify_llm else None,
+            max_retries=job.config.max_retries,
+            base_retry_delay=job.config.base_retry_delay,
+            max_retry_delay=job.config.max_retry_delay,
+        )
+        report_path = write_residual_report(report, anonymized_output_file)
+        logging.info(
+            "Residual check: %s leftover hit(s). Report: %s",
+            report["residual_count"],
+            report_path,
+        )
+
+    if job.risk:
+        risk_report = assess_linkage_risk(full_anonymized_text)
+        risk_path = write_risk_report(risk_report, anonymized_output_file)
+        logging.info(
+            "Linkage risk: %s (%s high / %s medium windows). Report: %s",
+            risk_report["overall"],
+            risk_report["high_count"],
+            risk_report["medium_count"],
+            risk_path,
+        )
+    return final_mapping
+
+
 @app.command()
 def run(
     file_paths: Annotated[
@@ -218,7 +459,9 @@ def run(
             "--mapping-in",
             help=(
                 "Existing mapping file so the same person stays PERSON_1 "
-                "across documents. Also used as the starting map for a batch."
+                "across documents. Also used as the starting map for a batch. "
+                "A mapping store (see import-mapping) is read per entry and "
+                "gets each file's new entries."
             ),
             exists=True,
             file_okay=True,
@@ -248,6 +491,115 @@ def run(
             case_sensitive=False,
         ),
     ] = None,
+    max_concurrency: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-concurrency",
+            min=1,
+            help=(
+                "How many chunks to send to the language model at once. "
+                "Same output as one at a time. Default: 1."
+            ),
+        ),
+    ] = None,
+    extract_workers: Annotated[
+        Optional[int],
+        typer.Option(
+            "--extract-workers",
+            min=1,
+            help=(
+                "Processes used to convert PDF pages to Markdown. "
+                "Same output as one process. Default: 1."
+            ),
+        ),
+    ] = None,
+    stream_csv: Annotated[
+        bool,
+        typer.Option(
+            "--stream-csv",
+            help=(
+                "Anonymize .csv inputs in two streaming passes with no size "
+                "or cell cap. Memory stays bounded; --verify and --risk are "
+                "skipped for these files."
+            ),
+        ),
+    ] = False,
+    checkpoint: Annotated[
+        bool,
+        typer.Option(
+            "--checkpoint",
+            help=(
+                "Record finished chunks under data/checkpoints/ so an "
+                "interrupted run can be continued with --resume. The journal "
+                "holds detected PII and is deleted when the file finishes."
+            ),
+        ),
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help=(
+                "Reuse chunks finished by an earlier --checkpoint run of the "
+                "same file and settings. Only the rest are sent to the "
+                "language model. Implies --checkpoint."
+            ),
+        ),
+    ] = False,
+    overlap_once: Annotated[
+        bool,
+        typer.Option(
+            "--overlap-once",
+            help=(
+                "Split without chunk overlap and send only a short window "
+                "around each cut to the language model. Fewer tokens."
+            ),
+        ),
+    ] = False,
+    auto_chunk_size: Annotated[
+        bool,
+        typer.Option(
+            "--auto-chunk-size",
+            help=(
+                "Pick the chunk size from the model's context window and "
+                "output-token limit instead of the profile's character count."
+            ),
+        ),
+    ] = False,
+    premask: Annotated[
+        bool,
+        typer.Option(
+            "--premask",
+            help=(
+                "Replace regex hits (e-mails, IBANs, card numbers, ...) with "
+                "short tokens in the text sent to the language model."
+            ),
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help=(
+                "Anonymize this many files at once, each in its own process. "
+                "Placeholders stay consistent across files. Default: 1."
+            ),
+        ),
+    ] = 1,
+    placeholder_order: Annotated[
+        PlaceholderOrder,
+        typer.Option(
+            "--placeholder-order",
+            help=(
+                "How new placeholders are numbered: arrival (detection order), "
+                "offset (first occurrence in the document) or sorted (type, "
+                "then text). offset and sorted give the same numbers for "
+                "concurrent, resumed and --jobs runs."
+            ),
+            case_sensitive=False,
+        ),
+    ] = PlaceholderOrder.ARRIVAL,
 ) -> None:
     """
     Anonymize one or more files by replacing PII with anonymized placeholders.
@@ -266,6 +618,8 @@ def run(
             prompt_name=prompt_name,
             chunk_size=characters_to_anonymize,
             countries=country_list,
+            max_concurrency=max_concurrency,
+            extract_workers=extract_workers,
         )
     except ValueError as exc:
         logging.error("%s", exc)
@@ -288,12 +642,7 @@ def run(
             verify_llm = False
 
     if use_llm:
-        # Configure LLM caching with values from configuration
-        configure_cache(
-            enabled=config.enable_cache,
-            cache_dir=config.cache_dir,
-            cache_file=config.cache_file,
-        )
+        _configure_llm_cache(config)
 
         provider_name, _ = get_provider_and_model_name(config.model_name)
         if provider_name == "google":
@@ -309,6 +658,32 @@ def run(
     logging.info(f"  --chunk-overlap: {config.chunk_overlap}")
     logging.info(f"  --model-name: {config.model_name}")
     logging.info(f"  --use-llm: {use_llm}")
+    logging.info(f"  --max-concurrency: {config.max_concurrency}")
+    logging.info(f"  --extract-workers: {config.extract_workers}")
+    if stream_csv:
+        logging.info("  --stream-csv: on")
+    if checkpoint:
+        logging.info("  --checkpoint: on")
+    if resume:
+        logging.info("  --resume: on")
+    if overlap_once:
+        logging.info("  --overlap-once: on")
+    if premask:
+        logging.info("  --premask: on")
+    if jobs > 1:
+        logging.info(f"  --jobs: {jobs}")
+    if placeholder_order != PlaceholderOrder.ARRIVAL:
+        logging.info(f"  --placeholder-order: {placeholder_order.value}")
+    # The journal holds detected PII: only write one when asked to, and never
+    # for an ephemeral run.
+    checkpoint_dir = None
+    if checkpoint or resume:
+        if ephemeral_mapping:
+            logging.warning(
+                "--checkpoint and --resume have no effect with --ephemeral-mapping."
+            )
+        else:
+            checkpoint_dir = DEFAULT_CHECKPOINT_DIR
     if country_list:
         logging.info(f"  --countries: {country_list}")
         logging.info(
@@ -351,6 +726,23 @@ def run(
         )
         logging.info("  --operator after profile: %s", operator_map)
 
+    if auto_chunk_size:
+        if not use_llm:
+            logging.info("--auto-chunk-size has no effect without the language model.")
+        else:
+            if characters_to_anonymize is not None:
+                logging.warning(
+                    "--auto-chunk-size overrides --characters-to-anonymize."
+                )
+            try:
+                config.chunk_size = token_budget_chunk_size(
+                    config.model_name, prompt_template
+                )
+            except ValueError as exc:
+                logging.error("%s", exc)
+                sys.exit(1)
+            logging.info(f"  --auto-chunk-size: {config.chunk_size} characters")
+
     keep_phrases = load_phrase_list(str(keep_list)) if keep_list else None
     deny_phrases = load_phrase_list(str(deny_list)) if deny_list else None
     if keep_phrases:
@@ -361,121 +753,141 @@ def run(
     logging.info(f"Found {len(file_paths)} file(s) to process.")
 
     seed_mapping = None
+    mapping_store = None
     passphrase = resolve_mapping_passphrase(mapping_passphrase)
     if mapping_in is not None:
         try:
-            seed_mapping = load_seed_mapping(str(mapping_in), passphrase)
+            if is_mapping_store(mapping_in):
+                mapping_store = SQLiteMappingStore(mapping_in, passphrase)
+            else:
+                seed_mapping = load_seed_mapping(str(mapping_in), passphrase)
         except ValueError as exc:
             logging.error("%s", exc)
             sys.exit(1)
-        logging.info("  --mapping-in: %s (%s entries)", mapping_in, len(seed_mapping))
+        logging.info(
+            "  --mapping-in: %s (%s entries%s)",
+            mapping_in,
+            len(mapping_store if mapping_store is not None else seed_mapping),
+            ", mapping store" if mapping_store is not None else "",
+        )
+
+    job = _RunJob(
+        config=config,
+        prompt_template=prompt_template,
+        anonymized_entities=entities_to_anonymize,
+        operators=operator_map or None,
+        fake_secret=fake_secret or os.getenv("ANONYMIZER_FAKE_SECRET"),
+        keep_list=keep_phrases,
+        deny_list=deny_phrases,
+        use_llm=use_llm,
+        stream_csv=stream_csv,
+        checkpoint_dir=checkpoint_dir,
+        resume=resume and checkpoint_dir is not None,
+        overlap_once=overlap_once,
+        premask=premask,
+        passphrase=passphrase,
+        ephemeral_mapping=ephemeral_mapping,
+        verify=verify,
+        verify_llm=verify_llm,
+        risk=risk,
+        placeholder_order=placeholder_order,
+    )
+
+    try:
+        if jobs > 1 and len(file_paths) > 1:
+            _run_parallel(file_paths, job, seed_mapping, jobs, mapping_store)
+        else:
+            _run_sequential(file_paths, job, seed_mapping, mapping_store)
+    finally:
+        if mapping_store is not None:
+            mapping_store.close()
 
+
+def _run_sequential(
+    file_paths: List[Path],
+    job: _RunJob,
+    seed_mapping: Optional[Dict[str, str]],
+    mapping_store: Optional[MappingStore] = None,
+) -> None:
+    """Anonymize ``file_paths`` one by one, each seeding the next."""
     for i, file_path in enumerate(file_paths, 1):
         logging.info("=" * 40)
         logging.info(f"Processing file {i}/{len(file_paths)}: {file_path}")
-        entity_texts = None
         try:
-            if is_tabular_path(str(file_path)):
-                full_anonymized_text, final_mapping, entity_texts = (
-                    anonymize_tabular_file(
-                        file_path=str(file_path),
-                        characters_to_anonymize=config.chunk_size,
-                        prompt_template=prompt_template,
-                        model_name=config.model_name,
-                        anonymized_entities=entities_to_anonymize,
-                        chunk_overlap=config.chunk_overlap,
-                        regex_patterns=config.regex_patterns,
-                        max_retries=config.max_retries,
-                        base_retry_delay=config.base_retry_delay,
-                        max_retry_delay=config.max_retry_delay,
-                        operators=operator_map or None,
-                        fake_secret=fake_secret or os.getenv("ANONYMIZER_FAKE_SECRET"),
-                        seed_mapping=seed_mapping,
-                        keep_list=keep_phrases,
-                        deny_list=deny_phrases,
-                        use_llm=use_llm,
-                    )
-                )
-            else:
-                full_anonymized_text, final_mapping = anonymize_file(
-                    file_path=str(file_path),
-                    characters_to_anonymize=config.chunk_size,
-                    prompt_template=prompt_template,
-                    model_name=config.model_name,
-                    anonymized_entities=entities_to_anonymize,
-                    chunk_overlap=config.chunk_overlap,
-                    regex_patterns=config.regex_patterns,
-                    max_retries=config.max_retries,
-                    base_retry_delay=config.base_retry_delay,
-                    max_retry_delay=config.max_retry_delay,
-                    operators=operator_map or None,
-                    fake_secret=fake_secret or os.getenv("ANONYMIZER_FAKE_SECRET"),
-                    seed_mapping=seed_mapping,
-                    keep_list=keep_phrases,
-                    deny_list=deny_phrases,
-                    use_llm=use_llm,
-                )
+            final_mapping = _anonymize_one(
+                file_path, job, seed_mapping, mapping_store=mapping_store
+            )
         except ValueError as exc:
             logging.error("%s", exc)
             sys.exit(1)
-
-        if full_anonymized_text is not None and final_mapping is not None:
+        # A store already holds every earlier file's entries.
+        if final_mapping is not None and mapping_store is None:
             seed_mapping = final_mapping
-            # The mapping from anonymize_file is original -> placeholder.
-            # We will standardize on placeholder -> original for subsequent steps.
-            placeholder_to_original = {v: k for k, v in final_mapping.items()}
 
-            logging.info("Consolidating mapping...")
-            full_anonymized_text, consolidated_placeholder_map = consolidate_mapping(
-                full_anonymized_text, placeholder_to_original
-            )
 
-            anonymized_output_file, mapping_file = save_results(
-                full_anonymized_text,
-                consolidated_placeholder_map,
-                str(file_path),
-                mapping_passphrase=passphrase,
-                ephemeral_mapping=ephemeral_mapping,
-                entity_texts=entity_texts,
-                orig_to_written=final_mapping if is_tabular_path(str(file_path)) else None,
-            )
-            logging.info(f"Anonymization for {file_path} complete!")
-            logging.info(f"Anonymized text saved into '{anonymized_output_file}'")
-            if ephemeral_mapping or not mapping_file:
-                logging.info("Ephemeral mapping: vocabulary was not written to disk.")
-            elif mapping_file.endswith(".enc"):
-                logging.info(f"Encrypted mapping saved into '{mapping_file}'")
-            else:
-                logging.info(f"Mapping vocabulary saved into '{mapping_file}'")
+def _anonymize_in_worker(
+    file_path: Path, job: _RunJob, coordinator: MappingCoordinator, turn: int
+) -> Optional[Dict[str, str]]:
+    """``_anonymize_one`` in a pool process; always frees the file's turn."""
+    try:
+        return _anonymize_one(file_path, job, None, coordinator, turn)
+    finally:
+        coordinator.release(turn)
 
-            if verify or verify_llm:
-                report = verify_anonymized_text(
-                    full_anonymized_text,
-                    anonymized_file=anonymized_output_file,
-                    regex_patterns=config.regex_patterns,
-                    use_llm=verify_llm,
-                    model_name=config.model_name if verify_llm else None,
-                    max_retries=config.max_retries,
-                    base_retry_delay=config.base_retry_delay,
-                    max_retry_delay=config.max_retry_delay,
-                )
-                report_path = write_residual_report(report, anonymized_output_file)
-                logging.info(
-                    "Residual check: %s leftover hit(s). Report: %s",
-                    report["residual_count"],
-                    report_path,
-                )
 
-            if risk:
-                risk_report = assess_linkage_risk(full_anonymized_text)
-                risk_path = write_risk_report(risk_report, anonymized_output_file)
-                logging.info(
-                    "Linkage risk: %s (%s high / %s medium windows). Report: %s",
-                    risk_report["overall"],
-                    risk_report["high_count"],
-                    risk_report["medium_count"],
-                    risk_path,
-                )
+def _run_parallel(
+    file_paths: List[Path],
+    job: _RunJob,
+    seed_mapping: Optional[Dict[str, str]],
+    jobs: int,
+    mapping_store: Optional[MappingStore] = None,
+) -> None:
+    """Anonymize ``file_paths`` in ``jobs`` worker processes.
+
+    A ``MappingCoordinator`` in a manager process numbers the placeholders,
+    so each person keeps one placeholder across the whole batch. With an
+    ``offset`` / ``sorted`` placeholder order, numbering is taken in input
+    order and the output matches a sequential run.
+    """
+    workers = min(jobs, len(file_paths))
+    logging.info(f"Processing {len(file_paths)} file(s) in {workers} processes.")
+    manager, coordinator = start_coordinator(
+        seed_mapping,
+        operators=job.operators,
+        fake_secret=job.fake_secret,
+        ordered=job.placeholder_order != PlaceholderOrder.ARRIVAL,
+        mapping_store=mapping_store,
+    )
+    try:
+        # Spawned workers share no SQLite cache handles or locks with this
+        # process; each opens the configured cache in ``_init_worker``.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(job,),
+        ) as pool:
+            futures = {
+                pool.submit(_anonymize_in_worker, path, job, coordinator, turn): path
+                for turn, path in enumerate(file_paths)
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except ValueError as exc:
+                        logging.error("%s: %s", futures[future], exc)
+                        raise
+            except BaseException:
+                # Files waiting for their turn would otherwise wait forever.
+                coordinator.abort()
+                for pending in futures:
+                    pending.cancel()
+                raise
+    except ValueError:
+        sys.exit(1)
+    finally:
+        manager.shutdown()
 
 
 @app.command()
@@ -524,6 +936,16 @@ def deanonymize(
             ),
         ),
     ] = None,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help=(
+                "Restore a text file in buffered windows and write as it goes, "
+                "for anonymized files too large to hold in memory."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """
     Deanonymize a file using a mapping file.
@@ -535,6 +957,7 @@ def deanonymize(
             str(mapping_file),
             mapping_passphrase=resolve_mapping_passphrase(mapping_passphrase),
             expected_source_sha256=source_sha256,
+            stream=stream,
         )
     except ValueError as exc:
         logging.error("%s", exc)
@@ -544,6 +967,59 @@ def deanonymize(
     logging.info(f"Deanonymization statistics saved into '{stats_file}'")
 
 
+@app.command("import-mapping")
+def import_mapping(
+    mapping_files: Annotated[
+        List[Path],
+        typer.Argument(
+            help="JSON mapping files (plain or encrypted) to add to the store.",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+        ),
+    ],
+    store: Annotated[
+        Path,
+        typer.Option(
+            "--store",
+            help="Mapping store (SQLite) to create or extend.",
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ],
+    mapping_passphrase: Annotated[
+        Optional[str],
+        typer.Option(
+            "--mapping-passphrase",
+            help=(
+                "Opens encrypted mapping files and encrypts a new store. "
+                "Also read from ANONYMIZER_MAPPING_KEY."
+            ),
+        ),
+    ] = None,
+) -> None:
+    """Add JSON mapping files to a mapping store for --mapping-in."""
+    passphrase = resolve_mapping_passphrase(mapping_passphrase)
+    try:
+        mapping_store = SQLiteMappingStore(store, passphrase)
+    except ValueError as exc:
+        logging.error("%s", exc)
+        sys.exit(1)
+    try:
+        for mapping_file in mapping_files:
+            entries = load_seed_mapping(str(mapping_file), passphrase)
+            mapping_store.upsert(entries)
+            logging.info(f"Imported {len(entries)} entries from '{mapping_file}'")
+        logging.info(f"Mapping store '{store}' holds {len(mapping_store)} entries.")
+    except ValueError as exc:
+        logging.error("%s", exc)
+        sys.exit(1)
+    finally:
+        mapping_store.close()
+
+
 @app.command()
 def verify(
     anonymized_file: Annotated[
@@ -4,17 +4,31 @@ Contains:
 - Pydantic models used to validate LLM JSON responses (EntityModel, IdentificationResult).
 - classify_error(): decides which exceptions are worth retrying.
 - identify_entities_with_llm(): the main retrying wrapper that talks to providers.
+- aidentify_entities_with_llm(): the same wrapper for asyncio callers
+  (awaits LLMProvider.acall and backs off with asyncio.sleep).
+
+Both check the entity cache first (parsed entities keyed by model, prompt
+version and chunk text; see llm_cache) and store what they validate. They
+ask the provider for the model's maximum output (see model_limits), and a
+response cut off mid-JSON is retried as two halves of the chunk.
 """
 
+import asyncio
 import logging
 import random
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
-from pdf_anonymizer_core.conf import get_provider_and_model_name
-from pdf_anonymizer_core.llm_provider import get_provider
+from pdf_anonymizer_core.conf import (
+    MIN_TRUNCATION_SPLIT_CHARS,
+    get_provider_and_model_name,
+)
+from pdf_anonymizer_core.llm_cache import get_cached_entities, set_cached_entities
+from pdf_anonymizer_core.llm_provider import active_cache, get_provider
+from pdf_anonymizer_core.model_limits import limits_for_model
+from pdf_anonymizer_core.prompts import prompt_version_for
 
 
 # Pydantic models for structured output parsing
@@ -30,6 +44,14 @@ class IdentificationResult(BaseModel):
     entities: List[EntityModel]
 
 
+class LLMDetectionError(RuntimeError):
+    """Raised instead of returning ``[]`` when ``raise_on_failure`` is set."""
+
+
+class ResponseTruncatedError(ValueError):
+    """The response stopped before its JSON closed (output-token limit)."""
+
+
 def classify_error(exception: Exception) -> tuple[bool, str]:
     """
     Classify an exception to determine if it is retryable and get a descriptive label.
@@ -85,6 +107,146 @@ def classify_error(exception: Exception) -> tuple[bool, str]:
     return True, "GENERIC_ERROR"
 
 
+def _strip_fences(raw_text: str) -> str:
+    return raw_text.strip().replace("```json", "").replace("```", "").strip()
+
+
+def _is_cut_off(cleaned_response: str) -> bool:
+    return cleaned_response.startswith("{") and _json_is_open(cleaned_response)
+
+
+def _response_is_complete(raw_text: str) -> bool:
+    """False for a cut-off response, which must not be cached."""
+    return not _is_cut_off(_strip_fences(raw_text))
+
+
+def _parse_entities(raw_text: str) -> List[dict]:
+    """Strip markdown fences and validate the response with Pydantic."""
+    cleaned_response = _strip_fences(raw_text)
+
+    # Validate and parse response using Pydantic
+    try:
+        result = IdentificationResult.model_validate_json(cleaned_response)
+    except ValidationError:
+        if _is_cut_off(cleaned_response):
+            raise ResponseTruncatedError(
+                "Response was cut off before its JSON closed"
+            ) from None
+        raise
+
+    return [entity.model_dump() for entity in result.entities]
+
+
+def _json_is_open(text: str) -> bool:
+    """True when an object, array or string in ``text`` is never closed."""
+    depth = 0
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+    return in_string or depth > 0
+
+
+def _split_for_retry(text: str) -> Optional[Tuple[str, str]]:
+    """Two halves of ``text``, cut at the break nearest the middle.
+
+    Paragraph breaks are preferred over line breaks, then sentence ends,
+    then spaces, within the middle half of the text. None when the halves
+    would be shorter than ``conf.MIN_TRUNCATION_SPLIT_CHARS``.
+    """
+    if len(text) < 2 * MIN_TRUNCATION_SPLIT_CHARS:
+        return None
+    middle = len(text) // 2
+    low, high = len(text) // 4, 3 * len(text) // 4
+    for separator in ("\n\n", "\n", ". ", " "):
+        found = [
+            index
+            for index in (
+                text.rfind(separator, low, middle),
+                text.find(separator, middle, high),
+            )
+            if index >= 0
+        ]
+        if found:
+            cut = min(found, key=lambda index: abs(index - middle)) + len(separator)
+            return text[:cut], text[cut:]
+    return text[:middle], text[middle:]
+
+
+def _halves_after(exception: Exception, text: str) -> Optional[Tuple[str, str]]:
+    """Halves to retry when ``exception`` is a cut-off response."""
+    if not isinstance(exception, ResponseTruncatedError):
+        return None
+    halves = _split_for_retry(text)
+    if halves is not None:
+        logging.warning(
+            f"Response for a {len(text):,}-character chunk was cut off; "
+            "retrying it as two halves."
+        )
+    return halves
+
+
+def _entities_from_cache(
+    text: str, model_name: str, prompt_version: str
+) -> Optional[List[dict]]:
+    cache = active_cache()
+    if cache is None:
+        return None
+    entities = get_cached_entities(cache, model_name, prompt_version, text)
+    if entities is not None:
+        logging.info(f"Entity cache hit for model '{model_name}'")
+    return entities
+
+
+def _store_entities(
+    text: str, model_name: str, prompt_version: str, entities: List[dict]
+) -> List[dict]:
+    cache = active_cache()
+    if cache is not None:
+        set_cached_entities(cache, model_name, prompt_version, text, entities)
+    return entities
+
+
+def _retry_delay_or_none(
+    exception: Exception,
+    attempt: int,
+    max_retries: int,
+    base_retry_delay: float,
+    max_retry_delay: float,
+) -> Optional[float]:
+    """Log a failed attempt; return the backoff delay, or None to give up."""
+    is_retryable, category = classify_error(exception)
+    logging.error(
+        f"Attempt {attempt + 1} failed with error category '{category}': {exception}"
+    )
+
+    if not is_retryable or attempt + 1 == max_retries:
+        if attempt + 1 == max_retries:
+            logging.error("Max retries reached. Returning empty list.")
+        else:
+            logging.error(f"Fatal error category '{category}'. Stopping retries.")
+        return None
+
+    # Exponential backoff with jitter
+    backoff = min(base_retry_delay * (2**attempt), max_retry_delay)
+    jitter = random.uniform(0, 0.1 * backoff)
+    sleep_time = backoff + jitter
+
+    logging.info(f"Retrying in {sleep_time:.2f} seconds...")
+    return sleep_time
+
+
 def identify_entities_with_llm(
     text: str,
     prompt_template: str,
@@ -92,6 +254,8 @@ def identify_entities_with_llm(
     max_retries: int = 3,
     base_retry_delay: float = 1.0,
     max_retry_delay: float = 10.0,
+    prompt_version: Optional[str] = None,
+    raise_on_failure: bool = False,
 ) -> List[dict]:
     """Call an LLM (via the configured provider) to extract PII entities from one chunk.
 
@@ -103,6 +267,14 @@ def identify_entities_with_llm(
     The response is cleaned of markdown fences and validated with Pydantic
     before returning a list of plain dicts.
 
+    The provider is asked for at most the model's ``max_output_tokens``
+    (see ``model_limits``). A response cut off mid-JSON
+    (``ResponseTruncatedError``) is kept out of the response cache and not
+    retried as is: the chunk is split in two at a paragraph, line, sentence
+    or word break and each half is detected on its own, down to halves of
+    ``conf.MIN_TRUNCATION_SPLIT_CHARS``. The halves' entities are cached
+    under the whole chunk only when both halves were answered.
+
     Args:
         text: The chunk of text to analyze.
         prompt_template: Prompt containing a {text} placeholder.
@@ -110,11 +282,26 @@ def identify_entities_with_llm(
         max_retries: Maximum number of attempts.
         base_retry_delay: Starting backoff delay (seconds).
         max_retry_delay: Upper bound on backoff delay (seconds).
+        prompt_version: Entity-cache version of ``prompt_template``. Defaults
+            to ``prompts.prompt_version_for(prompt_template)``.
+        raise_on_failure: Raise ``LLMDetectionError`` instead of returning
+            [] when the call gives up, so callers that checkpoint results can
+            tell "no entities" from "no answer".
 
     Returns:
         List of entity dicts (each with "text", "type", and optionally "base_form").
-        Returns [] on unrecoverable failure after retries.
+        Without ``raise_on_failure``, a call that gives up returns [], and a
+        split chunk returns the entities of the halves that were answered.
+
+    Raises:
+        LLMDetectionError: With ``raise_on_failure``, when the call (or
+            either half of a split chunk) gives up: retries are used up or
+            the error is not retryable.
     """
+    version = prompt_version or prompt_version_for(prompt_template)
+    cached = _entities_from_cache(text, model_name, version)
+    if cached is not None:
+        return cached
     prompt = prompt_template.format(text=text)
 
     for attempt in range(max_retries):
@@ -124,38 +311,130 @@ def identify_entities_with_llm(
             )
             provider_name, actual_model_name = get_provider_and_model_name(model_name)
             provider = get_provider(provider_name)
-            raw_text = provider.call(prompt, actual_model_name)
+            limits = limits_for_model(provider_name, actual_model_name)
+            raw_text = provider.call(
+                prompt,
+                actual_model_name,
+                max_output_tokens=limits.max_output_tokens,
+                cacheable=_response_is_complete,
+            )
+            return _store_entities(text, model_name, version, _parse_entities(raw_text))
 
-            cleaned_response = (
-                raw_text.strip().replace("```json", "").replace("```", "").strip()
+        except Exception as e:
+            halves = _halves_after(e, text)
+            if halves is not None:
+                entities: List[dict] = []
+                complete = True
+                for half in halves:
+                    try:
+                        entities.extend(
+                            identify_entities_with_llm(
+                                half,
+                                prompt_template,
+                                model_name,
+                                max_retries=max_retries,
+                                base_retry_delay=base_retry_delay,
+                                max_retry_delay=max_retry_delay,
+                                prompt_version=version,
+                                raise_on_failure=True,
+                            )
+                        )
+                    except LLMDetectionError:
+                        if raise_on_failure:
+                            raise
+                        complete = False
+                if not complete:
+                    return entities
+                return _store_entities(text, model_name, version, entities)
+            sleep_time = _retry_delay_or_none(
+                e, attempt, max_retries, base_retry_delay, max_retry_delay
             )
+            if sleep_time is None:
+                if raise_on_failure:
+                    raise LLMDetectionError(f"'{model_name}' gave no answer") from e
+                return []
+            time.sleep(sleep_time)
 
-            # Validate and parse response using Pydantic
-            result = IdentificationResult.model_validate_json(cleaned_response)
+    if raise_on_failure:
+        raise LLMDetectionError(f"'{model_name}' gave no answer")
+    return []
 
-            return [entity.model_dump() for entity in result.entities]
 
-        except Exception as e:
-            is_retryable, category = classify_error(e)
-            logging.error(
-                f"Attempt {attempt + 1} failed with error category '{category}': {e}"
-            )
+async def aidentify_entities_with_llm(
+    text: str,
+    prompt_template: str,
+    model_name: str,
+    max_retries: int = 3,
+    base_retry_delay: float = 1.0,
+    max_retry_delay: float = 10.0,
+    prompt_version: Optional[str] = None,
+    raise_on_failure: bool = False,
+) -> List[dict]:
+    """Async twin of :func:`identify_entities_with_llm`.
 
-            if not is_retryable or attempt + 1 == max_retries:
-                if attempt + 1 == max_retries:
-                    logging.error("Max retries reached. Returning empty list.")
-                else:
-                    logging.error(
-                        f"Fatal error category '{category}'. Stopping retries."
-                    )
-                return []
+    Same retry policy, truncation splitting, parsing, return value and
+    ``LLMDetectionError`` under ``raise_on_failure``. The provider is awaited
+    through ``LLMProvider.acall`` and backoff uses ``asyncio.sleep`` so the
+    event loop keeps serving other requests while this chunk waits.
+    """
+    version = prompt_version or prompt_version_for(prompt_template)
+    cached = _entities_from_cache(text, model_name, version)
+    if cached is not None:
+        return cached
+    prompt = prompt_template.format(text=text)
 
-            # Exponential backoff with jitter
-            backoff = min(base_retry_delay * (2**attempt), max_retry_delay)
-            jitter = random.uniform(0, 0.1 * backoff)
-            sleep_time = backoff + jitter
+    for attempt in range(max_retries):
+        try:
+            logging.info(
+                f"Calling '{model_name}' (async): text: {len(text):,}, "
+                f"attempt {attempt + 1}"
+            )
+            provider_name, actual_model_name = get_provider_and_model_name(model_name)
+            provider = get_provider(provider_name)
+            limits = limits_for_model(provider_name, actual_model_name)
+            raw_text = await provider.acall(
+                prompt,
+                actual_model_name,
+                max_output_tokens=limits.max_output_tokens,
+                cacheable=_response_is_complete,
+            )
+            return _store_entities(text, model_name, version, _parse_entities(raw_text))
 
-            logging.info(f"Retrying in {sleep_time:.2f} seconds...")
-            time.sleep(sleep_time)
+        except Exception as e:
+            halves = _halves_after(e, text)
+            if halves is not None:
+                entities: List[dict] = []
+                complete = True
+                for half in halves:
+                    try:
+                        entities.extend(
+                            await aidentify_entities_with_llm(
+                                half,
+                                prompt_template,
+                                model_name,
+                                max_retries=max_retries,
+                                base_retry_delay=base_retry_delay,
+                                max_retry_delay=max_retry_delay,
+                                prompt_version=version,
+                                raise_on_failure=True,
+                            )
+                        )
+                    except LLMDetectionError:
+                        if raise_on_failure:
+                            raise
+                        complete = False
+                if not complete:
+                    return entities
+                return _store_entities(text, model_name, version, entities)
+            sleep_time = _retry_delay_or_none(
+                e, attempt, max_retries, base_retry_delay, max_retry_delay
+            )
+            if sleep_time is None:
+                if raise_on_failure:
+                    raise LLMDetectionError(f"'{model_name}' gave no answer") from e
+                return []
+            await asyncio.sleep(sleep_time)
 
+    if raise_on_failure:
+        raise LLMDetectionError(f"'{model_name}' gave no answer")
     return []
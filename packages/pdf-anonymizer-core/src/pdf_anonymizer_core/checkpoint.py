@@ -0,0 +1,208 @@
+"""Per-chunk checkpoint journal for resumable ``anonymize_file`` runs.
+
+A journal is a JSON-lines file under ``data/checkpoints/``. Its name is
+derived from the source file's SHA-256 and the settings that change
+detection (chunking, model, prompt version, regex set, LLM on/off,
+pre-masking), so a rerun with the same inputs finds it and a rerun with
+different ones does not. The first line is a header; every later line is
+one finished chunk::
+
+    {"chunk": 17, "sha256": "<chunk text digest>", "regex": [...], "llm": [...]}
+
+Lines are appended and flushed as chunks complete, so a crash loses at most
+the chunks that were still in flight. A torn last line is ignored on load.
+Entries whose chunk digest no longer matches are recomputed.
+
+Journals hold detected entity texts, i.e. the PII itself. They are written
+``0600`` in a ``0700`` directory and deleted when the file finishes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from pdf_anonymizer_core.mapping_crypto import sha256_file
+from pdf_anonymizer_core.prompts import prompt_version_for
+from pdf_anonymizer_core.secure_io import PRIVATE_FILE_MODE, ensure_private_dir
+
+JOURNAL_VERSION = 1
+
+ChunkResult = Tuple[List[dict], List[dict]]
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def checkpoint_config(
+    *,
+    characters_to_anonymize: int,
+    chunk_overlap: int,
+    prompt_template: str,
+    model_name: str,
+    regex_patterns: Dict[str, str],
+    use_llm: bool,
+    premask: bool = False,
+) -> dict:
+    """Settings that change per-chunk results, in journal-key form."""
+    regex_digest = _text_digest(json.dumps(regex_patterns, sort_keys=True))
+    return {
+        "characters_to_anonymize": characters_to_anonymize,
+        "chunk_overlap": chunk_overlap,
+        "model_name": model_name if use_llm else "",
+        "prompt_version": prompt_version_for(prompt_template) if use_llm else "",
+        "regex_patterns": regex_digest,
+        "use_llm": use_llm,
+        "premask": premask and use_llm,
+    }
+
+
+class ChunkJournal:
+    """Append-only record of finished chunks for one source + config.
+
+    ``open`` loads earlier entries when ``resume`` is true and starts a
+    fresh journal otherwise. ``result`` returns a stored chunk when its text
+    still matches; ``record`` appends one and is safe to call from the
+    ``max_concurrency`` worker threads.
+    """
+
+    def __init__(self, path: Path, header: dict, entries: Dict[int, dict]):
+        self.path = path
+        self.header = header
+        self._entries = entries
+        self._lock = threading.Lock()
+        self._handle = None
+        # Indexes of chunks whose LLM call gave up; they are not recorded.
+        self.skipped: Set[int] = set()
+
+    @classmethod
+    def open(
+        cls,
+        source_path: str,
+        config: dict,
+        *,
+        directory: str,
+        resume: bool = False,
+    ) -> "ChunkJournal":
+        source_sha256 = sha256_file(source_path)
+        key = _text_digest(
+            json.dumps({"source": source_sha256, "config": config}, sort_keys=True)
+        )[:24]
+        path = Path(directory) / f"{Path(source_path).stem}.{key}.jsonl"
+        header = {
+            "version": JOURNAL_VERSION,
+            "source_sha256": source_sha256,
+            "config": config,
+        }
+        entries: Dict[int, dict] = {}
+        if resume and path.is_file():
+            entries = cls._load(path, header)
+        journal = cls(path, header, entries)
+        journal._start(append=bool(entries))
+        if entries:
+            logging.info(
+                f"Resuming from checkpoint {path}: {len(entries)} chunk(s) done."
+            )
+        return journal
+
+    @staticmethod
+    def _load(path: Path, header: dict) -> Dict[int, dict]:
+        entries: Dict[int, dict] = {}
+        with open(path, "r", encoding="utf-8") as handle:
+            first = handle.readline()
+            try:
+                stored = json.loads(first)
+            except json.JSONDecodeError:
+                return entries
+            if stored != header:
+                return entries
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves a torn last line.
+                    continue
+                if isinstance(entry, dict) and isinstance(entry.get("chunk"), int):
+                    entries[entry["chunk"]] = entry
+        return entries
+
+    def _start(self, *, append: bool) -> None:
+        ensure_private_dir(self.path.parent)
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+        fd = os.open(self.path, flags, PRIVATE_FILE_MODE)
+        try:
+            os.fchmod(fd, PRIVATE_FILE_MODE)
+        except OSError:
+            pass
+        self._handle = os.fdopen(fd, "a" if append else "w", encoding="utf-8")
+        if not append:
+            self._write_line(self.header)
+        elif self._needs_newline():
+            self._handle.write("\n")
+
+    def _needs_newline(self) -> bool:
+        with open(self.path, "rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            if handle.tell() == 0:
+                return False
+            handle.seek(-1, os.SEEK_END)
+            return handle.read(1) != b"\n"
+
+    def _write_line(self, payload: dict) -> None:
+        if self._handle is None:
+            raise RuntimeError(f"Checkpoint journal {self.path} is closed.")
+        self._handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        self._handle.flush()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def result(self, index: int, chunk_text: str) -> Optional[ChunkResult]:
+        """Stored ``(regex_hits, llm_hits)`` for chunk ``index``, if still valid."""
+        entry = self._entries.get(index)
+        if entry is None or entry.get("sha256") != _text_digest(chunk_text):
+            return None
+        return list(entry.get("regex") or []), list(entry.get("llm") or [])
+
+    def record(
+        self,
+        index: int,
+        chunk_text: str,
+        regex_entities: List[dict],
+        llm_entities: List[dict],
+    ) -> None:
+        entry = {
+            "chunk": index,
+            "sha256": _text_digest(chunk_text),
+            "regex": regex_entities,
+            "llm": llm_entities,
+        }
+        with self._lock:
+            self._entries[index] = entry
+            if self._handle is not None:
+                self._write_line(entry)
+
+    def skip(self, index: int) -> None:
+        """Note that chunk ``index`` finished without an LLM answer."""
+        with self._lock:
+            self.skipped.add(index)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def discard(self) -> None:
+        """Close and delete the journal once the file is done."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -20,18 +20,51 @@ DEFAULT_CHARACTERS_TO_ANONYMIZE: int = 100000
 DEFAULT_PROMPT_NAME: str = "detailed"
 DEFAULT_MODEL_NAME: str = "gemini-2.5-flash"
 DEFAULT_CHUNK_OVERLAP: int = 1000
-
-# In-memory caps for CSV / Excel. Spreadsheets are not streamed.
+# With overlap_once: characters around each chunk cut that are sent to the
+# LLM a second time, instead of the whole overlap. An entity split by a cut
+# is still seen whole if it is shorter than about half of this.
+DEFAULT_BOUNDARY_WINDOW: int = 200
+
+# Token-budget chunk sizing (model_limits.token_budget_chunk_size).
+# Expected characters of JSON entity list per input character, the share of
+# each token limit actually used, and the smallest chunk it will pick.
+TOKEN_BUDGET_OUTPUT_RATIO: float = 0.25
+TOKEN_BUDGET_SAFETY: float = 0.8
+MIN_TOKEN_BUDGET_CHUNK: int = 2_000
+# A chunk whose response is cut off is split in two and retried, down to
+# chunks of this many characters.
+MIN_TRUNCATION_SPLIT_CHARS: int = 500
+# Chunks in flight at once against the LLM. 1 keeps the sequential path.
+DEFAULT_MAX_CONCURRENCY: int = 1
+# Processes converting PDF pages to Markdown. 1 converts in-process.
+DEFAULT_EXTRACT_WORKERS: int = 1
+
+# In-memory caps for CSV / Excel. Only core.anonymize_csv_stream
+# (--stream-csv) reads past them.
 MAX_TABLE_BYTES: int = 50 * 1024 * 1024
 MAX_TABLE_CELLS: int = 500_000
+# Rows held in memory per pass-one step of streaming CSV mode.
+CSV_STREAM_ROWS_PER_BATCH: int = 5_000
+
+# Streaming extraction (load_and_extract.iter_text_chunks): PDF pages
+# converted per step, and characters read per step from text files.
+EXTRACT_PAGES_PER_BATCH: int = 8
+TEXT_READ_BLOCK_CHARS: int = 1 << 20
 
 # Directories and file paths
 DEFAULT_ANONYMIZED_DIR: str = "data/anonymized"
 DEFAULT_MAPPINGS_DIR: str = "data/mappings"
 DEFAULT_DEANONYMIZED_DIR: str = "data/deanonymized"
 DEFAULT_STATS_DIR: str = "data/stats"
+# Per-chunk journals for resumable runs (checkpoint.ChunkJournal).
+DEFAULT_CHECKPOINT_DIR: str = "data/checkpoints"
 DEFAULT_CACHE_DIR: str = "data/cache"
-DEFAULT_CACHE_FILE: str = "llm_responses.json"
+DEFAULT_CACHE_FILE: str = "llm_responses.sqlite3"
+# Older JSON cache; imported into the SQLite cache on first use.
+LEGACY_CACHE_FILE: str = "llm_responses.json"
+# LRU / expiry limits for the SQLite LLM cache (None disables a limit).
+DEFAULT_CACHE_MAX_BYTES: Optional[int] = 512 * 1024 * 1024
+DEFAULT_CACHE_MAX_AGE_SECONDS: Optional[float] = 90 * 24 * 3600.0
 DEFAULT_LOG_FILE: str = "app.log"
 
 # Default Regex Patterns for first-stage NER (hybrid pipeline)
@@ -316,6 +349,19 @@ class EntityProfile(str, Enum):
     HIPAA_SAFE_HARBOR = "hipaa-safe-harbor"
 
 
+class PlaceholderOrder(str, Enum):
+    """How new entities are numbered (PERSON_1, PERSON_2, ...).
+
+    ``arrival`` follows detection order. ``offset`` follows the first
+    occurrence in the document and ``sorted`` the entity type and text, so
+    both give the same numbers however detection was split or scheduled.
+    """
+
+    ARRIVAL = "arrival"
+    OFFSET = "offset"
+    SORTED = "sorted"
+
+
 # Types and prefixes this profile tries to hide. Prefixes match
 # DRIVERS_LICENSE_US, DATE_ISO, etc. This is an aid, not a compliance certificate.
 HIPAA_SAFE_HARBOR_TYPES: List[str] = [
@@ -426,6 +472,8 @@ class AppConfig(BaseModel):
     enable_cache: bool = True
     cache_dir: str = DEFAULT_CACHE_DIR
     cache_file: str = DEFAULT_CACHE_FILE
+    cache_max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES
+    cache_max_age_seconds: Optional[float] = DEFAULT_CACHE_MAX_AGE_SECONDS
     anonymized_dir: str = DEFAULT_ANONYMIZED_DIR
     mappings_dir: str = DEFAULT_MAPPINGS_DIR
     deanonymized_dir: str = DEFAULT_DEANONYMIZED_DIR
@@ -435,6 +483,8 @@ class AppConfig(BaseModel):
         default_factory=lambda: dict(DEFAULT_REGEX_PATTERNS)
     )
     use_llm: bool = True
+    max_concurrency: int = Field(default=DEFAULT_MAX_CONCURRENCY, ge=1)
+    extract_workers: int = Field(default=DEFAULT_EXTRACT_WORKERS, ge=1)
 
 
 def get_config_for_profile(
@@ -444,6 +494,8 @@ def get_config_for_profile(
     chunk_size: Optional[int] = None,
     chunk_overlap: Optional[int] = None,
     countries: Optional[Iterable[str]] = None,
+    max_concurrency: Optional[int] = None,
+    extract_workers: Optional[int] = None,
 ) -> AppConfig:
     """Return an AppConfig populated from one of the built-in profiles.
 
@@ -463,6 +515,10 @@ def get_config_for_profile(
         chunk_overlap: Optional override for chunk overlap.
         countries: Optional ISO-2 codes that limit national-ID regexes
             (universal patterns always stay).
+        max_concurrency: Optional number of chunks sent to the LLM at once.
+            Defaults to DEFAULT_MAX_CONCURRENCY (sequential).
+        extract_workers: Optional number of processes for PDF page
+            conversion. Defaults to DEFAULT_EXTRACT_WORKERS (in-process).
 
     Returns:
         A fully populated AppConfig instance ready to drive anonymize_file
@@ -489,6 +545,12 @@ def get_config_for_profile(
         regex_patterns=filter_regex_patterns(countries),
         use_llm=profile_defaults.get("use_llm", True),
         enable_cache=profile_defaults.get("enable_cache", True),
+        max_concurrency=max_concurrency
+        if max_concurrency is not None
+        else DEFAULT_MAX_CONCURRENCY,
+        extract_workers=extract_workers
+        if extract_workers is not None
+        else DEFAULT_EXTRACT_WORKERS,
     )
 
 
@@ -0,0 +1,169 @@
+"""Shared placeholder numbering for files anonymized in parallel.
+
+Sequential runs pass each file's mapping to the next one as
+``seed_mapping``, so "John Smith" stays ``PERSON_1`` across a folder. Worker
+processes cannot do that: they run at the same time. A
+:class:`MappingCoordinator` owns the growing original → placeholder map
+instead. Workers detect entities on their own and send the finalized list
+to ``assign``, which merges base forms against everything seen so far and
+numbers the new ones under a lock, so two files never get the same
+``PERSON_n`` for different people, or different numbers for the same one.
+
+Only entity lists and the file's own mapping entries cross the process
+boundary; extraction, detection and replacement stay in the workers.
+:func:`start_coordinator` runs the coordinator in a
+``multiprocessing.managers`` server process and returns a proxy that can be
+passed to ``anonymize_file(coordinator=...)`` in any worker.
+
+By default numbers follow the order in which files finish detection, so
+they can differ between two runs over the same folder. With ``ordered=True``
+each file passes its position in the input list (``turn``) and ``assign``
+waits until every earlier file has been assigned or released; numbering
+then matches a sequential run exactly, and so does the returned mapping,
+which is the whole map so far. Detection still runs in parallel; only the
+short numbering step is taken in file order.
+
+With a ``mapping_store`` the store holds the map instead (see
+``core.build_mapping_with_store``); ``assign`` then always returns the
+file's own entries, as a sequential run with the same store does.
+"""
+
+from __future__ import annotations
+
+import threading
+from multiprocessing.managers import BaseManager
+from typing import Dict, List, Optional, Set, Tuple
+
+from pdf_anonymizer_core.core import (
+    build_mapping,
+    build_mapping_with_store,
+    entries_for_entities,
+    merge_base_forms,
+)
+from pdf_anonymizer_core.mapping_store import MappingStore
+
+
+class MappingCoordinator:
+    """Original → written map shared by every file of a run."""
+
+    def __init__(
+        self,
+        seed_mapping: Optional[Dict[str, str]] = None,
+        *,
+        operators: Optional[Dict[str, str]] = None,
+        fake_secret: Optional[str] = None,
+        ordered: bool = False,
+        mapping_store: Optional[MappingStore] = None,
+    ) -> None:
+        self._mapping: Dict[str, str] = dict(seed_mapping or {})
+        self._store = mapping_store
+        self._operators = operators
+        self._fake_secret = fake_secret
+        self._ordered = ordered
+        self._lock = threading.Condition()
+        self._next_turn = 0
+        self._finished: Set[int] = set()
+        self._aborted = False
+
+    def assign(
+        self, entities: List[dict], turn: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Placeholders for one file's finalized entities.
+
+        ``entities`` are ``finalize_entities(..., merge_forms=False)``
+        results in numbering order. Their base forms are merged against the
+        shared map first. An ordered coordinator needs the file's ``turn``.
+
+        Returns:
+            The whole map so far when ordered without a store; otherwise
+            the entries for these entities' texts and base forms only.
+
+        Raises:
+            ValueError: When ``turn`` is missing on an ordered coordinator,
+                or the run was aborted while waiting.
+        """
+        with self._lock:
+            if self._ordered:
+                if turn is None:
+                    raise ValueError("An ordered coordinator needs the file's turn.")
+                self._lock.wait_for(lambda: self._aborted or self._next_turn >= turn)
+                if self._aborted:
+                    raise ValueError("Run aborted before this file was numbered.")
+            if self._store is not None:
+                own = build_mapping_with_store(
+                    entities,
+                    self._store,
+                    seed_mapping=self._mapping,
+                    operators=self._operators,
+                    fake_secret=self._fake_secret,
+                )
+                self._finish(turn)
+                return own
+            merge_base_forms(entities, self._mapping)
+            self._mapping = build_mapping(
+                entities,
+                seed_mapping=self._mapping,
+                operators=self._operators,
+                fake_secret=self._fake_secret,
+            )
+            self._finish(turn)
+            if self._ordered:
+                return dict(self._mapping)
+            return entries_for_entities(self._mapping, entities)
+
+    def _finish(self, turn: Optional[int]) -> None:
+        if turn is None or turn in self._finished:
+            return
+        self._finished.add(turn)
+        while self._next_turn in self._finished:
+            self._next_turn += 1
+        self._lock.notify_all()
+
+    def release(self, turn: int) -> None:
+        """Let later files go ahead without ``turn`` (failed, no text, done)."""
+        with self._lock:
+            self._finish(turn)
+
+    def abort(self) -> None:
+        """Wake every waiting ``assign`` with a ``ValueError``."""
+        with self._lock:
+            self._aborted = True
+            self._lock.notify_all()
+
+    def snapshot(self) -> Dict[str, str]:
+        """Copy of the whole map so far."""
+        with self._lock:
+            return dict(self._mapping)
+
+
+class CoordinatorManager(BaseManager):
+    """Manager whose server process holds one :class:`MappingCoordinator`."""
+
+
+CoordinatorManager.register("MappingCoordinator", MappingCoordinator)
+
+
+def start_coordinator(
+    seed_mapping: Optional[Dict[str, str]] = None,
+    *,
+    operators: Optional[Dict[str, str]] = None,
+    fake_secret: Optional[str] = None,
+    ordered: bool = False,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[CoordinatorManager, MappingCoordinator]:
+    """Start a manager process and create the run's coordinator in it.
+
+    Returns ``(manager, proxy)``. The proxy pickles into worker processes;
+    call ``manager.shutdown()`` when the run is over. A ``mapping_store``
+    is pickled into the manager process and reopened there.
+    """
+    manager = CoordinatorManager()
+    manager.start()
+    proxy = manager.MappingCoordinator(  # type: ignore[attr-defined]
+        seed_mapping,
+        operators=operators,
+        fake_secret=fake_secret,
+        ordered=ordered,
+        mapping_store=mapping_store,
+    )
+    return manager, proxy
@@ -13,22 +13,45 @@ VAT/business numbers etc. for 30+ jurisdictions (see conf.DEFAULT_REGEX_PATTERNS
 and regex_ner docs for the full partitioned list).
 """
 
+import asyncio
 import logging
 import os
 import time
-from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from pdf_anonymizer_core.call_llm import identify_entities_with_llm
-from pdf_anonymizer_core.conf import DEFAULT_CHUNK_OVERLAP, DEFAULT_REGEX_PATTERNS
-from pdf_anonymizer_core.load_and_extract import load_and_extract_text_from_file
+from pdf_anonymizer_core.call_llm import (
+    LLMDetectionError,
+    aidentify_entities_with_llm,
+    identify_entities_with_llm,
+)
+from pdf_anonymizer_core.checkpoint import ChunkJournal, checkpoint_config
+from pdf_anonymizer_core.conf import (
+    CSV_STREAM_ROWS_PER_BATCH,
+    DEFAULT_CHECKPOINT_DIR,
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_REGEX_PATTERNS,
+    PlaceholderOrder,
+)
+from pdf_anonymizer_core.load_and_extract import (
+    boundary_chunks,
+    load_and_extract_text_from_file,
+)
 from pdf_anonymizer_core.gazetteers import apply_deny_list, apply_keep_list
+from pdf_anonymizer_core.mapping_store import MappingStore, PlaceholderCounts
 from pdf_anonymizer_core.operators import apply_operator, operator_for_type
-from pdf_anonymizer_core.regex_ner import extract_entities_via_regex
-from pdf_anonymizer_core.spans import locate_spans, replace_entities
+from pdf_anonymizer_core.premask import PremaskedChunk, premask_chunk
+from pdf_anonymizer_core.regex_ner import (
+    extract_entities_via_regex,
+    get_regex_scanner,
+)
+from pdf_anonymizer_core.spans import SpanLocator, replace_entities
 from pdf_anonymizer_core.tables import (
     REGEX_CELL_KINDS,
+    CellTextIndex,
     TableCell,
     TableDocument,
     TableSheet,
@@ -39,12 +62,18 @@ from pdf_anonymizer_core.tables import (
     is_rejected_spreadsheet,
     is_tabular_path,
     iter_cells,
+    iter_csv_row_batches,
     load_table,
     rejected_spreadsheet_error,
+    rewrite_csv,
+    sniff_csv,
 )
 from pdf_anonymizer_core.utils import seed_placeholder_state
 from pdf_anonymizer_core.validators import LIKE_SUFFIX, parent_type, type_matches_filter
 
+if TYPE_CHECKING:
+    from pdf_anonymizer_core.coordinator import MappingCoordinator
+
 _TYPE_PRIORITY = {
     "CREDIT_CARD": 15,
     "IBAN": 14,
@@ -101,6 +130,103 @@ def _type_priority(ent_type: str) -> int:
     return _TYPE_PRIORITY.get(upper, 0)
 
 
+def _detect_in_chunk(
+    text_page: str,
+    label: str,
+    *,
+    prompt_template: str,
+    model_name: str,
+    regex_patterns: Dict[str, str],
+    max_retries: int,
+    base_retry_delay: float,
+    max_retry_delay: float,
+    use_llm: bool,
+    raise_on_failure: bool = False,
+    premask: bool = False,
+) -> Tuple[List[dict], List[dict]]:
+    """Regex then optional LLM for one chunk. Returns (regex_hits, llm_hits)."""
+    logging.info(f"Identifying entities in part {label}...")
+    start_time = time.time()
+
+    regex_entities = extract_entities_via_regex(text_page, regex_patterns)
+
+    if use_llm:
+        masked = _premasked(text_page, regex_entities, label) if premask else None
+        llm_entities = identify_entities_with_llm(
+            masked.text if masked is not None else text_page,
+            prompt_template,
+            model_name,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            raise_on_failure=raise_on_failure,
+        )
+        if masked is not None:
+            llm_entities = masked.restore(llm_entities)
+    else:
+        llm_entities = []
+
+    end_time = time.time()
+    duration = end_time - start_time
+    minutes = int(duration // 60)
+    seconds = int(duration % 60)
+    stage = "Regex + LLM" if use_llm else "Regex only"
+    logging.info(
+        f"   NER stage duration ({stage}, part {label}): {minutes}:{seconds:02d}"
+    )
+    logging.info(
+        f"   Found {len(regex_entities)} via Regex, {len(llm_entities)} via LLM."
+    )
+    return regex_entities, llm_entities
+
+
+def _premasked(
+    text_page: str, regex_entities: List[dict], label: str
+) -> Optional[PremaskedChunk]:
+    masked = premask_chunk(text_page, regex_entities)
+    if masked is not None:
+        logging.info(
+            f"   Part {label}: {len(masked.originals)} regex value(s) masked; "
+            f"sending {len(masked.text):,} of {len(text_page):,} characters."
+        )
+    return masked
+
+
+def _restored_chunk(
+    journal: Optional[ChunkJournal], index: int, text_page: str, label: str
+) -> Optional[Tuple[List[dict], List[dict]]]:
+    if journal is None:
+        return None
+    stored = journal.result(index, text_page)
+    if stored is not None:
+        logging.info(f"Part {label} restored from checkpoint.")
+    return stored
+
+
+def _unanswered_chunk(
+    journal: ChunkJournal, index: int, label: str, regex_entities: List[dict]
+) -> Tuple[List[dict], List[dict]]:
+    logging.warning(
+        f"Part {label}: the language model gave no answer. "
+        "It is not checkpointed; --resume will retry it."
+    )
+    journal.skip(index)
+    return regex_entities, []
+
+
+def _unique_chunks(chunks: List[str]) -> List[Tuple[int, str]]:
+    """(index, text) of each chunk's first occurrence, in chunk order."""
+    first_of: Dict[str, int] = {}
+    for i, text_page in enumerate(chunks):
+        first_of.setdefault(text_page, i)
+    if len(first_of) < len(chunks):
+        logging.info(
+            f"Skipping {len(chunks) - len(first_of)} chunk(s) identical to "
+            "an earlier one."
+        )
+    return [(i, text_page) for text_page, i in first_of.items()]
+
+
 def collect_entities_from_chunks(
     chunks: List[str],
     *,
@@ -111,8 +237,25 @@ def collect_entities_from_chunks(
     base_retry_delay: float,
     max_retry_delay: float,
     use_llm: bool,
+    max_concurrency: int = 1,
+    journal: Optional[ChunkJournal] = None,
+    premask: bool = False,
 ) -> List[dict]:
-    """Per chunk: extract_entities_via_regex then optional identify_entities_with_llm."""
+    """Per chunk: extract_entities_via_regex then optional identify_entities_with_llm.
+
+    With ``max_concurrency > 1`` (and the LLM on) up to that many chunks are
+    in flight at once on a thread pool. Results are still collected in chunk
+    order, so the mapping matches the sequential run.
+
+    With a ``journal``, chunks it already holds are not detected again and
+    every newly finished chunk is recorded as it completes.
+
+    Byte-identical chunks (repeated headers, disclaimers, signature blocks)
+    are detected once; their entities would only be deduplicated later.
+
+    With ``premask`` the chunk's regex hits are swapped for typed tokens in
+    the text sent to the LLM (see :mod:`pdf_anonymizer_core.premask`).
+    """
     collected_entities: List[dict] = []
 
     if not use_llm:
@@ -121,37 +264,133 @@ def collect_entities_from_chunks(
             "Names and identity clues will be missed."
         )
 
-    for i, text_page in enumerate(chunks):
-        logging.info(f"Identifying entities in part {i + 1}/{len(chunks)}...")
-        start_time = time.time()
-
-        regex_entities = extract_entities_via_regex(text_page, regex_patterns)
+    total = len(chunks)
 
-        if use_llm:
-            llm_entities = identify_entities_with_llm(
+    def detect(indexed: Tuple[int, str]) -> Tuple[List[dict], List[dict]]:
+        i, text_page = indexed
+        label = f"{i + 1}/{total}"
+        stored = _restored_chunk(journal, i, text_page, label)
+        if stored is not None:
+            return stored
+        try:
+            found = _detect_in_chunk(
                 text_page,
-                prompt_template,
-                model_name,
+                label,
+                prompt_template=prompt_template,
+                model_name=model_name,
+                regex_patterns=regex_patterns,
                 max_retries=max_retries,
                 base_retry_delay=base_retry_delay,
                 max_retry_delay=max_retry_delay,
+                use_llm=use_llm,
+                raise_on_failure=journal is not None,
+                premask=premask,
             )
-        else:
-            llm_entities = []
-
-        end_time = time.time()
-        duration = end_time - start_time
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        stage = "Regex + LLM" if use_llm else "Regex only"
-        logging.info(f"   NER stage duration ({stage}): {minutes}:{seconds:02d}")
+        except LLMDetectionError:
+            # Only raised with raise_on_failure, i.e. when checkpointing.
+            if journal is None:
+                raise
+            regex_entities = extract_entities_via_regex(text_page, regex_patterns)
+            return _unanswered_chunk(journal, i, label, regex_entities)
+        if journal is not None:
+            journal.record(i, text_page, *found)
+        return found
+
+    unique = _unique_chunks(chunks)
+    workers = min(max(max_concurrency, 1), len(unique)) if use_llm else 1
+    if workers > 1:
+        logging.info(f"Running up to {workers} chunk(s) concurrently.")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, not completion order.
+            results = list(executor.map(detect, unique))
+    else:
+        results = [detect(item) for item in unique]
+
+    for regex_entities, llm_entities in results:
+        collected_entities.extend(regex_entities)
+        collected_entities.extend(llm_entities)
+
+    return collected_entities
+
+
+async def acollect_entities_from_chunks(
+    chunks: List[str],
+    *,
+    prompt_template: str,
+    model_name: str,
+    regex_patterns: Dict[str, str],
+    max_retries: int,
+    base_retry_delay: float,
+    max_retry_delay: float,
+    use_llm: bool,
+    max_concurrency: int = 1,
+    journal: Optional[ChunkJournal] = None,
+    premask: bool = False,
+) -> List[dict]:
+    """Async twin of :func:`collect_entities_from_chunks`.
+
+    LLM calls go through ``aidentify_entities_with_llm``; an
+    ``asyncio.Semaphore`` keeps at most ``max_concurrency`` of them in flight.
+    ``asyncio.gather`` returns results in chunk order, so the mapping matches
+    the sequential path.
+    """
+    if not use_llm:
+        return collect_entities_from_chunks(
+            chunks,
+            prompt_template=prompt_template,
+            model_name=model_name,
+            regex_patterns=regex_patterns,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            use_llm=False,
+            journal=journal,
+        )
+
+    total = len(chunks)
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def detect(i: int, text_page: str) -> Tuple[List[dict], List[dict]]:
+        label = f"{i + 1}/{total}"
+        stored = _restored_chunk(journal, i, text_page, label)
+        if stored is not None:
+            return stored
+        regex_entities = extract_entities_via_regex(text_page, regex_patterns)
+        masked = _premasked(text_page, regex_entities, label) if premask else None
+        async with semaphore:
+            logging.info(f"Identifying entities in part {label}...")
+            try:
+                llm_entities = await aidentify_entities_with_llm(
+                    masked.text if masked is not None else text_page,
+                    prompt_template,
+                    model_name,
+                    max_retries=max_retries,
+                    base_retry_delay=base_retry_delay,
+                    max_retry_delay=max_retry_delay,
+                    raise_on_failure=journal is not None,
+                )
+            except LLMDetectionError:
+                if journal is None:
+                    raise
+                return _unanswered_chunk(journal, i, label, regex_entities)
+        if masked is not None:
+            llm_entities = masked.restore(llm_entities)
         logging.info(
-            f"   Found {len(regex_entities)} via Regex, {len(llm_entities)} via LLM."
+            f"   Part {label}: found {len(regex_entities)} via Regex, "
+            f"{len(llm_entities)} via LLM."
         )
+        if journal is not None:
+            journal.record(i, text_page, regex_entities, llm_entities)
+        return regex_entities, llm_entities
+
+    results = await asyncio.gather(
+        *(detect(i, text_page) for i, text_page in _unique_chunks(chunks))
+    )
 
+    collected_entities: List[dict] = []
+    for regex_entities, llm_entities in results:
         collected_entities.extend(regex_entities)
         collected_entities.extend(llm_entities)
-
     return collected_entities
 
 
@@ -164,8 +403,13 @@ def finalize_entities(
     deny_list: Optional[List[str]],
     apply_deny: bool = True,
     seed_mapping: Optional[Dict[str, str]] = None,
+    merge_forms: bool = True,
 ) -> List[dict]:
-    """Type-priority dedup, type filter, optional deny-list, keep-list, base-form merge."""
+    """Type-priority dedup, type filter, optional deny-list, keep-list, base-form merge.
+
+    ``merge_forms=False`` skips the last step (see :func:`merge_base_forms`)
+    for callers that merge against a mapping they do not hold yet.
+    """
     best_entities: Dict[str, dict] = {}
     for ent in collected:
         text = ent["text"]
@@ -198,11 +442,24 @@ def finalize_entities(
         f"Processing {len(entities_to_process)} filtered entities."
     )
 
-    base_forms = {e.get("base_form") for e in entities_to_process if e.get("base_form")}
+    if merge_forms:
+        merge_base_forms(entities_to_process, seed_mapping)
+    return entities_to_process
+
+
+def merge_base_forms(
+    entities: List[dict], seed_mapping: Optional[Dict[str, str]] = None
+) -> List[dict]:
+    """Point each base form at the longest known form containing it.
+
+    "Smith" becomes "John Smith" when either an entity or a ``seed_mapping``
+    original has that base form. Entities are updated in place.
+    """
+    base_forms = {e.get("base_form") for e in entities if e.get("base_form")}
     if seed_mapping:
         base_forms.update(seed_mapping.keys())
     sorted_base_forms = sorted(list(base_forms), key=len, reverse=True)
-    for entity in entities_to_process:
+    for entity in entities:
         base_form = entity.get("base_form")
         if not base_form:
             continue
@@ -211,7 +468,41 @@ def finalize_entities(
                 entity["base_form"] = potential_full_form
                 break
 
-    return entities_to_process
+    return entities
+
+
+def order_for_numbering(
+    entities: List[dict],
+    order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    full_text: str = "",
+) -> List[dict]:
+    """Entities in the order ``build_mapping`` should number them.
+
+    ``arrival`` keeps the list as is. ``offset`` sorts by the first
+    bounded occurrence of each entity text in ``full_text``; texts that do
+    not occur (and every entity when ``full_text`` is empty, as for
+    tables) follow, sorted by text. ``sorted`` sorts by type, then
+    case-folded text. Neither key depends on the base form, so the order is
+    the same before and after :func:`merge_base_forms`.
+    """
+    order = PlaceholderOrder(order)
+    if order == PlaceholderOrder.ARRIVAL:
+        return list(entities)
+    if order == PlaceholderOrder.SORTED:
+        return sorted(
+            entities,
+            key=lambda e: (e["type"].upper(), e["text"].casefold(), e["text"]),
+        )
+    first_offset: Dict[str, int] = {}
+    if full_text:
+        locator = SpanLocator(entity["text"] for entity in entities)
+        for start, _end, text in locator.locate(full_text):
+            first_offset.setdefault(text, start)
+    missing = len(full_text) + 1
+    return sorted(
+        entities,
+        key=lambda e: (first_offset.get(e["text"], missing), e["text"]),
+    )
 
 
 def build_mapping(
@@ -220,8 +511,15 @@ def build_mapping(
     seed_mapping: Optional[Dict[str, str]],
     operators: Optional[Dict[str, str]],
     fake_secret: Optional[str],
+    seed_counts: Optional[PlaceholderCounts] = None,
 ) -> Dict[str, str]:
-    """seed_placeholder_state, PERSON_n / .v_n, apply_operator."""
+    """seed_placeholder_state, PERSON_n / .v_n, apply_operator.
+
+    Numbers are handed out in list order; see :func:`order_for_numbering`.
+    ``seed_counts`` (type counts, variation counts), e.g. from a
+    ``MappingStore``, raise the numbering floor when ``seed_mapping`` is
+    only part of the known map.
+    """
     if seed_mapping:
         (
             final_mapping,
@@ -234,6 +532,10 @@ def build_mapping(
         placeholder_counts = {}
         base_entity_placeholders = {}
         variation_counters = {}
+    if seed_counts:
+        for counts, floor in zip((placeholder_counts, variation_counters), seed_counts):
+            for name, value in floor.items():
+                counts[name] = max(counts.get(name, 0), value)
 
     for entity in entities:
         entity_text = entity["text"]
@@ -293,6 +595,148 @@ def build_mapping(
     return final_mapping
 
 
+def entries_for_entities(
+    mapping: Dict[str, str], entities: Iterable[dict]
+) -> Dict[str, str]:
+    """The entries of ``mapping`` for these entities' texts and base forms."""
+    originals = set()
+    for entity in entities:
+        originals.add(entity["text"])
+        if entity.get("base_form"):
+            originals.add(entity["base_form"])
+    return {
+        original: mapping[original] for original in originals if original in mapping
+    }
+
+
+def build_mapping_with_store(
+    entities: List[dict],
+    store: MappingStore,
+    *,
+    seed_mapping: Optional[Dict[str, str]] = None,
+    operators: Optional[Dict[str, str]] = None,
+    fake_secret: Optional[str] = None,
+) -> Dict[str, str]:
+    """:func:`merge_base_forms` + :func:`build_mapping` against a store.
+
+    Only the part of ``store`` these entities can touch is read
+    (``MappingStore.seed_for``), numbering continues from the stored
+    counters, and the new entries are written back, all in one store
+    transaction. ``seed_mapping`` entries are used as well; stored entries
+    win. Returns the entries for these entities only.
+    """
+    with store.transaction():
+        stored = store.seed_for(entities)
+        seed = {**(seed_mapping or {}), **stored}
+        merge_base_forms(entities, seed)
+        final_mapping = build_mapping(
+            entities,
+            seed_mapping=seed,
+            operators=operators,
+            fake_secret=fake_secret,
+            seed_counts=store.counters(),
+        )
+        own = entries_for_entities(final_mapping, entities)
+        store.upsert({k: v for k, v in own.items() if k not in stored})
+    return own
+
+
+def _entities_and_mapping(
+    collected: List[dict],
+    full_text: str,
+    *,
+    anonymized_entities: Optional[List[str]],
+    keep_list: Optional[List[str]],
+    deny_list: Optional[List[str]],
+    apply_deny: bool,
+    seed_mapping: Optional[Dict[str, str]],
+    operators: Optional[Dict[str, str]],
+    fake_secret: Optional[str],
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[List[dict], Dict[str, str]]:
+    """finalize_entities + build_mapping, or the coordinator's ``assign``.
+
+    With a ``coordinator`` (``--jobs``), base forms are merged and
+    placeholders numbered by the process that owns the shared mapping;
+    ``seed_mapping``, ``operators``, ``fake_secret`` and any mapping store
+    live there too. With a ``mapping_store`` alone, see
+    :func:`build_mapping_with_store`.
+    """
+    entities = finalize_entities(
+        collected,
+        full_text,
+        anonymized_entities=anonymized_entities,
+        keep_list=keep_list,
+        deny_list=deny_list,
+        apply_deny=apply_deny,
+        seed_mapping=seed_mapping,
+        merge_forms=coordinator is None and mapping_store is None,
+    )
+    entities = order_for_numbering(entities, placeholder_order, full_text)
+    if coordinator is not None:
+        return entities, coordinator.assign(entities, turn)
+    if mapping_store is not None:
+        return entities, build_mapping_with_store(
+            entities,
+            mapping_store,
+            seed_mapping=seed_mapping,
+            operators=operators,
+            fake_secret=fake_secret,
+        )
+    final_mapping = build_mapping(
+        entities,
+        seed_mapping=seed_mapping,
+        operators=operators,
+        fake_secret=fake_secret,
+    )
+    return entities, final_mapping
+
+
+def _mask_collected(
+    full_text: str,
+    collected_entities: List[dict],
+    *,
+    anonymized_entities: Optional[List[str]],
+    operators: Optional[Dict[str, str]],
+    fake_secret: Optional[str],
+    seed_mapping: Optional[Dict[str, str]],
+    keep_list: Optional[List[str]],
+    deny_list: Optional[List[str]],
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[str, Dict[str, str]]:
+    """finalize_entities, build_mapping, replace_entities."""
+    entities_to_process, final_mapping = _entities_and_mapping(
+        collected_entities,
+        full_text,
+        anonymized_entities=anonymized_entities,
+        keep_list=keep_list,
+        deny_list=deny_list,
+        apply_deny=True,
+        seed_mapping=seed_mapping,
+        operators=operators,
+        fake_secret=fake_secret,
+        coordinator=coordinator,
+        placeholder_order=placeholder_order,
+        turn=turn,
+        mapping_store=mapping_store,
+    )
+
+    anonymized_text = full_text
+    if entities_to_process:
+        anonymized_text = replace_entities(
+            full_text,
+            (entity["text"] for entity in entities_to_process),
+            final_mapping,
+        )
+    return anonymized_text, final_mapping
+
+
 def anonymize_text_content(
     full_text: str,
     text_pages: List[str],
@@ -310,6 +754,13 @@ def anonymize_text_content(
     keep_list: Optional[List[str]] = None,
     deny_list: Optional[List[str]] = None,
     use_llm: bool = True,
+    max_concurrency: int = 1,
+    journal: Optional[ChunkJournal] = None,
+    premask: bool = False,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
 ) -> Tuple[str, Dict[str, str]]:
     if regex_patterns is None:
         regex_patterns = DEFAULT_REGEX_PATTERNS
@@ -323,32 +774,166 @@ def anonymize_text_content(
         base_retry_delay=base_retry_delay,
         max_retry_delay=max_retry_delay,
         use_llm=use_llm,
+        max_concurrency=max_concurrency,
+        journal=journal,
+        premask=premask,
     )
-    entities_to_process = finalize_entities(
-        collected_entities,
+    return _mask_collected(
         full_text,
+        collected_entities,
         anonymized_entities=anonymized_entities,
+        operators=operators,
+        fake_secret=fake_secret,
+        seed_mapping=seed_mapping,
         keep_list=keep_list,
         deny_list=deny_list,
-        apply_deny=True,
-        seed_mapping=seed_mapping,
+        coordinator=coordinator,
+        placeholder_order=placeholder_order,
+        turn=turn,
+        mapping_store=mapping_store,
     )
 
-    final_mapping = build_mapping(
-        entities_to_process,
-        seed_mapping=seed_mapping,
+
+async def aanonymize_text_content(
+    full_text: str,
+    text_pages: List[str],
+    *,
+    prompt_template: str,
+    model_name: str,
+    anonymized_entities: Optional[List[str]] = None,
+    regex_patterns: Optional[Dict[str, str]] = None,
+    max_retries: int = 3,
+    base_retry_delay: float = 1.0,
+    max_retry_delay: float = 10.0,
+    operators: Optional[Dict[str, str]] = None,
+    fake_secret: Optional[str] = None,
+    seed_mapping: Optional[Dict[str, str]] = None,
+    keep_list: Optional[List[str]] = None,
+    deny_list: Optional[List[str]] = None,
+    use_llm: bool = True,
+    max_concurrency: int = 1,
+    journal: Optional[ChunkJournal] = None,
+    premask: bool = False,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[str, Dict[str, str]]:
+    """Async twin of :func:`anonymize_text_content`."""
+    if regex_patterns is None:
+        regex_patterns = DEFAULT_REGEX_PATTERNS
+
+    collected_entities = await acollect_entities_from_chunks(
+        text_pages,
+        prompt_template=prompt_template,
+        model_name=model_name,
+        regex_patterns=regex_patterns,
+        max_retries=max_retries,
+        base_retry_delay=base_retry_delay,
+        max_retry_delay=max_retry_delay,
+        use_llm=use_llm,
+        max_concurrency=max_concurrency,
+        journal=journal,
+        premask=premask,
+    )
+    return _mask_collected(
+        full_text,
+        collected_entities,
+        anonymized_entities=anonymized_entities,
         operators=operators,
         fake_secret=fake_secret,
+        seed_mapping=seed_mapping,
+        keep_list=keep_list,
+        deny_list=deny_list,
+        coordinator=coordinator,
+        placeholder_order=placeholder_order,
+        turn=turn,
+        mapping_store=mapping_store,
     )
 
-    anonymized_text = full_text
-    if entities_to_process:
-        anonymized_text = replace_entities(
-            full_text,
-            (entity["text"] for entity in entities_to_process),
-            final_mapping,
+
+def _load_text_pages(
+    file_path: str,
+    characters_to_anonymize: int,
+    chunk_overlap: int,
+    extract_workers: int = 1,
+    overlap_once: bool = False,
+) -> Optional[Tuple[str, List[str]]]:
+    """Extract + chunk a text-like file. None when nothing was extracted."""
+    file_size = os.path.getsize(file_path)
+    full_text, text_pages = load_and_extract_text_from_file(
+        file_path,
+        characters_to_anonymize,
+        0 if overlap_once else chunk_overlap,
+        extract_workers=extract_workers,
+    )
+
+    if not text_pages:
+        logging.warning("No text could be extracted from the file.")
+        return None
+
+    if overlap_once:
+        windows = boundary_chunks(full_text, text_pages, characters_to_anonymize)
+        logging.info(
+            f"Overlap sent once: {len(text_pages)} chunk(s) without overlap "
+            f"plus {len(windows)} boundary chunk(s)."
         )
-    return anonymized_text, final_mapping
+        text_pages = text_pages + windows
+
+    logging.info(f"Extracted text pages: {text_pages[0][:50]} ...")
+    extracted_text_size = len(full_text)
+
+    logging.info(f"  - File size: {file_size / 1024:.2f} KB")
+    logging.info(f"  - Extracted text size: {extracted_text_size / 1024:.2f} KB")
+    return full_text, text_pages
+
+
+def _open_chunk_journal(
+    file_path: str,
+    checkpoint_dir: Optional[str],
+    resume: bool,
+    *,
+    characters_to_anonymize: int,
+    chunk_overlap: int,
+    prompt_template: str,
+    model_name: str,
+    regex_patterns: Dict[str, str],
+    use_llm: bool,
+    premask: bool = False,
+) -> Optional[ChunkJournal]:
+    if checkpoint_dir is None and not resume:
+        return None
+    config = checkpoint_config(
+        characters_to_anonymize=characters_to_anonymize,
+        chunk_overlap=chunk_overlap,
+        prompt_template=prompt_template,
+        model_name=model_name,
+        regex_patterns=regex_patterns,
+        use_llm=use_llm,
+        premask=premask,
+    )
+    return ChunkJournal.open(
+        file_path,
+        config,
+        directory=checkpoint_dir or DEFAULT_CHECKPOINT_DIR,
+        resume=resume,
+    )
+
+
+def _finish_chunk_journal(journal: Optional[ChunkJournal]) -> None:
+    """Delete a complete journal; keep one with unanswered chunks."""
+    if journal is None:
+        return
+    if journal.skipped:
+        journal.close()
+        parts = ", ".join(str(index + 1) for index in sorted(journal.skipped))
+        logging.warning(
+            f"{len(journal.skipped)} chunk(s) had no language-model answer "
+            f"(part {parts}). Checkpoint kept at {journal.path}; "
+            "rerun with --resume to retry them."
+        )
+        return
+    journal.discard()
 
 
 def anonymize_file(
@@ -368,6 +953,16 @@ def anonymize_file(
     keep_list: Optional[List[str]] = None,
     deny_list: Optional[List[str]] = None,
     use_llm: bool = True,
+    max_concurrency: int = 1,
+    extract_workers: int = 1,
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False,
+    overlap_once: bool = False,
+    premask: bool = False,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
 ) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
     """Anonymize a file by processing its text content.
 
@@ -417,6 +1012,48 @@ def anonymize_file(
         use_llm: When False, skip ``identify_entities_with_llm``. Regex,
             checksums, operators, gazetteers, and span replacement still run.
             Names and identity clues will be missed. Default True.
+        max_concurrency: Maximum number of chunks sent to the LLM at once.
+            Results are merged in chunk order, so the mapping is the same as
+            a sequential run. Default 1 (one chunk at a time).
+        extract_workers: Processes used to convert PDF pages to Markdown.
+            Each worker converts its own page slice; slices are joined in
+            page order. Ignored for other file types. Default 1.
+        checkpoint_dir: Directory for a per-chunk journal
+            (``checkpoint.ChunkJournal``) keyed by the source SHA-256 and the
+            detection settings. Each finished chunk is appended as it
+            completes; the journal is deleted when the file finishes.
+            Default None (no journal). Not used for CSV / Excel.
+        resume: Reuse chunks already in the journal instead of detecting
+            them again. Implies a journal in ``conf.DEFAULT_CHECKPOINT_DIR``
+            when ``checkpoint_dir`` is not set. Default False.
+        overlap_once: Split without overlap and send only a short window
+            around each cut (``conf.DEFAULT_BOUNDARY_WINDOW`` characters,
+            packed into a few extra chunks) instead of ``chunk_overlap``
+            characters twice per boundary. Fewer tokens; an entity longer
+            than half the window that straddles a cut can be missed.
+            Default False.
+        premask: Swap each chunk's regex hits (e-mails, IBANs, card
+            numbers, ...) for short typed tokens such as ``[EMAIL_1]`` in
+            the text sent to the LLM, and put the values back in the LLM's
+            entities. Shorter prompts and responses, and those values never
+            reach the provider. Default False.
+        coordinator: Shared :class:`coordinator.MappingCoordinator` (or a
+            manager proxy to one) that numbers placeholders for several
+            files processed at once. ``seed_mapping``, ``operators`` and
+            ``fake_secret`` are then taken from the coordinator, and the
+            returned mapping lists this file's entries only. Default None.
+        placeholder_order: How new entities are numbered
+            (``conf.PlaceholderOrder``): ``"arrival"`` in detection order,
+            ``"offset"`` by first occurrence in the document, ``"sorted"``
+            by type and text. The last two do not depend on how detection
+            was split, scheduled or resumed. Default ``"arrival"``.
+        turn: This file's position in the input list, for a coordinator
+            started with ``ordered=True``. Default None.
+        mapping_store: A ``mapping_store.MappingStore`` (e.g.
+            ``SQLiteMappingStore``) to number against and add this file's
+            new entries to. Only the entries this file touches are read;
+            the returned mapping lists this file's entries only. Default
+            None.
 
     Returns:
         A tuple (anonymized_text, mapping) where:
@@ -450,41 +1087,191 @@ def anonymize_file(
             keep_list=keep_list,
             deny_list=deny_list,
             use_llm=use_llm,
+            max_concurrency=max_concurrency,
+            coordinator=coordinator,
+            placeholder_order=placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
         )
         return review, mapping
 
-    file_size = os.path.getsize(file_path)
-    full_text, text_pages = load_and_extract_text_from_file(
-        file_path, characters_to_anonymize, chunk_overlap
+    loaded = _load_text_pages(
+        file_path,
+        characters_to_anonymize,
+        chunk_overlap,
+        extract_workers,
+        overlap_once,
     )
-
-    if not text_pages:
-        logging.warning("No text could be extracted from the file.")
+    if loaded is None:
         return None, None
+    full_text, text_pages = loaded
+
+    journal = _open_chunk_journal(
+        file_path,
+        checkpoint_dir,
+        resume,
+        characters_to_anonymize=characters_to_anonymize,
+        chunk_overlap=0 if overlap_once else chunk_overlap,
+        prompt_template=prompt_template,
+        model_name=model_name,
+        regex_patterns=regex_patterns,
+        use_llm=use_llm,
+        premask=premask,
+    )
+    try:
+        result = anonymize_text_content(
+            full_text,
+            text_pages,
+            prompt_template=prompt_template,
+            model_name=model_name,
+            anonymized_entities=anonymized_entities,
+            regex_patterns=regex_patterns,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            operators=operators,
+            fake_secret=fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=keep_list,
+            deny_list=deny_list,
+            use_llm=use_llm,
+            max_concurrency=max_concurrency,
+            journal=journal,
+            premask=premask,
+            coordinator=coordinator,
+            placeholder_order=placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+    _finish_chunk_journal(journal)
+    return result
 
-    logging.info(f"Extracted text pages: {text_pages[0][:50]} ...")
-    extracted_text_size = len(full_text)
 
-    logging.info(f"  - File size: {file_size / 1024:.2f} KB")
-    logging.info(f"  - Extracted text size: {extracted_text_size / 1024:.2f} KB")
+async def aanonymize_file(
+    file_path: str,
+    characters_to_anonymize: int,
+    prompt_template: str,
+    model_name: str,
+    anonymized_entities: Optional[List[str]] = None,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    regex_patterns: Optional[Dict[str, str]] = None,
+    max_retries: int = 3,
+    base_retry_delay: float = 1.0,
+    max_retry_delay: float = 10.0,
+    operators: Optional[Dict[str, str]] = None,
+    fake_secret: Optional[str] = None,
+    seed_mapping: Optional[Dict[str, str]] = None,
+    keep_list: Optional[List[str]] = None,
+    deny_list: Optional[List[str]] = None,
+    use_llm: bool = True,
+    max_concurrency: int = 1,
+    extract_workers: int = 1,
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False,
+    overlap_once: bool = False,
+    premask: bool = False,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+    """Async twin of :func:`anonymize_file` for asyncio services.
 
-    return anonymize_text_content(
-        full_text,
-        text_pages,
+    Arguments and return value are the same. LLM calls use the providers'
+    native async clients (``LLMProvider.acall``) with at most
+    ``max_concurrency`` chunks in flight. Text extraction and CSV / Excel
+    files run on a worker thread so the event loop is not blocked.
+    """
+    if regex_patterns is None:
+        regex_patterns = DEFAULT_REGEX_PATTERNS
+
+    if is_rejected_spreadsheet(file_path):
+        raise rejected_spreadsheet_error(file_path)
+    if is_tabular_path(file_path):
+        review, mapping, _entity_texts = await asyncio.to_thread(
+            anonymize_tabular_file,
+            file_path,
+            characters_to_anonymize,
+            prompt_template,
+            model_name,
+            anonymized_entities=anonymized_entities,
+            chunk_overlap=chunk_overlap,
+            regex_patterns=regex_patterns,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            operators=operators,
+            fake_secret=fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=keep_list,
+            deny_list=deny_list,
+            use_llm=use_llm,
+            max_concurrency=max_concurrency,
+            coordinator=coordinator,
+            placeholder_order=placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+        return review, mapping
+
+    loaded = await asyncio.to_thread(
+        _load_text_pages,
+        file_path,
+        characters_to_anonymize,
+        chunk_overlap,
+        extract_workers,
+        overlap_once,
+    )
+    if loaded is None:
+        return None, None
+    full_text, text_pages = loaded
+
+    journal = await asyncio.to_thread(
+        _open_chunk_journal,
+        file_path,
+        checkpoint_dir,
+        resume,
+        characters_to_anonymize=characters_to_anonymize,
+        chunk_overlap=0 if overlap_once else chunk_overlap,
         prompt_template=prompt_template,
         model_name=model_name,
-        anonymized_entities=anonymized_entities,
         regex_patterns=regex_patterns,
-        max_retries=max_retries,
-        base_retry_delay=base_retry_delay,
-        max_retry_delay=max_retry_delay,
-        operators=operators,
-        fake_secret=fake_secret,
-        seed_mapping=seed_mapping,
-        keep_list=keep_list,
-        deny_list=deny_list,
         use_llm=use_llm,
+        premask=premask,
     )
+    try:
+        result = await aanonymize_text_content(
+            full_text,
+            text_pages,
+            prompt_template=prompt_template,
+            model_name=model_name,
+            anonymized_entities=anonymized_entities,
+            regex_patterns=regex_patterns,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            operators=operators,
+            fake_secret=fake_secret,
+            seed_mapping=seed_mapping,
+            keep_list=keep_list,
+            deny_list=deny_list,
+            use_llm=use_llm,
+            max_concurrency=max_concurrency,
+            journal=journal,
+            premask=premask,
+            coordinator=coordinator,
+            placeholder_order=placeholder_order,
+            turn=turn,
+            mapping_store=mapping_store,
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+    _finish_chunk_journal(journal)
+    return result
 
 
 def _serialize_cell_line(sheet_name: str, cell: TableCell, label: str) -> str:
@@ -493,11 +1280,7 @@ def _serialize_cell_line(sheet_name: str, cell: TableCell, label: str) -> str:
 
 
 def _searchable_row_cells(sheet: TableSheet, row: int) -> List[TableCell]:
-    return [
-        cell
-        for cell in sheet.cells
-        if cell.row == row and cell.search_text
-    ]
+    return [cell for cell in sheet.row_cells(row) if cell.search_text]
 
 
 def _cell_label(cell: TableCell, labels: Dict[int, str]) -> str:
@@ -514,7 +1297,7 @@ def _split_oversized_row(
 ) -> List[str]:
     blocks: List[str] = []
     row_header = f"## Row {row}"
-    for cell in sorted(cells, key=lambda item: item.column):
+    for cell in cells:
         label = _cell_label(cell, labels)
         line = _serialize_cell_line(sheet_name, cell, label)
         if len(line) <= characters_to_anonymize:
@@ -533,62 +1316,125 @@ def _split_oversized_row(
     return blocks
 
 
-def build_llm_batches(doc: TableDocument, characters_to_anonymize: int) -> List[str]:
-    """Row-addressed LLM prompts. Overlap is not applied across rows."""
-    splitter = RecursiveCharacterTextSplitter(
+def _sheet_row_units(
+    sheet: TableSheet,
+    labels: Dict[int, str],
+    characters_to_anonymize: int,
+    splitter: RecursiveCharacterTextSplitter,
+) -> List[str]:
+    units: List[str] = []
+    for row in sheet.row_numbers():
+        cells = _searchable_row_cells(sheet, row)
+        if not cells:
+            continue
+        row_header = f"## Row {row}"
+        lines = [
+            _serialize_cell_line(sheet.name, cell, _cell_label(cell, labels))
+            for cell in cells
+        ]
+        row_block = row_header + "\n" + "\n".join(lines)
+        if len(row_block) > characters_to_anonymize:
+            units.extend(
+                _split_oversized_row(
+                    sheet.name,
+                    row,
+                    cells,
+                    labels,
+                    characters_to_anonymize,
+                    splitter,
+                )
+            )
+        else:
+            units.append(row_block)
+    return units
+
+
+def _pack_row_units(
+    sheet_name: str, units: List[str], characters_to_anonymize: int
+) -> List[str]:
+    batches: List[str] = []
+    current: List[str] = [f"# Sheet: {sheet_name}"]
+    current_len = len(current[0])
+    for unit in units:
+        extra = 1 + len(unit)
+        if current_len + extra > characters_to_anonymize and len(current) > 1:
+            batches.append("\n".join(current))
+            current = [f"# Sheet: {sheet_name}"]
+            current_len = len(current[0])
+        current.append(unit)
+        current_len += extra
+    if len(current) > 1:
+        batches.append("\n".join(current))
+    return batches
+
+
+def _batch_splitter(characters_to_anonymize: int) -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(
         chunk_size=max(characters_to_anonymize, 1),
         chunk_overlap=0,
     )
+
+
+def build_llm_batches(doc: TableDocument, characters_to_anonymize: int) -> List[str]:
+    """Row-addressed LLM prompts. Overlap is not applied across rows."""
+    splitter = _batch_splitter(characters_to_anonymize)
     batches: List[str] = []
     for sheet in doc.sheets:
-        labels = header_labels(sheet)
-        units: List[str] = []
-        for row in range(1, sheet.max_row + 1):
-            cells = _searchable_row_cells(sheet, row)
-            if not cells:
-                continue
-            row_header = f"## Row {row}"
-            lines = [
-                _serialize_cell_line(sheet.name, cell, _cell_label(cell, labels))
-                for cell in sorted(cells, key=lambda item: item.column)
-            ]
-            row_block = row_header + "\n" + "\n".join(lines)
-            if len(row_block) > characters_to_anonymize:
-                units.extend(
-                    _split_oversized_row(
-                        sheet.name,
-                        row,
-                        cells,
-                        labels,
-                        characters_to_anonymize,
-                        splitter,
-                    )
-                )
-            else:
-                units.append(row_block)
-
-        current: List[str] = [f"# Sheet: {sheet.name}"]
-        current_len = len(current[0])
-        for unit in units:
-            extra = 1 + len(unit)
-            if current_len + extra > characters_to_anonymize and len(current) > 1:
-                batches.append("\n".join(current))
-                current = [f"# Sheet: {sheet.name}"]
-                current_len = len(current[0])
-            current.append(unit)
-            current_len += extra
-        if len(current) > 1:
-            batches.append("\n".join(current))
+        units = _sheet_row_units(
+            sheet, header_labels(sheet), characters_to_anonymize, splitter
+        )
+        batches.extend(_pack_row_units(sheet.name, units, characters_to_anonymize))
     return batches
 
 
-def _llm_entity_in_cells(entity_text: str, cells: Iterable[TableCell]) -> bool:
-    if not entity_text:
-        return False
-    for cell in cells:
-        if cell.search_text and locate_spans(cell.search_text, [entity_text]):
-            return True
-    return False
+def _llm_entity_in_cells(entity_text: str, index: CellTextIndex) -> bool:
+    return bool(index.cells_containing(entity_text))
+
+
+def _identify_table_batches(
+    batches: List[str],
+    prompt_template: str,
+    model_name: str,
+    *,
+    max_retries: int,
+    base_retry_delay: float,
+    max_retry_delay: float,
+    max_concurrency: int,
+    first_number: int = 1,
+    total: Optional[int] = None,
+) -> List[List[dict]]:
+    """LLM entities per batch, in batch order, ``max_concurrency`` at a time."""
+    of_total = f"/{total}" if total is not None else ""
+
+    def detect(indexed: Tuple[int, str]) -> List[dict]:
+        i, batch = indexed
+        logging.info(
+            f"Identifying entities in table batch {first_number + i}{of_total}..."
+        )
+        return identify_entities_with_llm(
+            batch,
+            prompt_template,
+            model_name,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+        )
+
+    workers = min(max(max_concurrency, 1), max(len(batches), 1))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(detect, enumerate(batches)))
+    return [detect(item) for item in enumerate(batches)]
+
+
+def _merge_best_entities(best: Dict[str, dict], entities: Iterable[dict]) -> None:
+    """Incremental form of the type-priority dedup in ``finalize_entities``."""
+    for ent in entities:
+        existing = best.get(ent["text"])
+        if existing is None or _type_priority(ent["type"].upper()) > _type_priority(
+            existing["type"].upper()
+        ):
+            best[ent["text"]] = ent
 
 
 def anonymize_tabular_file(
@@ -608,12 +1454,26 @@ def anonymize_tabular_file(
     keep_list: Optional[List[str]] = None,
     deny_list: Optional[List[str]] = None,
     use_llm: bool = True,
+    max_concurrency: int = 1,
+    document: Optional[TableDocument] = None,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
 ) -> Tuple[str, Dict[str, str], Tuple[str, ...]]:
     """Anonymize a CSV/Excel file cell by cell.
 
     Returns ``(review_flatten, orig→written, entity_texts)``. ``entity_texts``
     is the same ``entity["text"]`` list the text engine passes to
-    ``replace_entities``.
+    ``replace_entities``. ``max_concurrency`` bounds how many row batches are
+    sent to the LLM at once; results are merged in batch order.
+
+    ``document`` is an already loaded ``load_table(file_path)``; its cells
+    are anonymized in place, so it can be handed to
+    ``save_results(table=...)`` without loading the file again.
+    ``coordinator``, ``placeholder_order``, ``turn`` and ``mapping_store``
+    are as in ``anonymize_file``; ``offset`` numbers by text, since cells
+    have no document offset.
     """
     del chunk_overlap  # row boundaries replace chunk overlap
     if regex_patterns is None:
@@ -622,32 +1482,36 @@ def anonymize_tabular_file(
     if is_rejected_spreadsheet(file_path):
         raise rejected_spreadsheet_error(file_path)
 
-    doc = load_table(file_path)
+    doc = document if document is not None else load_table(file_path)
     cells = list(iter_cells(doc))
+    index = CellTextIndex(cells)
     collected_entities: List[dict] = []
 
-    for cell in cells:
-        if not cell.search_text or cell.kind not in REGEX_CELL_KINDS:
-            continue
-        collected_entities.extend(
-            extract_entities_via_regex(cell.search_text, regex_patterns)
-        )
+    scanner = get_regex_scanner(regex_patterns)
+    regex_texts = (
+        cell.search_text
+        for cell in cells
+        if cell.search_text and cell.kind in REGEX_CELL_KINDS
+    )
+    for cell_entities in scanner.scan_many(regex_texts):
+        collected_entities.extend(cell_entities)
 
     if use_llm:
         batches = build_llm_batches(doc, characters_to_anonymize)
-        for i, batch in enumerate(batches):
-            logging.info(f"Identifying entities in table batch {i + 1}/{len(batches)}...")
-            llm_entities = identify_entities_with_llm(
-                batch,
-                prompt_template,
-                model_name,
-                max_retries=max_retries,
-                base_retry_delay=base_retry_delay,
-                max_retry_delay=max_retry_delay,
-            )
+        batch_results = _identify_table_batches(
+            batches,
+            prompt_template,
+            model_name,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            max_concurrency=max_concurrency,
+            total=len(batches),
+        )
+        for llm_entities in batch_results:
             for entity in llm_entities:
                 text = entity.get("text") or ""
-                if _llm_entity_in_cells(text, cells):
+                if _llm_entity_in_cells(text, index):
                     collected_entities.append(entity)
     else:
         logging.info(
@@ -661,7 +1525,7 @@ def anonymize_tabular_file(
                 continue
             collected_entities.extend(apply_deny_list(cell.search_text, [], deny_list))
 
-    entities_to_process = finalize_entities(
+    entities_to_process, final_mapping = _entities_and_mapping(
         collected_entities,
         "",
         anonymized_entities=anonymized_entities,
@@ -669,16 +1533,151 @@ def anonymize_tabular_file(
         deny_list=deny_list,
         apply_deny=False,
         seed_mapping=seed_mapping,
-    )
-    final_mapping = build_mapping(
-        entities_to_process,
-        seed_mapping=seed_mapping,
         operators=operators,
         fake_secret=fake_secret,
+        coordinator=coordinator,
+        placeholder_order=placeholder_order,
+        turn=turn,
+        mapping_store=mapping_store,
     )
     entity_texts = tuple(
         entity["text"] for entity in entities_to_process if entity.get("text")
     )
-    apply_mapping_to_table(doc, final_mapping, entity_texts)
+    apply_mapping_to_table(doc, final_mapping, entity_texts, index=index)
     review = flatten_table_for_review(doc, anonymized=True)
     return review, final_mapping, entity_texts
+
+
+def anonymize_csv_stream(
+    file_path: str,
+    output_path: str,
+    characters_to_anonymize: int,
+    prompt_template: str,
+    model_name: str,
+    anonymized_entities: Optional[List[str]] = None,
+    regex_patterns: Optional[Dict[str, str]] = None,
+    max_retries: int = 3,
+    base_retry_delay: float = 1.0,
+    max_retry_delay: float = 10.0,
+    operators: Optional[Dict[str, str]] = None,
+    fake_secret: Optional[str] = None,
+    seed_mapping: Optional[Dict[str, str]] = None,
+    keep_list: Optional[List[str]] = None,
+    deny_list: Optional[List[str]] = None,
+    use_llm: bool = True,
+    max_concurrency: int = 1,
+    rows_per_batch: int = CSV_STREAM_ROWS_PER_BATCH,
+    coordinator: Optional["MappingCoordinator"] = None,
+    placeholder_order: PlaceholderOrder = PlaceholderOrder.ARRIVAL,
+    turn: Optional[int] = None,
+    mapping_store: Optional[MappingStore] = None,
+) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """Anonymize a CSV of any size in two streaming passes.
+
+    Pass one reads ``rows_per_batch`` rows at a time and detects entities
+    with regex and, as in ``anonymize_tabular_file``, with the LLM over
+    row-addressed batches. Pass two rewrites the file row by row to
+    ``output_path`` with the same BOM, dialect and formula neutralization as
+    ``save_csv``. The ``MAX_TABLE_BYTES`` / ``MAX_TABLE_CELLS`` caps do not
+    apply; memory is bounded by the row batch plus the distinct entities.
+
+    Header labels come from the first row batch. No review flatten is built.
+
+    ``coordinator``, ``placeholder_order``, ``turn`` and ``mapping_store``
+    are as in ``anonymize_tabular_file``.
+
+    Returns ``(orig→written, entity_texts)``, as the last two values of
+    ``anonymize_tabular_file``.
+    """
+    if Path(file_path).suffix.lower() != ".csv":
+        raise ValueError(f"Streaming mode only supports .csv files: {file_path}")
+    if Path(output_path).resolve() == Path(file_path).resolve():
+        raise ValueError("Streaming CSV output must not overwrite its source.")
+    if regex_patterns is None:
+        regex_patterns = DEFAULT_REGEX_PATTERNS
+
+    source = sniff_csv(file_path)
+    scanner = get_regex_scanner(regex_patterns)
+    splitter = _batch_splitter(characters_to_anonymize)
+    # Kept apart so the merged order matches anonymize_tabular_file:
+    # every regex hit, then LLM hits, then deny-list hits.
+    regex_best: Dict[str, dict] = {}
+    llm_best: Dict[str, dict] = {}
+    deny_best: Dict[str, dict] = {}
+    labels: Optional[Dict[int, str]] = None
+    llm_batches_sent = 0
+    rows_read = 0
+
+    if not use_llm:
+        logging.info(
+            "Regex-only / offline mode: skipping the language model. "
+            "Names and identity clues will be missed."
+        )
+
+    for sheet in iter_csv_row_batches(source, rows_per_batch):
+        rows_read = sheet.max_row
+        if labels is None:
+            labels = header_labels(sheet)
+        regex_texts = (
+            cell.search_text
+            for cell in sheet.cells
+            if cell.search_text and cell.kind in REGEX_CELL_KINDS
+        )
+        for cell_entities in scanner.scan_many(regex_texts):
+            _merge_best_entities(regex_best, cell_entities)
+
+        if use_llm:
+            units = _sheet_row_units(sheet, labels, characters_to_anonymize, splitter)
+            batches = _pack_row_units(sheet.name, units, characters_to_anonymize)
+            index = CellTextIndex(sheet.cells)
+            batch_results = _identify_table_batches(
+                batches,
+                prompt_template,
+                model_name,
+                max_retries=max_retries,
+                base_retry_delay=base_retry_delay,
+                max_retry_delay=max_retry_delay,
+                max_concurrency=max_concurrency,
+                first_number=llm_batches_sent + 1,
+            )
+            llm_batches_sent += len(batches)
+            for llm_entities in batch_results:
+                _merge_best_entities(
+                    llm_best,
+                    (
+                        entity
+                        for entity in llm_entities
+                        if _llm_entity_in_cells(entity.get("text") or "", index)
+                    ),
+                )
+
+        if deny_list:
+            for cell in sheet.cells:
+                if cell.search_text:
+                    _merge_best_entities(
+                        deny_best, apply_deny_list(cell.search_text, [], deny_list)
+                    )
+        logging.info(f"Scanned {rows_read} CSV row(s)...")
+
+    entities_to_process, final_mapping = _entities_and_mapping(
+        [*regex_best.values(), *llm_best.values(), *deny_best.values()],
+        "",
+        anonymized_entities=anonymized_entities,
+        keep_list=keep_list,
+        deny_list=deny_list,
+        apply_deny=False,
+        seed_mapping=seed_mapping,
+        operators=operators,
+        fake_secret=fake_secret,
+        coordinator=coordinator,
+        placeholder_order=placeholder_order,
+        turn=turn,
+        mapping_store=mapping_store,
+    )
+    entity_texts = tuple(
+        entity["text"] for entity in entities_to_process if entity.get("text")
+    )
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    rows_written = rewrite_csv(source, output_path, final_mapping, entity_texts)
+    logging.info(f"Wrote {rows_written} CSV row(s) to {output_path}.")
+    return final_mapping, entity_texts
@@ -0,0 +1,399 @@
+"""Pluggable storage for cached LLM responses.
+
+Backends share one small interface (``LLMCacheBackend``): ``get`` / ``set``
+keyed by model name + prompt, and ``close``. Two implementations ship:
+
+- SQLiteLLMCache (default): one row per response in a WAL-mode SQLite file.
+  Writes are per-key upserts, so nothing is rewritten at exit and startup
+  does not read the whole cache. Several processes can share the file;
+  SQLite's locking plus a busy timeout serialises writers. Entries older
+  than ``max_age_seconds`` are dropped, and the least recently used rows
+  are evicted once ``max_entries`` or ``max_bytes`` is exceeded.
+- JsonLLMCache: the original single-JSON-file cache, loaded into memory and
+  written back at interpreter exit. Kept for existing ``*.json`` setups.
+
+A second layer stores parsed entity lists instead of raw provider text,
+keyed by (model, prompt template version, normalized chunk hash). It lives
+in the same backend under an ``entities:`` model namespace, so a prompt
+copy edit or a different chunk overlap still hits for every unchanged chunk
+and skips both the network call and response validation.
+
+``migrate_json_cache`` copies an old ``llm_responses.json`` into a SQLite
+cache. Keys are identical in both backends (``model:md5(prompt)``), so
+migrated entries keep hitting.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import List, Optional
+
+
+def cache_key(model_name: str, prompt: str) -> str:
+    """Key shared by every backend: ``<model>:<md5 of prompt>``."""
+    prompt_hash = hashlib.md5(prompt.encode("utf-8")).hexdigest()
+    return f"{model_name}:{prompt_hash}"
+
+
+def normalize_chunk(text: str) -> str:
+    """Chunk text as hashed by the entity cache.
+
+    Line endings, trailing spaces, and surrounding blank space do not change
+    which entities a chunk contains, so they do not change the key either.
+    """
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+class LLMCacheBackend(ABC):
+    """Storage interface used by ``LLMProvider.call`` / ``acall``."""
+
+    @abstractmethod
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        """Return the cached response or ``None``."""
+
+    @abstractmethod
+    def set(self, model_name: str, prompt: str, response: str) -> None:
+        """Insert or replace the response for this model and prompt."""
+
+    def close(self) -> None:
+        """Flush and release resources. Default: nothing to do."""
+
+
+# Thread-safe Local LLM Response Cache
+class JsonLLMCache(LLMCacheBackend):
+    def __init__(
+        self, cache_dir: str = "data/cache", cache_file: str = "llm_responses.json"
+    ):
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, cache_file)
+        self.lock = Lock()
+        self._cache = {}
+        self._load_cache()
+        # Register automatic save at exit to avoid full disk writes on every set()
+        atexit.register(self.save)
+
+    def _load_cache(self):
+        with self.lock:
+            if os.path.exists(self.cache_file):
+                try:
+                    with open(self.cache_file, "r", encoding="utf-8") as f:
+                        self._cache = json.load(f)
+                except Exception as e:
+                    logging.warning(f"Failed to load LLM cache file: {e}")
+                    self._cache = {}
+
+    def save(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with self.lock:
+                with open(self.cache_file, "w", encoding="utf-8") as f:
+                    json.dump(self._cache, f, indent=4)
+        except Exception as e:
+            logging.warning(f"Failed to save LLM cache file: {e}")
+
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        key = cache_key(model_name, prompt)
+        with self.lock:
+            return self._cache.get(key)
+
+    def set(self, model_name: str, prompt: str, response: str):
+        key = cache_key(model_name, prompt)
+        with self.lock:
+            self._cache[key] = response
+
+    def close(self) -> None:
+        self.save()
+
+
+# Previous name of the JSON backend.
+LocalLLMCache = JsonLLMCache
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+# A hit only refreshes accessed_at when it is older than this (seconds), so
+# reads do not turn into a write each time.
+_TOUCH_INTERVAL = 60.0
+# Run eviction once per this many set() calls (and on open).
+_EVICT_EVERY = 100
+
+
+class SQLiteLLMCache(LLMCacheBackend):
+    """LLM response cache in a WAL-mode SQLite database.
+
+    Args:
+        cache_dir: Directory holding the database.
+        cache_file: Database filename.
+        max_entries: Keep at most this many rows (LRU). ``None``: no limit.
+        max_bytes: Keep the stored responses under this many UTF-8 bytes
+            (LRU). ``None``: no limit.
+        max_age_seconds: Drop rows written longer ago than this. ``None``:
+            entries never expire.
+        legacy_json: Path of an old JSON cache. If it exists it is imported
+            once and renamed to ``<name>.migrated``.
+        busy_timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache",
+        cache_file: str = "llm_responses.sqlite3",
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        legacy_json: Optional[str] = None,
+        busy_timeout: float = 30.0,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, cache_file)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.busy_timeout = busy_timeout
+        self.lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        with self.lock:
+            conn = self._connection()
+            conn.executescript(_SCHEMA)
+        if legacy_json and os.path.exists(legacy_json):
+            self._import_legacy(legacy_json)
+        self.evict()
+        atexit.register(self.close)
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not cross fork(); reopen in a child process.
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                self.cache_file,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _import_legacy(self, json_path: str) -> None:
+        try:
+            count = migrate_json_cache(json_path, self)
+            os.replace(json_path, f"{json_path}.migrated")
+        except FileNotFoundError:
+            # Another process migrated and renamed it first.
+            return
+        except Exception as e:
+            logging.warning(f"Failed to migrate LLM cache file {json_path}: {e}")
+            return
+        logging.info(f"Migrated {count} cached LLM responses from {json_path}")
+
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        key = cache_key(model_name, prompt)
+        now = time.time()
+        try:
+            with self.lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT response, created_at, accessed_at FROM responses "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                response, created_at, accessed_at = row
+                if (
+                    self.max_age_seconds is not None
+                    and created_at < now - self.max_age_seconds
+                ):
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                if accessed_at < now - _TOUCH_INTERVAL:
+                    conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+                return response
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to read LLM cache: {e}")
+            return None
+
+    def set(self, model_name: str, prompt: str, response: str) -> None:
+        self.set_many([(cache_key(model_name, prompt), response)])
+
+    def set_many(self, items, *, overwrite: bool = True) -> None:
+        """Upsert ``(key, response)`` pairs in one transaction.
+
+        With ``overwrite=False`` existing keys are left untouched.
+        """
+        now = time.time()
+        rows = [
+            (key, response, len(response.encode("utf-8")), now, now)
+            for key, response in items
+        ]
+        if not rows:
+            return
+        if overwrite:
+            statement = (
+                "INSERT INTO responses (key, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "response = excluded.response, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at"
+            )
+        else:
+            statement = (
+                "INSERT OR IGNORE INTO responses "
+                "(key, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)"
+            )
+        try:
+            with self.lock:
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(statement, rows)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self._writes += len(rows)
+                due = self._writes >= _EVICT_EVERY
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to write LLM cache: {e}")
+            return
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Apply the age, entry, and byte limits. Returns rows removed."""
+        if (
+            self.max_age_seconds is None
+            and self.max_entries is None
+            and self.max_bytes is None
+        ):
+            return 0
+        removed = 0
+        try:
+            with self.lock:
+                self._writes = 0
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if self.max_age_seconds is not None:
+                        removed += conn.execute(
+                            "DELETE FROM responses WHERE created_at < ?",
+                            (time.time() - self.max_age_seconds,),
+                        ).rowcount
+                    if self.max_entries is not None:
+                        removed += conn.execute(
+                            "DELETE FROM responses WHERE key IN ("
+                            "SELECT key FROM responses "
+                            "ORDER BY accessed_at DESC, key LIMIT -1 OFFSET ?)",
+                            (self.max_entries,),
+                        ).rowcount
+                    if self.max_bytes is not None:
+                        removed += conn.execute(
+                            "DELETE FROM responses WHERE key IN ("
+                            "SELECT key FROM (SELECT key, SUM(size) OVER ("
+                            "ORDER BY accessed_at DESC, key) AS running "
+                            "FROM responses) WHERE running > ?)",
+                            (self.max_bytes,),
+                        ).rowcount
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to evict LLM cache entries: {e}")
+        if removed:
+            logging.info(f"Evicted {removed} cached LLM responses")
+        return removed
+
+    def __len__(self) -> int:
+        with self.lock:
+            return (
+                self._connection()
+                .execute("SELECT COUNT(*) FROM responses")
+                .fetchone()[0]
+            )
+
+    def close(self) -> None:
+        with self.lock:
+            if self._conn is not None and self._pid == os.getpid():
+                try:
+                    self._conn.close()
+                except sqlite3.Error as e:
+                    logging.warning(f"Failed to close LLM cache: {e}")
+            self._conn = None
+            self._pid = None
+
+
+def _entity_namespace(model_name: str, prompt_version: str) -> str:
+    return f"entities:{model_name}:{prompt_version}"
+
+
+def get_cached_entities(
+    cache: LLMCacheBackend, model_name: str, prompt_version: str, text: str
+) -> Optional[List[dict]]:
+    """Parsed entity dicts stored for this chunk, or ``None`` on a miss."""
+    raw = cache.get(
+        _entity_namespace(model_name, prompt_version), normalize_chunk(text)
+    )
+    if raw is None:
+        return None
+    try:
+        entities = json.loads(raw)
+    except ValueError:
+        return None
+    return entities if isinstance(entities, list) else None
+
+
+def set_cached_entities(
+    cache: LLMCacheBackend,
+    model_name: str,
+    prompt_version: str,
+    text: str,
+    entities: List[dict],
+) -> None:
+    """Store the validated entity dicts for this chunk."""
+    cache.set(
+        _entity_namespace(model_name, prompt_version),
+        normalize_chunk(text),
+        json.dumps(entities, ensure_ascii=False),
+    )
+
+
+def migrate_json_cache(json_path: str, cache: SQLiteLLMCache) -> int:
+    """Copy entries of a JSON cache file into ``cache``. Returns the count.
+
+    Rows already present in the SQLite cache are kept as they are.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, dict):
+        raise ValueError(f"{json_path} is not a JSON object of cached responses.")
+    items = [
+        (key, response)
+        for key, response in entries.items()
+        if isinstance(key, str) and isinstance(response, str) and response
+    ]
+    cache.set_many(items, overwrite=False)
+    return len(items)
@@ -1,84 +1,65 @@
 """LLM provider adapters + response caching layer.
 
 This module contains:
-- LocalLLMCache: thread-safe on-disk caching of LLM responses (keyed by
-  model + prompt hash) to avoid repeated calls during development or
-  re-processing.
+- configure_cache(): selects the on-disk LLM response cache (keyed by
+  model + prompt hash; see llm_cache for the SQLite and JSON backends) to
+  avoid repeated calls during development or re-processing.
 - LLMProvider abstract base + concrete implementations for Google,
   Ollama, Hugging Face, OpenRouter, OpenAI, and Anthropic.
-- configure_cache() and get_provider() factory.
+- The get_provider() registry, which hands out one
+  shared provider instance per (provider, credentials). Each instance builds
+  one pooled SDK client on first use (one async client per event loop) and
+  reuses it for every chunk, so connections and TLS sessions are kept.
+- close_providers() / aclose_providers() to release pooled clients (also
+  run at interpreter exit).
 
 All providers implement a uniform `.call(prompt, model_name)` that goes
-through the cache when enabled.
+through the cache when enabled, and an awaitable `.acall(...)` twin that
+uses the provider's native async client so many requests can be in flight
+on one event loop. Both take an optional ``max_output_tokens``, which every
+built-in provider passes to its SDK as the response length limit.
 """
 
+import asyncio
 import atexit
 import hashlib
-import json
+import inspect
 import logging
 import os
+import weakref
 from abc import ABC, abstractmethod
 from threading import Lock
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, Union
 
 from pdf_anonymizer_core.conf import (
     DEFAULT_CACHE_DIR,
     DEFAULT_CACHE_FILE,
-    DEFAULT_CHARACTERS_TO_ANONYMIZE,
+    DEFAULT_CACHE_MAX_AGE_SECONDS,
+    DEFAULT_CACHE_MAX_BYTES,
+    LEGACY_CACHE_FILE,
 )
+from pdf_anonymizer_core.llm_cache import (  # noqa: F401 (LocalLLMCache re-export)
+    JsonLLMCache,
+    LLMCacheBackend,
+    LocalLLMCache,
+    SQLiteLLMCache,
+)
+from pdf_anonymizer_core.model_limits import limits_for_model
 
 
-# Thread-safe Local LLM Response Cache
-class LocalLLMCache:
-    def __init__(
-        self, cache_dir: str = "data/cache", cache_file: str = "llm_responses.json"
-    ):
-        self.cache_dir = cache_dir
-        self.cache_file = os.path.join(cache_dir, cache_file)
-        self.lock = Lock()
-        self._cache = {}
-        self._load_cache()
-        # Register automatic save at exit to avoid full disk writes on every set()
-        atexit.register(self.save)
-
-    def _load_cache(self):
-        with self.lock:
-            if os.path.exists(self.cache_file):
-                try:
-                    with open(self.cache_file, "r", encoding="utf-8") as f:
-                        self._cache = json.load(f)
-                except Exception as e:
-                    logging.warning(f"Failed to load LLM cache file: {e}")
-                    self._cache = {}
-
-    def save(self):
-        try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-            with self.lock:
-                with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self._cache, f, indent=4)
-        except Exception as e:
-            logging.warning(f"Failed to save LLM cache file: {e}")
-
-    def get(self, model_name: str, prompt: str) -> Optional[str]:
-        prompt_hash = hashlib.md5(prompt.encode("utf-8")).hexdigest()
-        key = f"{model_name}:{prompt_hash}"
-        with self.lock:
-            return self._cache.get(key)
-
-    def set(self, model_name: str, prompt: str, response: str):
-        prompt_hash = hashlib.md5(prompt.encode("utf-8")).hexdigest()
-        key = f"{model_name}:{prompt_hash}"
-        with self.lock:
-            self._cache[key] = response
-
-
-_cache_instance: Optional[LocalLLMCache] = None
+_cache_instance: Optional[LLMCacheBackend] = None
 _cache_enabled: bool = True
 
 
 def configure_cache(
-    enabled: bool, cache_dir: str = "data/cache", cache_file: str = "llm_responses.json"
+    enabled: bool,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    cache_file: str = DEFAULT_CACHE_FILE,
+    *,
+    backend: Union[str, LLMCacheBackend, None] = None,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+    max_age_seconds: Optional[float] = DEFAULT_CACHE_MAX_AGE_SECONDS,
 ):
     """Enable or disable (and optionally relocate) the global LLM response cache.
 
@@ -87,24 +68,108 @@ def configure_cache(
 
     Args:
         enabled: Whether caching should be active.
-        cache_dir: Directory in which llm_responses.json will be stored.
-        cache_file: Filename for the JSON cache.
+        cache_dir: Directory in which the cache file will be stored.
+        cache_file: Filename for the cache. A ``.json`` name selects the
+            JSON backend unless ``backend`` says otherwise.
+        backend: ``"sqlite"``, ``"json"``, or a ready ``LLMCacheBackend``
+            instance. ``None`` picks from the ``cache_file`` extension.
+        max_entries: SQLite only. LRU limit on the number of responses.
+        max_bytes: SQLite only. LRU limit on stored response bytes.
+        max_age_seconds: SQLite only. Responses older than this expire.
+
+    A SQLite cache imports ``llm_responses.json`` from the same directory
+    on first use (see ``llm_cache.migrate_json_cache``).
     """
     global _cache_instance, _cache_enabled
+    instance: Optional[LLMCacheBackend] = None
+    if enabled and isinstance(backend, LLMCacheBackend):
+        instance = backend
+    elif enabled:
+        if backend is None:
+            backend = "json" if cache_file.lower().endswith(".json") else "sqlite"
+        if backend == "json":
+            instance = JsonLLMCache(cache_dir, cache_file)
+        elif backend == "sqlite":
+            instance = SQLiteLLMCache(
+                cache_dir,
+                cache_file,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+                max_age_seconds=max_age_seconds,
+                legacy_json=os.path.join(cache_dir, LEGACY_CACHE_FILE),
+            )
+        else:
+            raise ValueError(f"Unknown cache backend: {backend!r}")
+    if _cache_instance is not None and _cache_instance is not instance:
+        _cache_instance.close()
     _cache_enabled = enabled
-    if enabled:
-        _cache_instance = LocalLLMCache(cache_dir, cache_file)
-    else:
-        _cache_instance = None
+    _cache_instance = instance
+
+
+def active_cache() -> Optional[LLMCacheBackend]:
+    """The global cache backend, or None when caching is off.
+
+    Opens the default cache on first use if nothing was configured.
+    """
+    if _cache_enabled and _cache_instance is None:
+        configure_cache(True, DEFAULT_CACHE_DIR, DEFAULT_CACHE_FILE)
+    return _cache_instance if _cache_enabled else None
+
+
+def _close_client(client: Any) -> Optional[Awaitable[Any]]:
+    """Call ``aclose()`` / ``close()`` if the SDK client has one.
+
+    Returns the awaitable for async clients so the caller can await it.
+    """
+    if client is None:
+        return None
+    for name in ("aclose", "close"):
+        closer = getattr(client, name, None)
+        if callable(closer):
+            try:
+                result = closer()
+            except Exception as e:
+                logging.warning(f"Failed to close LLM client: {e}")
+                return None
+            return result if inspect.isawaitable(result) else None
+    return None
+
+
+def _limit_kwargs(name: str, max_output_tokens: Optional[int]) -> Dict[str, Any]:
+    """``{name: max_output_tokens}``, or nothing to keep the SDK default."""
+    return {name: max_output_tokens} if max_output_tokens else {}
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers.
 
-    Subclasses must implement _call_raw. The public .call() method (inherited)
-    adds transparent caching when the global cache is enabled.
+    Subclasses must implement _call_raw, _new_client and _new_async_client,
+    and should implement _acall_raw with the SDK's async client. The public
+    .call() / .acall() methods (inherited) add transparent caching when the
+    global cache is enabled.
+
+    SDK clients are built lazily by ``_new_client`` / ``_new_async_client``
+    and reused: one sync client per instance, one async client per running
+    event loop (async HTTP pools cannot cross loops). ``close()`` /
+    ``aclose()`` release them; the provider stays usable and rebuilds on
+    demand. Instances are also context managers.
+
+    ``max_output_tokens`` (from ``model_limits``) caps the response length;
+    ``None`` leaves the SDK default. Concrete providers map it to their
+    SDK's own parameter.
     """
 
+    # Environment variable holding this provider's credential. Part of the
+    # get_provider() registry key, so a rotated key gets a fresh client.
+    credential_env: Optional[str] = None
+
+    def __init__(self) -> None:
+        self._client_lock = Lock()
+        self._client: Any = None
+        self._aclients: "weakref.WeakKeyDictionary[Any, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
     @abstractmethod
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
@@ -112,35 +177,143 @@ class LLMProvider(ABC):
         """Raw provider call. Must be overridden by concrete providers."""
         pass
 
-    def call(
+    async def _acall_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        """Public entry point used by the anonymizer.
+        """Raw async provider call.
 
-        Checks the cache (if enabled) before delegating to the concrete provider.
+        The default runs ``_call_raw`` on a worker thread so third-party
+        providers without an async client still work with ``acall``.
         """
-        global _cache_instance, _cache_enabled
+        return await asyncio.to_thread(
+            self._call_raw, prompt, model_name, max_output_tokens
+        )
 
-        # Initialize default cache if enabled and not yet initialized
-        if _cache_enabled and _cache_instance is None:
-            configure_cache(True, DEFAULT_CACHE_DIR, DEFAULT_CACHE_FILE)
+    @abstractmethod
+    def _new_client(self) -> Any:
+        """Build the SDK client that ``client()`` pools."""
 
-        if _cache_enabled and _cache_instance is not None:
-            cached_val = _cache_instance.get(model_name, prompt)
+    @abstractmethod
+    def _new_async_client(self) -> Any:
+        """Build the async SDK client that ``async_client()`` pools per loop."""
+
+    def client(self) -> Any:
+        """Shared sync SDK client, built on first use. Thread-safe."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._new_client()
+        return self._client
+
+    def async_client(self) -> Any:
+        """Shared async SDK client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            client = self._aclients.get(loop)
+            if client is None:
+                client = self._new_async_client()
+                self._aclients[loop] = client
+        return client
+
+    def _detach_clients(self) -> Tuple[Any, list]:
+        with self._client_lock:
+            client, self._client = self._client, None
+            aclients = list(self._aclients.values())
+            self._aclients.clear()
+        return client, aclients
+
+    def close(self) -> None:
+        """Close pooled clients. Async clients are dropped, not awaited."""
+        client, _aclients = self._detach_clients()
+        _close_client(client)
+
+    async def aclose(self) -> None:
+        """Close pooled sync and async clients."""
+        client, aclients = self._detach_clients()
+        for item in [client, *aclients]:
+            pending = _close_client(item)
+            if pending is not None:
+                try:
+                    await pending
+                except Exception as e:
+                    logging.warning(f"Failed to close LLM client: {e}")
+
+    def __enter__(self) -> "LLMProvider":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LLMProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _cached(self, prompt: str, model_name: str) -> Optional[str]:
+        cache = active_cache()
+        if cache is not None:
+            cached_val = cache.get(model_name, prompt)
             if cached_val is not None:
                 logging.info(f"Cache hit for model '{model_name}'")
                 return cached_val
+        return None
+
+    def _store(
+        self,
+        prompt: str,
+        model_name: str,
+        response: str,
+        cacheable: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        if cacheable is not None and not cacheable(response):
+            return
+        if _cache_enabled and _cache_instance is not None and response:
+            _cache_instance.set(model_name, prompt, response)
+
+    def call(
+        self,
+        prompt: str,
+        model_name: str,
+        max_output_tokens: Optional[int] = None,
+        cacheable: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """Public entry point used by the anonymizer.
+
+        Checks the cache (if enabled) before delegating to the concrete provider.
+        A fresh response is stored only when ``cacheable`` (if given) accepts
+        it, so callers can keep e.g. cut-off responses out of the cache.
+        """
+        cached_val = self._cached(prompt, model_name)
+        if cached_val is not None:
+            return cached_val
 
         response = self._call_raw(prompt, model_name, max_output_tokens)
+        self._store(prompt, model_name, response, cacheable)
+        return response
 
-        if _cache_enabled and _cache_instance is not None and response:
-            _cache_instance.set(model_name, prompt, response)
+    async def acall(
+        self,
+        prompt: str,
+        model_name: str,
+        max_output_tokens: Optional[int] = None,
+        cacheable: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """Async twin of :meth:`call`. Same cache, awaits ``_acall_raw``."""
+        cached_val = self._cached(prompt, model_name)
+        if cached_val is not None:
+            return cached_val
 
+        response = await self._acall_raw(prompt, model_name, max_output_tokens)
+        self._store(prompt, model_name, response, cacheable)
         return response
 
 
 class GoogleProvider(LLMProvider):
+    credential_env = "GOOGLE_API_KEY"
+
     def __init__(self):
+        super().__init__()
         try:
             from google import genai
 
@@ -153,16 +326,60 @@ class GoogleProvider(LLMProvider):
         if not os.getenv("GOOGLE_API_KEY"):
             raise ValueError("GOOGLE_API_KEY environment variable not set.")
 
+    def _new_client(self) -> Any:
+        return self.genai.Client()
+
+    def _new_async_client(self) -> Any:
+        # The parent Client owns the transport behind ``.aio``; pool the
+        # parent so the handle never outlives it.
+        return self.genai.Client()
+
+    async def aclose(self) -> None:
+        """Close each loop's async transport, then the clients themselves."""
+        with self._client_lock:
+            parents = list(self._aclients.values())
+        for parent in parents:
+            pending = _close_client(parent.aio)
+            if pending is not None:
+                try:
+                    await pending
+                except Exception as e:
+                    logging.warning(f"Failed to close LLM client: {e}")
+        await super().aclose()
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        client = self.genai.Client()
-        response = client.models.generate_content(model=model_name, contents=prompt)
+        response = self.client().models.generate_content(
+            model=model_name,
+            contents=prompt,
+            **self._config(max_output_tokens),
+        )
+        return response.text if hasattr(response, "text") else ""
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        response = await self.async_client().aio.models.generate_content(
+            model=model_name,
+            contents=prompt,
+            **self._config(max_output_tokens),
+        )
         return response.text if hasattr(response, "text") else ""
 
+    @staticmethod
+    def _config(max_output_tokens: Optional[int]) -> Dict[str, Any]:
+        if not max_output_tokens:
+            return {}
+        return {"config": {"max_output_tokens": max_output_tokens}}
+
 
 class OllamaProvider(LLMProvider):
+    # Not a secret, but a different host needs a different client.
+    credential_env = "OLLAMA_HOST"
+
     def __init__(self):
+        super().__init__()
         try:
             import ollama
 
@@ -173,13 +390,40 @@ class OllamaProvider(LLMProvider):
                 "Please run 'pip install \"pdf-anonymizer-core[ollama]\"'."
             )
 
+    def _new_client(self) -> Any:
+        return self.ollama.Client()
+
+    def _new_async_client(self) -> Any:
+        return self.ollama.AsyncClient()
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        response: Dict[str, Any] = self.ollama.chat(
+        response: Dict[str, Any] = self.client().chat(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            **self._options(max_output_tokens),
+        )
+        return self._content(response)
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        response: Dict[str, Any] = await self.async_client().chat(
             model=model_name,
             messages=[{"role": "user", "content": prompt}],
+            **self._options(max_output_tokens),
         )
+        return self._content(response)
+
+    @staticmethod
+    def _options(max_output_tokens: Optional[int]) -> Dict[str, Any]:
+        if not max_output_tokens:
+            return {}
+        return {"options": {"num_predict": max_output_tokens}}
+
+    @staticmethod
+    def _content(response: Any) -> str:
         if (
             isinstance(response, dict)
             and "message" in response
@@ -190,11 +434,15 @@ class OllamaProvider(LLMProvider):
 
 
 class HuggingFaceProvider(LLMProvider):
+    credential_env = "HUGGING_FACE_TOKEN"
+
     def __init__(self):
+        super().__init__()
         try:
-            from huggingface_hub import InferenceClient
+            from huggingface_hub import AsyncInferenceClient, InferenceClient
 
             self.InferenceClient = InferenceClient
+            self.AsyncInferenceClient = AsyncInferenceClient
         except ImportError:
             raise ImportError(
                 "The 'huggingface' extra is not installed. "
@@ -203,15 +451,35 @@ class HuggingFaceProvider(LLMProvider):
         if not os.getenv("HUGGING_FACE_TOKEN"):
             raise ValueError("HUGGING_FACE_TOKEN environment variable not set.")
 
+    # One client for every model; the model is passed per request.
+    def _new_client(self) -> Any:
+        return self.InferenceClient(token=os.getenv("HUGGING_FACE_TOKEN"))
+
+    def _new_async_client(self) -> Any:
+        return self.AsyncInferenceClient(token=os.getenv("HUGGING_FACE_TOKEN"))
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        client = self.InferenceClient(
-            model=model_name, token=os.getenv("HUGGING_FACE_TOKEN")
+        response = self.client().chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            model=model_name,
+            max_tokens=max_output_tokens,
         )
-        response = client.chat_completion(
+        return self._content(response)
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        response = await self.async_client().chat_completion(
             messages=[{"role": "user", "content": prompt}],
+            model=model_name,
+            max_tokens=max_output_tokens,
         )
+        return self._content(response)
+
+    @staticmethod
+    def _content(response: Any) -> str:
         if (
             response
             and hasattr(response, "choices")
@@ -224,11 +492,15 @@ class HuggingFaceProvider(LLMProvider):
 
 
 class OpenRouterProvider(LLMProvider):
+    credential_env = "OPENROUTER_API_KEY"
+
     def __init__(self):
+        super().__init__()
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
 
             self.OpenAI = OpenAI
+            self.AsyncOpenAI = AsyncOpenAI
         except ImportError:
             raise ImportError(
                 "The 'openrouter' extra is not installed. "
@@ -237,25 +509,49 @@ class OpenRouterProvider(LLMProvider):
         if not os.getenv("OPENROUTER_API_KEY"):
             raise ValueError("OPENROUTER_API_KEY environment variable not set.")
 
+    def _new_client(self) -> Any:
+        return self.OpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=os.getenv("OPENROUTER_API_KEY"),
+        )
+
+    def _new_async_client(self) -> Any:
+        return self.AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=os.getenv("OPENROUTER_API_KEY"),
+        )
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        client = self.OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=os.getenv("OPENROUTER_API_KEY"),
+        completion = self.client().chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            **_limit_kwargs("max_tokens", max_output_tokens),
         )
-        completion = client.chat.completions.create(
-            model=model_name, messages=[{"role": "user", "content": prompt}]
+        return completion.choices[0].message.content or ""
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        completion = await self.async_client().chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            **_limit_kwargs("max_tokens", max_output_tokens),
         )
         return completion.choices[0].message.content or ""
 
 
 class OpenAIProvider(LLMProvider):
+    credential_env = "OPENAI_API_KEY"
+
     def __init__(self):
+        super().__init__()
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
 
             self.OpenAI = OpenAI
+            self.AsyncOpenAI = AsyncOpenAI
         except ImportError:
             raise ImportError(
                 "The 'openai' extra is not installed. "
@@ -264,22 +560,43 @@ class OpenAIProvider(LLMProvider):
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY environment variable not set.")
 
+    def _new_client(self) -> Any:
+        return self.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    def _new_async_client(self) -> Any:
+        return self.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        client = self.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        completion = client.chat.completions.create(
-            model=model_name, messages=[{"role": "user", "content": prompt}]
+        completion = self.client().chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            **_limit_kwargs("max_completion_tokens", max_output_tokens),
+        )
+        return completion.choices[0].message.content or ""
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        completion = await self.async_client().chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            **_limit_kwargs("max_completion_tokens", max_output_tokens),
         )
         return completion.choices[0].message.content or ""
 
 
 class AnthropicProvider(LLMProvider):
+    credential_env = "ANTHROPIC_API_KEY"
+
     def __init__(self):
+        super().__init__()
         try:
-            from anthropic import Anthropic
+            from anthropic import Anthropic, AsyncAnthropic
 
             self.Anthropic = Anthropic
+            self.AsyncAnthropic = AsyncAnthropic
         except ImportError:
             raise ImportError(
                 "The 'anthropic' extra is not installed. "
@@ -288,32 +605,102 @@ class AnthropicProvider(LLMProvider):
         if not os.getenv("ANTHROPIC_API_KEY"):
             raise ValueError("ANTHROPIC_API_KEY environment variable not set.")
 
+    def _new_client(self) -> Any:
+        return self.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+    @staticmethod
+    def _max_tokens(model_name: str, max_output_tokens: Optional[int]) -> int:
+        """Caller's limit, else the model's entry in ``model_limits``."""
+        if isinstance(max_output_tokens, int) and max_output_tokens > 0:
+            return max_output_tokens
+        return limits_for_model("anthropic", model_name).max_output_tokens
+
+    def _new_async_client(self) -> Any:
+        return self.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
     def _call_raw(
         self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
     ) -> str:
-        client = self.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        response = client.messages.create(
+        response = self.client().messages.create(
+            model=model_name,
+            max_tokens=self._max_tokens(model_name, max_output_tokens),
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.content[0].text if response.content else ""
+
+    async def _acall_raw(
+        self, prompt: str, model_name: str, max_output_tokens: Optional[int] = None
+    ) -> str:
+        response = await self.async_client().messages.create(
             model=model_name,
-            max_tokens=max_output_tokens
-            if isinstance(max_output_tokens, int) and max_output_tokens > 0
-            else DEFAULT_CHARACTERS_TO_ANONYMIZE // 4,
+            max_tokens=self._max_tokens(model_name, max_output_tokens),
             messages=[{"role": "user", "content": prompt}],
-            stream=True,
         )
         return response.content[0].text if response.content else ""
 
 
+PROVIDER_CLASSES: Dict[str, Type[LLMProvider]] = {
+    "google": GoogleProvider,
+    "ollama": OllamaProvider,
+    "huggingface": HuggingFaceProvider,
+    "openrouter": OpenRouterProvider,
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+}
+
+# (provider name, credential fingerprint) -> shared instance
+_provider_registry: Dict[Tuple[str, str], LLMProvider] = {}
+_registry_lock = Lock()
+
+
+def _credential_fingerprint(provider_class: Type[LLMProvider]) -> str:
+    env_name = provider_class.credential_env
+    secret = os.getenv(env_name, "") if env_name else ""
+    # Only a digest is kept in the registry key, never the key itself.
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
 def get_provider(provider_name: str) -> LLMProvider:
-    """Factory function to get a provider instance."""
-    provider_map = {
-        "google": GoogleProvider,
-        "ollama": OllamaProvider,
-        "huggingface": HuggingFaceProvider,
-        "openrouter": OpenRouterProvider,
-        "openai": OpenAIProvider,
-        "anthropic": AnthropicProvider,
-    }
-    provider_class = provider_map.get(provider_name)
-    if provider_class:
-        return provider_class()
-    raise ValueError(f"Unknown provider: {provider_name}")
+    """Return the shared provider instance for ``provider_name``.
+
+    Instances are cached per (provider, credentials) and are safe to share
+    across threads, so every chunk reuses one pooled SDK client instead of
+    paying for client construction and a new TLS handshake. A rotated
+    credential replaces the provider's old instance in the registry. The old
+    instance is not closed, since other threads or tasks may still be
+    mid-call on its clients; they are released when it is garbage-collected.
+    """
+    provider_class = PROVIDER_CLASSES.get(provider_name)
+    if provider_class is None:
+        raise ValueError(f"Unknown provider: {provider_name}")
+    key = (provider_name, _credential_fingerprint(provider_class))
+    with _registry_lock:
+        provider = _provider_registry.get(key)
+        if provider is None:
+            provider = provider_class()
+            for old in [old for old in _provider_registry if old[0] == provider_name]:
+                del _provider_registry[old]
+            _provider_registry[key] = provider
+    return provider
+
+
+def _drain_registry() -> list:
+    with _registry_lock:
+        providers = list(_provider_registry.values())
+        _provider_registry.clear()
+    return providers
+
+
+def close_providers() -> None:
+    """Close every pooled client and empty the registry. Runs at exit."""
+    for provider in _drain_registry():
+        provider.close()
+
+
+async def aclose_providers() -> None:
+    """Async variant of :func:`close_providers`; awaits async client shutdown."""
+    for provider in _drain_registry():
+        await provider.aclose()
+
+
+atexit.register(close_providers)
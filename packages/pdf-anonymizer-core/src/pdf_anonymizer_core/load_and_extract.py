@@ -7,18 +7,44 @@ structure useful for LLMs) and langchain text splitters:
 
 Chunk size and overlap are the primary controls for memory usage and
 LLM context consumption.
+
+STREAMING (large-file mode):
+``iter_text_chunks`` yields the same kind of chunks without ever holding the
+whole document. PDFs are converted a few pages at a time
+(``iter_pdf_markdown``); text files are read in blocks. The splitter runs on
+a small rolling buffer: every chunk but the last is emitted, and the last
+(possibly unfinished) one is carried into the next buffer, so overlap is
+kept and peak memory is bounded by chunk size plus one page batch.
+
+PARALLEL PDF CONVERSION:
+With ``extract_workers > 1`` the page range is cut into contiguous slices
+and converted on a ``ProcessPoolExecutor``; each worker opens the PDF itself
+and converts its slice with pymupdf4llm. Slices are joined in page order.
+
+OVERLAP ONCE:
+``boundary_chunks`` replaces chunk overlap for callers that split with
+``chunk_overlap=0``: only a short window around each cut is sent again, and
+the windows are packed together into a few extra chunks.
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+import pymupdf
 import pymupdf4llm
 from langchain_text_splitters import (
     MarkdownTextSplitter,
     RecursiveCharacterTextSplitter,
+    TextSplitter,
 )
 
+from pdf_anonymizer_core.conf import (
+    DEFAULT_BOUNDARY_WINDOW,
+    EXTRACT_PAGES_PER_BATCH,
+    TEXT_READ_BLOCK_CHARS,
+)
 from pdf_anonymizer_core.tables import (
     EXCEL_EXTRA_MESSAGE,
     is_rejected_spreadsheet,
@@ -27,8 +53,50 @@ from pdf_anonymizer_core.tables import (
 )
 
 
+def _convert_page_slice(file_path: str, first: int, last: int) -> str:
+    """Worker: open the PDF and convert pages ``first`` to ``last - 1``."""
+    with pymupdf.open(file_path) as doc:
+        return pymupdf4llm.to_markdown(
+            doc, pages=list(range(first, last)), show_progress=False
+        )
+
+
+def convert_pdf_parallel(file_path: str, extract_workers: int) -> str:
+    """Convert a PDF to Markdown with ``extract_workers`` processes.
+
+    The pages are cut into about four contiguous slices per worker (so one
+    slow slice does not hold up the rest), converted in separate processes,
+    and joined in page order.
+    """
+    with pymupdf.open(file_path) as doc:
+        page_count = doc.page_count
+    if page_count == 0:
+        return ""
+    slices = min(page_count, extract_workers * 4)
+    step = -(-page_count // slices)
+    bounds = [
+        (first, min(first + step, page_count)) for first in range(0, page_count, step)
+    ]
+    workers = min(extract_workers, len(bounds))
+    logging.info(
+        f"Converting {page_count} PDF pages in {len(bounds)} slices "
+        f"on {workers} processes"
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(
+            _convert_page_slice,
+            [file_path] * len(bounds),
+            [first for first, _ in bounds],
+            [last for _, last in bounds],
+        )
+        return "".join(parts)
+
+
 def load_and_extract_text_from_pdf(
-    file_path: str, characters_to_anonymize: int = 100000, chunk_overlap: int = 0
+    file_path: str,
+    characters_to_anonymize: int = 100000,
+    chunk_overlap: int = 0,
+    extract_workers: int = 1,
 ) -> Tuple[str, List[str]]:
     """
     Loads a PDF file and extracts text from each page, returning the full text and chunked text.
@@ -37,12 +105,17 @@ def load_and_extract_text_from_pdf(
         file_path (str): The path to the PDF file.
         characters_to_anonymize: Number of characters to anonymize in one go (chunk size).
         chunk_overlap: Overlap size between chunks.
+        extract_workers: Processes for page conversion. 1 converts in this
+            process (see ``convert_pdf_parallel``).
 
     Returns:
         Tuple[str, List[str]]: The full text as a string, and a list of chunk strings.
     """
     try:
-        md_text = pymupdf4llm.to_markdown(file_path, show_progress=False)
+        if extract_workers > 1:
+            md_text = convert_pdf_parallel(file_path, extract_workers)
+        else:
+            md_text = pymupdf4llm.to_markdown(file_path, show_progress=False)
         splitter = MarkdownTextSplitter(
             chunk_size=characters_to_anonymize, chunk_overlap=chunk_overlap
         )
@@ -56,8 +129,216 @@ def load_and_extract_text_from_pdf(
         raise e
 
 
+def _reject_tabular(file_path: str) -> None:
+    if is_rejected_spreadsheet(file_path):
+        raise rejected_spreadsheet_error(file_path)
+    if is_tabular_path(file_path):
+        file_extension = Path(file_path).suffix.lower()
+        if file_extension == ".xlsx":
+            raise ValueError(EXCEL_EXTRA_MESSAGE)
+        raise ValueError(
+            f"{file_extension} files must be loaded as tables, not as plain text."
+        )
+
+
+def iter_pdf_markdown(
+    file_path: str, pages_per_batch: int = EXTRACT_PAGES_PER_BATCH
+) -> Iterator[str]:
+    """Yield the PDF as Markdown, ``pages_per_batch`` pages at a time."""
+    if pages_per_batch < 1:
+        raise ValueError("pages_per_batch must be at least 1.")
+    with pymupdf.open(file_path) as doc:
+        page_count = doc.page_count
+        for first in range(0, page_count, pages_per_batch):
+            pages = list(range(first, min(first + pages_per_batch, page_count)))
+            yield pymupdf4llm.to_markdown(doc, pages=pages, show_progress=False)
+
+
+def _iter_text_blocks(
+    file_path: str, block_chars: int = TEXT_READ_BLOCK_CHARS
+) -> Iterator[str]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        while True:
+            block = f.read(block_chars)
+            if not block:
+                return
+            yield block
+
+
+def iter_document_text(
+    file_path: str,
+    pages_per_batch: int = EXTRACT_PAGES_PER_BATCH,
+    block_chars: int = TEXT_READ_BLOCK_CHARS,
+) -> Iterator[str]:
+    """Yield consecutive pieces of a document's text (PDF page batches or file blocks).
+
+    Joined, the pieces equal the text that ``load_and_extract_text_from_file``
+    returns for the same file.
+    """
+    _reject_tabular(file_path)
+    if Path(file_path).suffix.lower() == ".pdf":
+        return iter_pdf_markdown(file_path, pages_per_batch)
+    return _iter_text_blocks(file_path, block_chars)
+
+
+def _splitter_for(
+    file_path: str, characters_to_anonymize: int, chunk_overlap: int
+) -> TextSplitter:
+    if Path(file_path).suffix.lower() in (".pdf", ".md"):
+        return MarkdownTextSplitter(
+            chunk_size=characters_to_anonymize, chunk_overlap=chunk_overlap
+        )
+    return RecursiveCharacterTextSplitter(
+        chunk_size=characters_to_anonymize, chunk_overlap=chunk_overlap
+    )
+
+
+def split_text_stream(
+    pieces: Iterable[str], splitter: TextSplitter, characters_to_anonymize: int
+) -> Iterator[str]:
+    """Split a stream of text pieces into chunks with a bounded buffer.
+
+    The splitter runs once the buffer holds about two chunks. Chunks that end
+    at least one chunk length before the end of the buffer are final and are
+    yielded; the buffer restarts where the first held-back chunk starts, so
+    the next split sees the same context the whole-text split would.
+    """
+    threshold = 2 * characters_to_anonymize
+    buffer: List[str] = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered < threshold:
+            continue
+        text = "".join(buffer)
+        safe_end = len(text) - characters_to_anonymize
+        restart = 0
+        start = -1
+        for chunk in splitter.split_text(text):
+            start = text.find(chunk, start + 1)
+            if start + len(chunk) > safe_end:
+                restart = start
+                # Keep the separator whitespace the splitter stripped off.
+                while restart > 0 and text[restart - 1].isspace():
+                    restart -= 1
+                break
+            yield chunk
+            restart = start + len(chunk)
+        text = text[restart:]
+        buffer = [text]
+        buffered = len(text)
+    text = "".join(buffer)
+    if text:
+        yield from splitter.split_text(text)
+
+
+def _chunk_bounds(full_text: str, chunks: List[str]) -> List[Optional[Tuple[int, int]]]:
+    """Start/end of each chunk in ``full_text``, searched left to right."""
+    bounds: List[Optional[Tuple[int, int]]] = []
+    cursor = 0
+    for chunk in chunks:
+        start = full_text.find(chunk, cursor)
+        if start < 0:
+            bounds.append(None)
+            continue
+        cursor = start + len(chunk)
+        bounds.append((start, cursor))
+    return bounds
+
+
+def boundary_chunks(
+    full_text: str,
+    chunks: List[str],
+    characters_to_anonymize: int,
+    window: int = DEFAULT_BOUNDARY_WINDOW,
+) -> List[str]:
+    """Extra chunks covering the cuts between chunks split without overlap.
+
+    Each window reaches ``window // 2`` characters either side of a cut,
+    trimmed to whole words and kept inside the two chunks it joins, so an
+    entity the cut splits is seen whole once. Windows are joined with blank
+    lines into chunks of at most ``characters_to_anonymize`` characters.
+
+    Args:
+        full_text: The text the chunks were split from.
+        chunks: Chunks from a splitter run with ``chunk_overlap=0``.
+        characters_to_anonymize: Size limit of each packed chunk.
+        window: Characters around each cut.
+
+    Returns:
+        Packed window chunks, in document order. Empty for a single chunk.
+    """
+    half = max(min(window, characters_to_anonymize) // 2, 1)
+    bounds = _chunk_bounds(full_text, chunks)
+    windows: List[str] = []
+    for left, right in zip(bounds, bounds[1:]):
+        if left is None or right is None:
+            continue
+        lo = max(left[0], left[1] - half)
+        hi = min(right[1], right[0] + half)
+        if lo > left[0]:
+            while lo < left[1] and not full_text[lo - 1].isspace():
+                lo += 1
+        if hi < right[1]:
+            while hi > right[0] and not full_text[hi].isspace():
+                hi -= 1
+        piece = full_text[lo:hi].strip()
+        if piece:
+            windows.append(piece)
+
+    packed: List[str] = []
+    current: List[str] = []
+    size = 0
+    for piece in windows:
+        extra = len(piece) + (2 if current else 0)
+        if current and size + extra > characters_to_anonymize:
+            packed.append("\n\n".join(current))
+            current, size, extra = [], 0, len(piece)
+        current.append(piece)
+        size += extra
+    if current:
+        packed.append("\n\n".join(current))
+    return packed
+
+
+def iter_text_chunks(
+    file_path: str,
+    characters_to_anonymize: int = 100000,
+    chunk_overlap: int = 0,
+    pages_per_batch: int = EXTRACT_PAGES_PER_BATCH,
+) -> Iterator[str]:
+    """Stream a document's chunks without loading the whole text.
+
+    Same splitters as ``load_and_extract_text_from_file`` (Markdown-aware for
+    .pdf / .md, recursive character splitting otherwise), and normally the
+    same chunks; a boundary can shift where the one-shot split would have
+    used a separator that the rolling buffer does not contain.
+
+    Args:
+        file_path: Path to a PDF, Markdown, or text file.
+        characters_to_anonymize: Chunk size in characters.
+        chunk_overlap: Overlap size between chunks.
+        pages_per_batch: PDF pages converted per step.
+
+    Yields:
+        Chunk strings, in document order.
+    """
+    splitter = _splitter_for(file_path, characters_to_anonymize, chunk_overlap)
+    # Text blocks no larger than a chunk keep the buffer near two chunks.
+    block_chars = min(TEXT_READ_BLOCK_CHARS, max(characters_to_anonymize, 1))
+    yield from split_text_stream(
+        iter_document_text(file_path, pages_per_batch, block_chars),
+        splitter,
+        characters_to_anonymize,
+    )
+
+
 def load_and_extract_text_from_file(
-    file_path: str, characters_to_anonymize: int = 100000, chunk_overlap: int = 0
+    file_path: str,
+    characters_to_anonymize: int = 100000,
+    chunk_overlap: int = 0,
+    extract_workers: int = 1,
 ) -> Tuple[str, List[str]]:
     """
     Loads a file and extracts text, returning the full text and chunked text.
@@ -66,6 +347,7 @@ def load_and_extract_text_from_file(
         file_path (str): The path to the file.
         characters_to_anonymize: Number of characters to process in each chunk.
         chunk_overlap: Overlap size between chunks.
+        extract_workers: Processes for PDF page conversion (PDF only).
 
     Returns:
         Tuple[str, List[str]]: The full text as a string, and a list of chunk strings.
@@ -73,19 +355,12 @@ def load_and_extract_text_from_file(
     path = Path(file_path)
     file_extension = path.suffix.lower()
 
-    if is_rejected_spreadsheet(file_path):
-        raise rejected_spreadsheet_error(file_path)
-    if is_tabular_path(file_path):
-        if file_extension == ".xlsx":
-            raise ValueError(EXCEL_EXTRA_MESSAGE)
-        raise ValueError(
-            f"{file_extension} files must be loaded as tables, not as plain text."
-        )
+    _reject_tabular(file_path)
 
     try:
         if file_extension == ".pdf":
             return load_and_extract_text_from_pdf(
-                file_path, characters_to_anonymize, chunk_overlap
+                file_path, characters_to_anonymize, chunk_overlap, extract_workers
             )
         elif file_extension == ".md":
             with open(file_path, "r", encoding="utf-8") as f:
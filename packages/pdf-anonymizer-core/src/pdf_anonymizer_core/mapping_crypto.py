@@ -411,6 +411,39 @@ def decrypt_mapping(
     return {str(k): str(v) for k, v in data.items()}
 
 
+def new_store_salt() -> bytes:
+    """Random salt for :func:`derive_store_key`."""
+    return secrets.token_bytes(_SALT_LEN)
+
+
+def derive_store_key(
+    passphrase: str,
+    salt: bytes,
+    kdf_params: Mapping[str, int] | None = None,
+) -> bytes:
+    """Argon2id key for a mapping store (``mapping_store.SQLiteMappingStore``).
+
+    Same KDF and default parameters as :func:`encrypt_mapping`. The store
+    keeps the key for as long as it is open, so it is returned as ``bytes``.
+    """
+    if not passphrase:
+        raise ValueError("A non-empty passphrase is required to encrypt a mapping.")
+    if len(salt) != _SALT_LEN:
+        raise ValueError("Mapping store salt has an unexpected length.")
+    params = {
+        "iterations": DEFAULT_ARGON2_ITERATIONS,
+        "lanes": DEFAULT_ARGON2_LANES,
+        "memory_cost": DEFAULT_ARGON2_MEMORY,
+    }
+    if kdf_params:
+        params.update({k: int(v) for k, v in kdf_params.items()})
+    params = _validate_kdf_params(VERSION, params)
+    with SecureBytes(passphrase.encode("utf-8")) as password:
+        with SecureBytes(_KEY_LEN) as key:
+            _derive_key_argon2id(password, salt, params, key)
+            return bytes(key.view())
+
+
 def resolve_mapping_passphrase(explicit: str | None = None) -> str | None:
     """CLI flag wins; otherwise ``ANONYMIZER_MAPPING_KEY``."""
     if explicit:
@@ -0,0 +1,431 @@
+"""Indexed, incrementally updated store for cross-document mappings.
+
+A JSON seed map (``--mapping-in map.json``) is read whole, every placeholder
+is parsed again by ``seed_placeholder_state``, and each file writes a fresh
+full copy. That is O(map) per file. A ``MappingStore`` keeps the
+original → written entries and the placeholder counters (highest
+``TYPE_n`` per type, highest ``.v_n`` per placeholder) in one place, and a
+file only reads and writes what it touches:
+
+- ``lookup``: exact originals (the file's entity texts and base forms);
+- ``containing``: originals holding every word of a base form, the
+  candidates for the "Smith" → "John Smith" base-form merge;
+- ``counters``: where numbering continues;
+- ``upsert``: the file's new entries, counters raised in the same
+  transaction.
+
+``SQLiteMappingStore`` is the implementation: one indexed row per entry,
+a word index for ``containing``, and the counters, in a WAL-mode SQLite
+file created ``0600``. Use ``transaction()`` around read-number-write so
+two runs sharing a store never hand out the same number.
+
+With a passphrase the store is encrypted at rest: originals are sealed
+with AES-256-GCM under an Argon2id key (see ``mapping_crypto``), and exact
+and word lookups go through HMAC-SHA256 blind indexes. Written forms and
+type names stay readable; they already appear in the anonymized files.
+Blind word indexes still show how often a word occurs across entries.
+
+Base forms are merged against stored originals that contain every word of
+the base form, so a merge inside a word ("Ann" into "Anna Lee"), which a
+JSON seed would make, does not happen.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import hmac
+import logging
+import os
+import re
+import secrets
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from pdf_anonymizer_core.mapping_crypto import derive_store_key, new_store_salt
+from pdf_anonymizer_core.secure_io import PRIVATE_FILE_MODE, ensure_private_dir
+from pdf_anonymizer_core.utils import seed_placeholder_state
+
+STORE_SCHEMA_VERSION = 1
+
+# (type counts, variation counts), as from seed_placeholder_state.
+PlaceholderCounts = Tuple[Dict[str, int], Dict[str, int]]
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+_CHECK_PLAINTEXT = b"pdf-anonymizer-mapping-store"
+_NONCE_LEN = 12
+# Bound parameters per IN (...) query.
+_BATCH = 500
+_WORD = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    lookup BLOB NOT NULL UNIQUE,
+    original BLOB NOT NULL,
+    written TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS words (
+    word BLOB NOT NULL,
+    entry_id INTEGER NOT NULL,
+    PRIMARY KEY (word, entry_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS counters (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (kind, name)
+) WITHOUT ROWID;
+"""
+
+
+def is_mapping_store(path: Union[str, os.PathLike]) -> bool:
+    """True if ``path`` is a SQLite file (a store), not a JSON mapping."""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _batches(items: List[str]) -> Iterator[List[str]]:
+    for start in range(0, len(items), _BATCH):
+        yield items[start : start + _BATCH]
+
+
+class MappingStore(ABC):
+    """Persistent original → written entries plus placeholder counters."""
+
+    @abstractmethod
+    def lookup(self, originals: Iterable[str]) -> Dict[str, str]:
+        """Stored entries for exactly these originals."""
+
+    @abstractmethod
+    def containing(self, fragments: Iterable[str]) -> Dict[str, str]:
+        """Stored entries whose original contains one of ``fragments``."""
+
+    @abstractmethod
+    def counters(self) -> PlaceholderCounts:
+        """Highest number per type and highest variation per placeholder."""
+
+    @abstractmethod
+    def upsert(self, orig_to_written: Dict[str, str]) -> None:
+        """Add or overwrite entries and raise the counters to match."""
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Every entry, oldest first."""
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Hold the store for a read-number-write sequence."""
+        yield
+
+    def seed_for(self, entities: Iterable[dict]) -> Dict[str, str]:
+        """The part of the store a file's ``build_mapping`` can see.
+
+        Exact entries for the entities' texts and base forms, plus every
+        stored original a base form could merge into.
+        """
+        texts = set()
+        base_forms = set()
+        for entity in entities:
+            texts.add(entity["text"])
+            if entity.get("base_form"):
+                base_forms.add(entity["base_form"])
+        found = self.lookup(texts | base_forms)
+        found.update(self.containing(base_forms))
+        return found
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteMappingStore(MappingStore):
+    """Mapping store in a WAL-mode SQLite file.
+
+    Args:
+        path: Database file. Created (``0600``) when missing.
+        passphrase: Encrypts a new store; required to open an encrypted one.
+            Ignored, with a log line, for an existing plaintext store.
+        busy_timeout: Seconds to wait for another process's write lock.
+
+    Raises:
+        ValueError: Missing or wrong passphrase for an encrypted store, or a
+            file that is not a mapping store.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        passphrase: Optional[str] = None,
+        *,
+        busy_timeout: float = 30.0,
+    ):
+        self.path = str(path)
+        self.busy_timeout = busy_timeout
+        self.lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._depth = 0
+        if not os.path.exists(self.path):
+            ensure_private_dir(Path(self.path).parent)
+            # SQLite gives the -wal / -shm files the database's mode.
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL, PRIVATE_FILE_MODE)
+                os.close(fd)
+            except FileExistsError:
+                pass
+        elif not is_mapping_store(self.path) and os.path.getsize(self.path):
+            raise ValueError(f"{self.path} is not a mapping store.")
+        with self.lock:
+            try:
+                self._connection().executescript(_SCHEMA)
+            except sqlite3.DatabaseError as exc:
+                raise ValueError(f"{self.path} is not a mapping store.") from exc
+            self._entry_key, self._index_key = self._open_keys(passphrase)
+        atexit.register(self.close)
+
+    def __getstate__(self) -> dict:
+        # Sent to a coordinator process: no connection or lock.
+        state = self.__dict__.copy()
+        state.update(lock=None, _conn=None, _pid=None, _depth=0)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not cross fork(); reopen in a child process.
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _meta(self, name: str) -> Optional[bytes]:
+        row = (
+            self._connection()
+            .execute("SELECT value FROM meta WHERE name = ?", (name,))
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def _open_keys(
+        self, passphrase: Optional[str]
+    ) -> Tuple[Optional[bytes], Optional[bytes]]:
+        conn = self._connection()
+        version = self._meta("schema_version")
+        salt = self._meta("salt")
+        if version is None:
+            rows = [("schema_version", str(STORE_SCHEMA_VERSION).encode())]
+            keys: Tuple[Optional[bytes], Optional[bytes]] = (None, None)
+            if passphrase:
+                salt = new_store_salt()
+                keys = self._derive(passphrase, salt)
+                check = self._seal(_CHECK_PLAINTEXT, keys[0])
+                rows += [("salt", salt), ("check", check)]
+            conn.executemany("INSERT OR IGNORE INTO meta VALUES (?, ?)", rows)
+            return keys
+        if int(version) != STORE_SCHEMA_VERSION:
+            raise ValueError("Unsupported mapping store version.")
+        if salt is None:
+            if passphrase:
+                logging.info(f"Mapping store {self.path} is not encrypted.")
+            return None, None
+        if not passphrase:
+            raise ValueError(
+                "This mapping store is encrypted. Pass --mapping-passphrase or "
+                "set ANONYMIZER_MAPPING_KEY."
+            )
+        keys = self._derive(passphrase, salt)
+        try:
+            self._unseal(self._meta("check") or b"", keys[0])
+        except (InvalidTag, ValueError) as exc:
+            raise ValueError(
+                "Could not open the mapping store. Check the passphrase."
+            ) from exc
+        return keys
+
+    @staticmethod
+    def _derive(passphrase: str, salt: bytes) -> Tuple[bytes, bytes]:
+        master = derive_store_key(passphrase, salt)
+        return (
+            hmac.new(master, b"entries", hashlib.sha256).digest(),
+            hmac.new(master, b"index", hashlib.sha256).digest(),
+        )
+
+    @staticmethod
+    def _seal(data: bytes, key: Optional[bytes]) -> bytes:
+        nonce = secrets.token_bytes(_NONCE_LEN)
+        return nonce + AESGCM(key).encrypt(nonce, data, b"original")
+
+    @staticmethod
+    def _unseal(blob: bytes, key: Optional[bytes]) -> bytes:
+        if len(blob) <= _NONCE_LEN:
+            raise ValueError("Sealed value is too short.")
+        return AESGCM(key).decrypt(blob[:_NONCE_LEN], blob[_NONCE_LEN:], b"original")
+
+    @property
+    def encrypted(self) -> bool:
+        return self._entry_key is not None
+
+    def _index(self, text: str) -> Union[str, bytes]:
+        if self._index_key is None:
+            return text
+        return hmac.new(self._index_key, text.encode("utf-8"), hashlib.sha256).digest()
+
+    def _word_keys(self, text: str) -> Set[Union[str, bytes]]:
+        return {self._index(word) for word in _WORD.findall(text.casefold())}
+
+    def _stored_original(self, original: str) -> Union[str, bytes]:
+        if self._entry_key is None:
+            return original
+        return self._seal(original.encode("utf-8"), self._entry_key)
+
+    def _original(self, stored: Union[str, bytes]) -> str:
+        if self._entry_key is None:
+            return str(stored)
+        return self._unseal(bytes(stored), self._entry_key).decode("utf-8")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self.lock:
+            conn = self._connection()
+            if self._depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                conn.execute("COMMIT")
+
+    def lookup(self, originals: Iterable[str]) -> Dict[str, str]:
+        keys = {self._index(text): text for text in originals if text}
+        found: Dict[str, str] = {}
+        with self.lock:
+            conn = self._connection()
+            for batch in _batches(list(keys)):
+                marks = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT lookup, written FROM entries WHERE lookup IN ({marks})",
+                    batch,
+                )
+                for lookup, written in rows:
+                    found[keys[lookup]] = written
+        return found
+
+    def containing(self, fragments: Iterable[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        with self.lock:
+            conn = self._connection()
+            for fragment in set(fragments):
+                words = sorted(self._word_keys(fragment))
+                if not words or len(words) > _BATCH:
+                    continue
+                marks = ",".join("?" * len(words))
+                rows = conn.execute(
+                    "SELECT original, written FROM entries WHERE id IN ("
+                    f"SELECT entry_id FROM words WHERE word IN ({marks}) "
+                    "GROUP BY entry_id HAVING COUNT(*) = ?)",
+                    [*words, len(words)],
+                )
+                for stored, written in rows:
+                    original = self._original(stored)
+                    if fragment in original:
+                        found[original] = written
+        return found
+
+    def counters(self) -> PlaceholderCounts:
+        counts: Dict[str, int] = {}
+        variations: Dict[str, int] = {}
+        with self.lock:
+            conn = self._connection()
+            for kind, name, value in conn.execute(
+                "SELECT kind, name, value FROM counters"
+            ):
+                (counts if kind == "type" else variations)[name] = value
+        return counts, variations
+
+    def upsert(self, orig_to_written: Dict[str, str]) -> None:
+        if not orig_to_written:
+            return
+        _mapping, _bases, counts, variations = seed_placeholder_state(orig_to_written)
+        with self.transaction():
+            conn = self._connection()
+            for original, written in orig_to_written.items():
+                lookup = self._index(original)
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO entries (lookup, original, written) "
+                    "VALUES (?, ?, ?)",
+                    (lookup, self._stored_original(original), written),
+                )
+                if cursor.rowcount == 0:
+                    conn.execute(
+                        "UPDATE entries SET written = ? WHERE lookup = ?",
+                        (written, lookup),
+                    )
+                    continue
+                entry_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT OR IGNORE INTO words (word, entry_id) VALUES (?, ?)",
+                    [(word, entry_id) for word in self._word_keys(original)],
+                )
+            conn.executemany(
+                "INSERT INTO counters (kind, name, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(kind, name) DO UPDATE SET "
+                "value = max(value, excluded.value)",
+                [("type", name, value) for name, value in counts.items()]
+                + [("variation", name, value) for name, value in variations.items()],
+            )
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        with self.lock:
+            rows = (
+                self._connection()
+                .execute("SELECT original, written FROM entries ORDER BY id")
+                .fetchall()
+            )
+        for stored, written in rows:
+            yield self._original(stored), written
+
+    def __len__(self) -> int:
+        with self.lock:
+            return (
+                self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            )
+
+    def close(self) -> None:
+        with self.lock:
+            if self._conn is not None and self._pid == os.getpid():
+                try:
+                    self._conn.close()
+                except sqlite3.Error as e:
+                    logging.warning(f"Failed to close mapping store: {e}")
+            self._conn = None
+            self._pid = None
@@ -0,0 +1,127 @@
+"""Per-model token limits and token-budget chunk sizing.
+
+``characters_to_anonymize`` is a character count; models are limited in
+tokens, both for what they read (context window) and for what they write
+(maximum output). A chunk that is too large for the output limit gets an
+entity list cut off mid-JSON, which used to fail the whole chunk.
+
+This module holds a small capability table (context window, maximum output
+tokens, characters per token) keyed by model-name prefix, and
+``token_budget_chunk_size`` which turns it into the largest chunk that fits
+both limits. Token counts are estimated from character counts; no
+tokenizer package is needed. The estimate is deliberately low on
+characters per token, since PII (numbers, e-mail addresses, foreign names)
+tokenizes worse than prose.
+
+``call_llm`` passes ``max_output_tokens`` from the table to the provider and
+splits a chunk in two when a response is still cut off.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from pdf_anonymizer_core.conf import (
+    MIN_TOKEN_BUDGET_CHUNK,
+    TOKEN_BUDGET_OUTPUT_RATIO,
+    TOKEN_BUDGET_SAFETY,
+    get_provider_and_model_name,
+)
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    """Token limits of one model family."""
+
+    context_tokens: int
+    max_output_tokens: int
+    chars_per_token: float = 3.5
+
+
+# Longest matching prefix of the lower-cased model id wins. For
+# "vendor/model" ids (OpenRouter, Hugging Face) the part after the last
+# "/" is matched. Anthropic outputs stay at 16k: the SDK refuses
+# non-streaming requests whose max_tokens implies a very long response.
+MODEL_LIMITS: Tuple[Tuple[str, ModelLimits], ...] = (
+    ("gemini-2.5", ModelLimits(1_048_576, 65_536, 4.0)),
+    ("gemini-2.0", ModelLimits(1_048_576, 8_192, 4.0)),
+    ("gemini-1.5", ModelLimits(1_048_576, 8_192, 4.0)),
+    ("gemini-pro", ModelLimits(32_768, 8_192, 4.0)),
+    ("gpt-5", ModelLimits(400_000, 128_000, 4.0)),
+    ("gpt-4.1", ModelLimits(1_047_576, 32_768, 4.0)),
+    ("gpt-4o", ModelLimits(128_000, 16_384, 4.0)),
+    ("gpt-oss", ModelLimits(131_072, 32_768)),
+    ("claude-4", ModelLimits(200_000, 16_384)),
+    ("claude-sonnet-4", ModelLimits(200_000, 16_384)),
+    ("claude-opus-4", ModelLimits(200_000, 16_384)),
+    ("claude-3-7", ModelLimits(200_000, 16_384)),
+    ("claude-3-5", ModelLimits(200_000, 8_192)),
+    ("claude", ModelLimits(200_000, 4_096)),
+    ("mistral-7b-instruct", ModelLimits(8_192, 2_048)),
+    ("zephyr-7b", ModelLimits(8_192, 2_048)),
+)
+
+# Whole-provider entries, checked before the prefix table. Ollama serves
+# models with a 4k window unless num_ctx is raised, whatever the model
+# itself supports.
+PROVIDER_LIMITS: Dict[str, ModelLimits] = {
+    "ollama": ModelLimits(4_096, 1_024),
+}
+# Used when no prefix matches.
+DEFAULT_MODEL_LIMITS = ModelLimits(32_768, 4_096)
+
+
+def limits_for(model_name: str) -> ModelLimits:
+    """Token limits for ``model_name`` (alias or ``provider/model``).
+
+    Raises:
+        ValueError: When the model string cannot be resolved to a provider.
+    """
+    return limits_for_model(*get_provider_and_model_name(model_name))
+
+
+def limits_for_model(provider_name: str, model_id: str) -> ModelLimits:
+    """Token limits for an already resolved provider and model id."""
+    if provider_name in PROVIDER_LIMITS:
+        return PROVIDER_LIMITS[provider_name]
+    name = model_id.rsplit("/", 1)[-1].lower()
+    best = ""
+    found = DEFAULT_MODEL_LIMITS
+    for prefix, limits in MODEL_LIMITS:
+        if name.startswith(prefix) and len(prefix) > len(best):
+            best, found = prefix, limits
+    return found
+
+
+def estimate_tokens(text: str, limits: ModelLimits) -> int:
+    """Token count estimate for ``text`` under ``limits.chars_per_token``."""
+    return math.ceil(len(text) / limits.chars_per_token)
+
+
+def token_budget_chunk_size(
+    model_name: str,
+    prompt_template: str,
+    *,
+    output_ratio: float = TOKEN_BUDGET_OUTPUT_RATIO,
+    safety: float = TOKEN_BUDGET_SAFETY,
+) -> int:
+    """Largest chunk, in characters, that fits the model's token limits.
+
+    Two bounds, the smaller wins:
+
+    - input: prompt + chunk must fit the context window with the maximum
+      output still reserved;
+    - output: the entity list, estimated as ``output_ratio`` characters of
+      JSON per input character, must fit the maximum output.
+
+    Both are scaled by ``safety``. The result is never below
+    ``conf.MIN_TOKEN_BUDGET_CHUNK``.
+    """
+    limits = limits_for(model_name)
+    prompt_tokens = estimate_tokens(prompt_template.format(text=""), limits)
+    input_tokens = limits.context_tokens - limits.max_output_tokens - prompt_tokens
+    by_input = input_tokens * limits.chars_per_token
+    by_output = limits.max_output_tokens * limits.chars_per_token / output_ratio
+    return max(int(min(by_input, by_output) * safety), MIN_TOKEN_BUDGET_CHUNK)
@@ -0,0 +1,93 @@
+"""Regex pre-masking of chunk text before it goes to the LLM.
+
+The regex stage already finds e-mail addresses, IBANs, card numbers and
+the other structured identifiers. With pre-masking on, each regex hit is
+swapped for a short typed token (``[EMAIL_1]``, ``[IBAN_2]``) in the text
+sent to the model, so the prompt is shorter, the model does not spend
+output tokens re-reporting those values, and fewer of them reach a
+third-party provider.
+
+LLM entities are matched back by text, not by offset: tokens inside a
+returned entity (``"Ann Lee <[EMAIL_1]>"``) are replaced with the original
+values, and an entity that is only a token is dropped because its regex hit
+is already collected. A chunk that already contains a token-shaped string
+is sent unmasked.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pdf_anonymizer_core.spans import Span, apply_spans, pick_non_overlapping
+
+_TOKEN_SHAPE = re.compile(r"\[[A-Z][A-Z0-9_]*_\d+\]")
+
+
+@dataclass
+class PremaskedChunk:
+    """Masked chunk text and the token -> original value table."""
+
+    text: str
+    originals: Dict[str, str]
+
+    def __post_init__(self) -> None:
+        self._pattern = re.compile(
+            "|".join(
+                re.escape(token)
+                for token in sorted(self.originals, key=len, reverse=True)
+            )
+        )
+        self._labels = {token[1:-1] for token in self.originals}
+
+    def _unmask(self, value: str) -> str:
+        return self._pattern.sub(lambda match: self.originals[match.group(0)], value)
+
+    def restore(self, entities: Iterable[dict]) -> List[dict]:
+        """LLM entities with tokens put back; token-only entities dropped."""
+        restored: List[dict] = []
+        for entity in entities:
+            text = entity.get("text") or ""
+            if text.strip() in self.originals or text.strip() in self._labels:
+                continue
+            entity = dict(entity, text=self._unmask(text))
+            if entity.get("base_form"):
+                entity["base_form"] = self._unmask(entity["base_form"])
+            restored.append(entity)
+        return restored
+
+
+def premask_chunk(text: str, regex_entities: List[dict]) -> Optional[PremaskedChunk]:
+    """Swap regex hits in ``text`` for typed tokens.
+
+    ``regex_entities`` are ``extract_entities_via_regex`` results for this
+    same text (they carry ``start`` / ``end``). Overlapping hits keep the
+    longest, as in replacement. The same value always gets the same token.
+
+    Returns:
+        The masked chunk, or None when there is nothing to mask or the text
+        already contains something shaped like a token.
+    """
+    spans: List[Span] = [
+        (entity["start"], entity["end"], entity["text"])
+        for entity in regex_entities
+        if "start" in entity and "end" in entity
+    ]
+    if not spans or _TOKEN_SHAPE.search(text):
+        return None
+    types: Dict[Tuple[int, int], str] = {}
+    for entity in regex_entities:
+        if "start" in entity and "end" in entity:
+            types.setdefault((entity["start"], entity["end"]), entity["type"].upper())
+    kept = sorted(pick_non_overlapping(spans))
+    counts: Dict[str, int] = {}
+    tokens: Dict[str, str] = {}
+    for start, end, value in kept:
+        if value in tokens:
+            continue
+        entity_type = types[(start, end)]
+        counts[entity_type] = counts.get(entity_type, 0) + 1
+        tokens[value] = f"[{entity_type}_{counts[entity_type]}]"
+    masked = apply_spans(text, kept, tokens)
+    return PremaskedChunk(masked, {token: value for value, token in tokens.items()})
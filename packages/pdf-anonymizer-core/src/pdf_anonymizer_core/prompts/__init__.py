@@ -11,8 +11,28 @@ Exposes ready-to-use templates:
 Example:
     from pdf_anonymizer_core.prompts import detailed
     prompt = detailed.prompt_template
+
+Each module also sets ``prompt_version``. ``prompt_version_for`` maps a
+template to that version for the entity cache; unknown (custom) templates
+get a hash of their whitespace-normalized text.
 """
 
+import hashlib
+
 from . import detailed, hipaa, simple
 
-__all__ = ["detailed", "hipaa", "simple"]
+__all__ = ["detailed", "hipaa", "prompt_version_for", "simple"]
+
+_VERSIONS = {
+    module.prompt_template: f"{name}:{module.prompt_version}"
+    for name, module in (("detailed", detailed), ("hipaa", hipaa), ("simple", simple))
+}
+
+
+def prompt_version_for(prompt_template: str) -> str:
+    """Version label of a template: ``detailed:1`` or ``custom:<sha256>``."""
+    version = _VERSIONS.get(prompt_template)
+    if version is not None:
+        return version
+    normalized = " ".join(prompt_template.split())
+    return "custom:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
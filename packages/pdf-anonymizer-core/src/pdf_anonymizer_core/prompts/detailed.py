@@ -11,6 +11,10 @@ Use this prompt (via pdf_anonymizer_core.prompts.detailed.prompt_template)
 when you want maximum accuracy (pairs well with BEST_QUALITY profile).
 """
 
+# Entity-cache version. Bump when a change alters what the model should
+# return; wording and whitespace edits can keep it.
+prompt_version = "1"
+
 prompt_template = """
     You are an expert in identifying Personally Identifiable Information (PII) with high accuracy and contextual understanding.
     Your task is to read the text below and identify all PII entities, including their variations.
@@ -7,6 +7,10 @@ This is a helper for coverage. It is not a legal determination that the output
 meets the HIPAA Safe Harbor standard.
 """
 
+# Entity-cache version. Bump when a change alters what the model should
+# return; wording and whitespace edits can keep it.
+prompt_version = "1"
+
 prompt_template = """
     You are helping hide health-related personal details in a document.
     This is a coverage aid, not a legal certification.
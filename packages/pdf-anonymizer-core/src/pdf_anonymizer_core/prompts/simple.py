@@ -8,6 +8,10 @@ Use this prompt (via pdf_anonymizer_core.prompts.simple.prompt_template)
 for speed/cost sensitive workloads (pairs well with BEST_SPEED or BEST_COST).
 """
 
+# Entity-cache version. Bump when a change alters what the model should
+# return; wording and whitespace edits can keep it.
+prompt_version = "1"
+
 prompt_template = """
     You are an expert in identifying Personally Identifiable Information (PII).
     Your task is to read the text below and identify all PII entities.
@@ -48,6 +48,15 @@ and are used for placeholder generation (EMAIL_1, IBAN_7, DRIVERS_LICENSE_CA_2,
 Only the keys you provide are used; there is no automatic merging with defaults
 unless you build your dict from DEFAULT_REGEX_PATTERNS.
 
+PRECOMPILED SCANNER
+-------------------
+``RegexScanner`` compiles a pattern dict once. For short inputs (table cells,
+small chunks) an ``re2.Set`` first reports which patterns match anywhere in
+one pass, and only those patterns are run with ``finditer``. Long inputs skip
+the pre-pass because most patterns hit somewhere in them anyway.
+``get_regex_scanner`` caches one scanner per distinct pattern dict, and
+``extract_entities_via_regex`` goes through it.
+
 The function is intentionally tiny. It only does structural scanning, then
 runs a cheap checksum when one exists (Luhn, IBAN mod-97, VIN check digit,
 and a few national-ID checks). Failures are kept and relabeled TYPE_LIKE
@@ -57,12 +66,20 @@ responsibility of the LLM stage that always follows.
 """
 
 import logging
-from typing import Dict, List, TypedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
 
 import re2 as re
 
 from pdf_anonymizer_core.validators import has_checksum, like_type, passes_checksum
 
+# Inputs up to this many characters go through the re2.Set pre-pass. Longer
+# text usually triggers most patterns, so the extra pass would not pay off.
+SET_PREFILTER_MAX_CHARS: int = 8192
+
+# DFA budget for the combined set (the RE2 default is 8 MiB).
+_SET_MAX_MEM: int = 64 << 20
+
 
 class EntityDict(TypedDict):
     text: str
@@ -70,35 +87,61 @@ class EntityDict(TypedDict):
     base_form: str
 
 
-def extract_entities_via_regex(text: str, patterns: Dict[str, str]) -> List[EntityDict]:
-    """
-    Scans the text for PII using pre-configured regular expressions (RE2 engine).
-    Matches that fail a registered checksum (see validators.py) are kept and
-    labeled ``<TYPE>_LIKE`` (for example ``IBAN_LIKE``).
+class RegexScanner:
+    """Precompiled first-stage scanner for one ``type -> pattern`` dict.
 
-    Args:
-        text: Input text to analyze.
-        patterns: Dictionary mapping entity type strings (e.g. "IBAN", "SSN_US",
-            "CRYPTO_ETH") to RE2-compatible regex pattern strings.
-
-    Returns:
-        A list of EntityDict representing identified PII. "type" is always
-        upper-cased. "base_form" currently equals the matched text (core
-        consolidation may later promote variations to a longer base form).
-        Each hit also includes chunk-local ``start`` / ``end`` offsets.
+    Invalid patterns are logged once and skipped. Results are identical to
+    running every pattern in dict order: same entities, same order.
     """
-    entities: List[EntityDict] = []
 
-    for entity_type, pattern_str in patterns.items():
+    def __init__(self, patterns: Dict[str, str]):
+        self._compiled: List[Tuple[str, "re._Regexp"]] = []
+        for entity_type, pattern_str in patterns.items():
+            try:
+                compiled_pattern = re.compile(pattern_str)
+            except re.error as e:
+                logging.error(
+                    f"Invalid regex pattern configured for {entity_type}: {e}"
+                )
+                continue
+            self._compiled.append((entity_type.upper(), compiled_pattern))
+        self._set = self._build_set()
+
+    def _build_set(self) -> Optional["re.Set"]:
+        if len(self._compiled) < 2:
+            return None
+        options = re.Options()
+        options.max_mem = _SET_MAX_MEM
+        pattern_set = re.Set.SearchSet(options)
         try:
-            compiled_pattern = re.compile(pattern_str)
+            for _entity_type, compiled_pattern in self._compiled:
+                pattern_set.Add(compiled_pattern.pattern)
+            pattern_set.Compile()
+        except re.error as e:
+            logging.warning(f"Regex set pre-pass disabled: {e}")
+            return None
+        return pattern_set
+
+    def _candidate_ids(self, text: str) -> Iterable[int]:
+        if self._set is None or len(text) > SET_PREFILTER_MAX_CHARS:
+            return range(len(self._compiled))
+        return sorted(self._set.Match(text) or ())
+
+    def scan(self, text: str) -> List[EntityDict]:
+        """Run every pattern that can match ``text``. See extract_entities_via_regex."""
+        entities: List[EntityDict] = []
+        if not text:
+            return entities
+
+        for index in self._candidate_ids(text):
+            entity_type, compiled_pattern = self._compiled[index]
             for match in compiled_pattern.finditer(text):
                 matched_text = match.group(0)
                 # Filter out empty or whitespace-only matches
                 if not matched_text.strip():
                     continue
 
-                entity_type_upper = entity_type.upper()
+                entity_type_upper = entity_type
                 if has_checksum(entity_type_upper) and not passes_checksum(
                     entity_type_upper, matched_text
                 ):
@@ -120,7 +163,39 @@ def extract_entities_via_regex(text: str, patterns: Dict[str, str]) -> List[Enti
                         "end": match.end(),
                     }
                 )
-        except re.error as e:
-            logging.error(f"Invalid regex pattern configured for {entity_type}: {e}")
 
-    return entities
+        return entities
+
+    def scan_many(self, texts: Iterable[str]) -> List[List[EntityDict]]:
+        """``scan`` each text; one result list per input, in order."""
+        return [self.scan(text) for text in texts]
+
+
+@lru_cache(maxsize=32)
+def _scanner_for(items: Tuple[Tuple[str, str], ...]) -> RegexScanner:
+    return RegexScanner(dict(items))
+
+
+def get_regex_scanner(patterns: Dict[str, str]) -> RegexScanner:
+    """Shared ``RegexScanner`` for ``patterns`` (built once per distinct dict)."""
+    return _scanner_for(tuple(patterns.items()))
+
+
+def extract_entities_via_regex(text: str, patterns: Dict[str, str]) -> List[EntityDict]:
+    """
+    Scans the text for PII using pre-configured regular expressions (RE2 engine).
+    Matches that fail a registered checksum (see validators.py) are kept and
+    labeled ``<TYPE>_LIKE`` (for example ``IBAN_LIKE``).
+
+    Args:
+        text: Input text to analyze.
+        patterns: Dictionary mapping entity type strings (e.g. "IBAN", "SSN_US",
+            "CRYPTO_ETH") to RE2-compatible regex pattern strings.
+
+    Returns:
+        A list of EntityDict representing identified PII. "type" is always
+        upper-cased. "base_form" currently equals the matched text (core
+        consolidation may later promote variations to a longer base form).
+        Each hit also includes chunk-local ``start`` / ``end`` offsets.
+    """
+    return get_regex_scanner(patterns).scan(text)
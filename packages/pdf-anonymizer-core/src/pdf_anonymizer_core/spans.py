@@ -3,12 +3,29 @@
 Entity texts are found in the full document with the same word-boundary
 rules as before. Longer intervals win when two hits overlap, so
 ``John Doe`` is replaced and the inner ``John`` is left alone.
+
+``SpanLocator`` finds every entity text in one pass: the entity set is
+compiled once into a trie-shaped regex (a prefix automaton run by the C
+regex engine) instead of one pattern and one full scan per entity. It keeps
+the ``make_boundary_pattern`` rules and returns the same spans as
+``locate_spans``. ``replace_entities`` uses it by default;
+``write_replaced_entities`` writes the result to a file handle instead.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Dict, Iterable, List, Sequence, Tuple
+from bisect import bisect_left, bisect_right
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
 Span = Tuple[int, int, str]
 
@@ -34,42 +51,260 @@ def locate_spans(full_text: str, entity_texts: Iterable[str]) -> List[Span]:
     return spans
 
 
-def _overlaps(start: int, end: int, taken: Sequence[Tuple[int, int]]) -> bool:
-    for taken_start, taken_end in taken:
-        if not (end <= taken_start or start >= taken_end):
-            return True
-    return False
+def _is_word(char: str) -> bool:
+    # Same definition as ``\w`` for str patterns.
+    return char.isalnum() or char == "_"
+
+
+def _boundary_at(text: str, index: int) -> bool:
+    """True where ``\\b`` would match at ``index`` in ``text``."""
+    before = index > 0 and _is_word(text[index - 1])
+    after = index < len(text) and _is_word(text[index])
+    return before != after
+
+
+_TERMINAL = ""
+
+
+def trie_pattern(texts: Iterable[str]) -> str:
+    """Regex for a character trie. Greedy, so it matches the longest entry."""
+    trie: dict = {}
+    for text in texts:
+        node = trie
+        for char in text:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = True
+
+    def emit(node: dict) -> str:
+        branches = []
+        for char in sorted(key for key in node if key != _TERMINAL):
+            run = [char]
+            child = node[char]
+            # Collapse single-child chains into one literal.
+            while len(child) == 1 and _TERMINAL not in child:
+                ((next_char, child),) = child.items()
+                run.append(next_char)
+            branches.append(re.escape("".join(run)) + emit(child))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if _TERMINAL in node:
+            return f"(?:{body})?"
+        return body
+
+    return emit(trie)
+
+
+class SpanLocator:
+    """One-pass locator for a fixed set of entity texts.
+
+    Build once, then call :meth:`locate` on any number of texts (a document
+    or every cell of a table). Spans are returned in start order.
+    """
+
+    def __init__(self, entity_texts: Iterable[str]):
+        self.texts: List[str] = list(dict.fromkeys(t for t in entity_texts if t))
+        self._entities = set(self.texts)
+        self._lengths = sorted({len(text) for text in self.texts})
+        self._wrap = {
+            text: (_is_word(text[0]), _is_word(text[-1])) for text in self.texts
+        }
+        self._pattern = None
+        if self.texts:
+            try:
+                self._pattern = re.compile(f"(?=({trie_pattern(self.texts)}))")
+            except (re.error, RecursionError, OverflowError):
+                # Pathological nesting: fall back to one scan per entity.
+                self._pattern = None
+
+    def _candidates(self, longest: str) -> Iterable[str]:
+        """Entity texts that start where ``longest`` starts (its prefixes)."""
+        for length in self._lengths:
+            if length > len(longest):
+                break
+            prefix = longest[:length]
+            if prefix in self._entities:
+                yield prefix
+
+    def locate(self, full_text: str) -> List[Span]:
+        if not self.texts or not full_text:
+            return []
+        if self._pattern is None:
+            return sorted(locate_spans(full_text, self.texts))
+
+        spans: List[Span] = []
+        # finditer on one literal never returns overlapping hits of itself;
+        # track the last end per entity to keep that behaviour.
+        next_free: Dict[str, int] = {}
+        for match in self._pattern.finditer(full_text):
+            start = match.start(1)
+            for text in self._candidates(match.group(1)):
+                if start < next_free.get(text, 0):
+                    continue
+                end = start + len(text)
+                wrap_start, wrap_end = self._wrap[text]
+                if wrap_start and not _boundary_at(full_text, start):
+                    continue
+                if wrap_end and not _boundary_at(full_text, end):
+                    continue
+                spans.append((start, end, text))
+                next_free[text] = end
+        return spans
+
+
+class _DisjointIntervals:
+    """Accepted ``[start, end)`` intervals, sorted and non-overlapping.
+
+    Starts and ends are kept in small sorted buckets (the leaf level of a
+    B-tree), so both the overlap test and an insert are a couple of bisects
+    plus a short list shift. n spans cost O(n log n) instead of O(n^2).
+    """
+
+    _LOAD = 512
+
+    def __init__(self) -> None:
+        self._firsts: List[int] = []
+        self._starts: List[List[int]] = []
+        self._ends: List[List[int]] = []
+
+    def overlaps(self, start: int, end: int) -> bool:
+        # Intervals are disjoint, so the one with the largest start below
+        # ``end`` also has the largest end: it is the only one to check.
+        bucket = bisect_left(self._firsts, end) - 1
+        if bucket < 0:
+            return False
+        index = bisect_left(self._starts[bucket], end) - 1
+        return self._ends[bucket][index] > start
+
+    def add(self, start: int, end: int) -> None:
+        if not self._firsts:
+            self._firsts.append(start)
+            self._starts.append([start])
+            self._ends.append([end])
+            return
+        bucket = max(bisect_right(self._firsts, start) - 1, 0)
+        starts = self._starts[bucket]
+        ends = self._ends[bucket]
+        index = bisect_left(starts, start)
+        starts.insert(index, start)
+        ends.insert(index, end)
+        self._firsts[bucket] = starts[0]
+        if len(starts) > 2 * self._LOAD:
+            half = self._LOAD
+            self._starts[bucket : bucket + 1] = [starts[:half], starts[half:]]
+            self._ends[bucket : bucket + 1] = [ends[:half], ends[half:]]
+            self._firsts.insert(bucket + 1, starts[half])
 
 
 def pick_non_overlapping(spans: Sequence[Span]) -> List[Span]:
-    """Keep longest spans first; drop any that overlap an accepted span."""
+    """Keep longest spans first (leftmost on ties); drop any that overlap."""
     ordered = sorted(spans, key=lambda item: (item[1] - item[0], -item[0]), reverse=True)
     accepted: List[Span] = []
-    taken: List[Tuple[int, int]] = []
+    taken = _DisjointIntervals()
     for start, end, text in ordered:
-        if _overlaps(start, end, taken):
+        if taken.overlaps(start, end):
             continue
         accepted.append((start, end, text))
-        taken.append((start, end))
+        taken.add(start, end)
     return accepted
 
 
-def apply_spans(full_text: str, spans: Sequence[Span], mapping: Dict[str, str]) -> str:
-    """Write replacements from the end of the string so earlier offsets stay valid."""
-    pieces = list(full_text)
-    # Walk right-to-left so later slices do not shift earlier indexes.
-    for start, end, text in sorted(spans, key=lambda item: item[0], reverse=True):
+# Characters per write() when saving large documents.
+_WRITE_CHUNK = 1 << 20
+
+
+def write_slices(
+    out: TextIO, text: str, start: int = 0, end: Optional[int] = None
+) -> None:
+    """Write ``text[start:end]`` to ``out`` in bounded slices.
+
+    A long untouched stretch is never copied in one piece, and a whole
+    document is never encoded at once.
+    """
+    stop = len(text) if end is None else end
+    for offset in range(start, stop, _WRITE_CHUNK):
+        out.write(text[offset : min(offset + _WRITE_CHUNK, stop)])
+
+
+def _replacements(
+    spans: Sequence[Span], mapping: Dict[str, str]
+) -> Iterator[Tuple[int, int, str]]:
+    for start, end, text in sorted(spans, key=lambda item: item[0]):
         replacement = mapping.get(text)
-        if replacement is None:
-            continue
-        pieces[start:end] = list(replacement)
-    return "".join(pieces)
+        if replacement is not None:
+            yield start, end, replacement
 
 
-def replace_entities(full_text: str, entity_texts: Iterable[str], mapping: Dict[str, str]) -> str:
-    """Locate, resolve overlaps, and replace. Empty entity list is a no-op."""
-    texts = [text for text in entity_texts if text]
-    if not texts:
+def apply_spans(
+    full_text: str,
+    spans: Sequence[Span],
+    mapping: Dict[str, str],
+) -> str:
+    """Write replacements left to right from non-overlapping ``spans``.
+
+    Untouched text between spans is sliced, not exploded into characters, so
+    memory is proportional to the output.
+    """
+    pieces: List[str] = []
+    cursor = 0
+    for start, end, replacement in _replacements(spans, mapping):
+        pieces.append(full_text[cursor:start])
+        pieces.append(replacement)
+        cursor = end
+    if not pieces:
         return full_text
-    spans = pick_non_overlapping(locate_spans(full_text, texts))
-    return apply_spans(full_text, spans, mapping)
+    pieces.append(full_text[cursor:])
+    return "".join(pieces)
+
+
+def write_spans(
+    out: TextIO,
+    full_text: str,
+    spans: Sequence[Span],
+    mapping: Dict[str, str],
+) -> None:
+    """Like :func:`apply_spans`, but write the pieces straight to ``out``.
+
+    The replaced document is never built in memory.
+    """
+    cursor = 0
+    for start, end, replacement in _replacements(spans, mapping):
+        write_slices(out, full_text, cursor, start)
+        out.write(replacement)
+        cursor = end
+    write_slices(out, full_text, cursor)
+
+
+def _located(
+    full_text: str, entity_texts: Iterable[str], locator: Optional[SpanLocator]
+) -> List[Span]:
+    if locator is None:
+        locator = SpanLocator(text for text in entity_texts if text)
+    return pick_non_overlapping(locator.locate(full_text)) if locator.texts else []
+
+
+def replace_entities(
+    full_text: str,
+    entity_texts: Iterable[str],
+    mapping: Dict[str, str],
+    *,
+    locator: Optional[SpanLocator] = None,
+) -> str:
+    """Locate, resolve overlaps, and replace. Empty entity list is a no-op.
+
+    Pass a prebuilt ``locator`` to reuse it across many texts; otherwise one
+    is built for ``entity_texts``.
+    """
+    return apply_spans(full_text, _located(full_text, entity_texts, locator), mapping)
+
+
+def write_replaced_entities(
+    out: TextIO,
+    full_text: str,
+    entity_texts: Iterable[str],
+    mapping: Dict[str, str],
+    *,
+    locator: Optional[SpanLocator] = None,
+) -> None:
+    """:func:`replace_entities` written to ``out`` (see :func:`write_spans`)."""
+    write_spans(out, full_text, _located(full_text, entity_texts, locator), mapping)
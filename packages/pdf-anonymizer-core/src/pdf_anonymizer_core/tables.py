@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import logging
 import os
+import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Literal, Optional
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional
 
 from pdf_anonymizer_core import conf
-from pdf_anonymizer_core.spans import replace_entities
+from pdf_anonymizer_core.spans import (
+    SpanLocator,
+    make_boundary_pattern,
+    replace_entities,
+)
 
 TABLE_SUFFIXES = frozenset({".csv", ".xlsx"})
 REJECT_SPREADSHEET_SUFFIXES = frozenset({".xls", ".xlsm", ".ods", ".xlsb"})
@@ -36,6 +42,9 @@ _REJECT_MESSAGES = {
 }
 
 REGEX_CELL_KINDS = frozenset({"text", "formula"})
+# Characters read from the head of a streamed CSV to sniff its dialect, and
+# bytes per read while checking its encoding.
+_CSV_SNIFF_CHARS = 64 * 1024
 CellKind = Literal["empty", "bool", "number", "date", "text", "formula"]
 
 
@@ -61,6 +70,55 @@ class TableSheet:
     merge_ranges: list[str] = field(default_factory=list)
     # Per-row field counts from the source (0 = a truly empty line).
     row_widths: list[int] = field(default_factory=list)
+    # Lazily built lookups over ``cells``; rebuilt when the list grows or
+    # shrinks (see ``_indexes``). Not part of equality or repr.
+    _by_address: Optional[Dict[tuple[int, int], TableCell]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_row: Optional[Dict[int, list[TableCell]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _indexes(
+        self,
+    ) -> tuple[Dict[tuple[int, int], TableCell], Dict[int, list[TableCell]]]:
+        if (
+            self._by_address is None
+            or self._by_row is None
+            or self._indexed_count != len(self.cells)
+        ):
+            by_address: Dict[tuple[int, int], TableCell] = {}
+            by_row: Dict[int, list[TableCell]] = {}
+            for cell in self.cells:
+                by_address[(cell.row, cell.column)] = cell
+                by_row.setdefault(cell.row, []).append(cell)
+            for row_cells in by_row.values():
+                row_cells.sort(key=lambda item: item.column)
+            self._by_address = by_address
+            self._by_row = by_row
+            self._indexed_count = len(self.cells)
+        return self._by_address, self._by_row
+
+    def invalidate_index(self) -> None:
+        """Drop the cached lookups after editing ``cells`` in place."""
+        self._by_address = None
+        self._by_row = None
+
+    def address_index(self) -> Dict[tuple[int, int], TableCell]:
+        """``(row, column) -> cell`` for every stored cell. Do not mutate."""
+        return self._indexes()[0]
+
+    def cell_at(self, row: int, column: int) -> Optional[TableCell]:
+        return self._indexes()[0].get((row, column))
+
+    def row_cells(self, row: int) -> list[TableCell]:
+        """Stored cells of one row, in column order. Do not mutate."""
+        return self._indexes()[1].get(row, [])
+
+    def row_numbers(self) -> list[int]:
+        """Rows that have at least one stored cell, ascending."""
+        return sorted(self._indexes()[1])
 
 
 @dataclass
@@ -71,6 +129,14 @@ class TableDocument:
     had_bom: bool = False
     dialect: dict = field(default_factory=dict)
     sheets: list[TableSheet] = field(default_factory=list)
+    # Styled openpyxl workbook kept by ``load_xlsx(keep_workbook=True)``.
+    workbook: Any = field(default=None, repr=False, compare=False)
+
+    def close(self) -> None:
+        """Release the styled workbook, if one is attached."""
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
 
 
 def is_tabular_path(path: str) -> bool:
@@ -136,8 +202,47 @@ def iter_cells(doc: TableDocument) -> Iterable[TableCell]:
         yield from sheet.cells
 
 
-def _cells_by_address(sheet: TableSheet) -> Dict[tuple[int, int], TableCell]:
-    return {(cell.row, cell.column): cell for cell in sheet.cells}
+_TOKEN = re.compile(r"\w+")
+
+
+class CellTextIndex:
+    """Token inverted index over ``TableCell.search_text``.
+
+    A bounded entity hit (``locate_spans`` rules) always covers whole
+    ``\\w+`` tokens, so only cells holding the entity's rarest token can
+    contain it. Those few candidates are then checked exactly. Results are
+    kept per entity text. The index reflects the text at build time; build
+    it before replacements are applied.
+    """
+
+    def __init__(self, cells: Iterable[TableCell]):
+        self.cells: list[TableCell] = [cell for cell in cells if cell.search_text]
+        self._postings: Dict[str, list[int]] = {}
+        for position, cell in enumerate(self.cells):
+            for token in set(_TOKEN.findall(cell.search_text)):
+                self._postings.setdefault(token, []).append(position)
+        self._hits: Dict[str, list[TableCell]] = {}
+
+    def cells_containing(self, entity_text: str) -> list[TableCell]:
+        """Cells with at least one bounded occurrence of ``entity_text``."""
+        if not entity_text:
+            return []
+        hits = self._hits.get(entity_text)
+        if hits is not None:
+            return hits
+        tokens = set(_TOKEN.findall(entity_text))
+        if tokens:
+            postings = [self._postings.get(token, []) for token in tokens]
+            candidates = [self.cells[i] for i in min(postings, key=len)]
+        else:
+            candidates = self.cells
+        pattern = re.compile(make_boundary_pattern(entity_text))
+        hits = [cell for cell in candidates if pattern.search(cell.search_text)]
+        self._hits[entity_text] = hits
+        return hits
+
+    def __contains__(self, entity_text: object) -> bool:
+        return isinstance(entity_text, str) and bool(self.cells_containing(entity_text))
 
 
 def _dialect_kwargs(dialect: Any) -> dict:
@@ -190,11 +295,29 @@ def _sniff_dialect(text: str) -> Any:
         return csv.excel
 
 
+def _csv_cell(
+    sheet_name: str, row: int, column: int, value: str
+) -> Optional[TableCell]:
+    search_text, kind = _classify_csv_field(value)
+    if kind == "empty":
+        return None
+    return TableCell(
+        sheet=sheet_name,
+        row=row,
+        column=column,
+        search_text=search_text,
+        original=value,
+        kind=kind,
+        formula=value if kind == "formula" else None,
+    )
+
+
 def load_csv(path: str) -> TableDocument:
     file_size = os.path.getsize(path)
     if file_size > conf.MAX_TABLE_BYTES:
         raise ValueError(
-            f"Table file exceeds the size limit of {conf.MAX_TABLE_BYTES} bytes."
+            f"Table file exceeds the size limit of {conf.MAX_TABLE_BYTES} bytes. "
+            "Use streaming CSV mode (--stream-csv) for larger files."
         )
 
     raw = Path(path).read_bytes()
@@ -218,27 +341,16 @@ def load_csv(path: str) -> TableDocument:
     nonempty = 0
     for row_idx, row in enumerate(rows, start=1):
         for col_idx, value in enumerate(row, start=1):
-            search_text, kind = _classify_csv_field(value)
-            if kind != "empty":
-                nonempty += 1
-                if nonempty > conf.MAX_TABLE_CELLS:
-                    raise ValueError(
-                        "Table has more than "
-                        f"{conf.MAX_TABLE_CELLS} non-empty cells."
-                    )
-            if kind == "empty":
+            cell = _csv_cell(sheet.name, row_idx, col_idx, value)
+            if cell is None:
                 continue
-            sheet.cells.append(
-                TableCell(
-                    sheet=sheet.name,
-                    row=row_idx,
-                    column=col_idx,
-                    search_text=search_text,
-                    original=value,
-                    kind=kind,
-                    formula=value if kind == "formula" else None,
+            nonempty += 1
+            if nonempty > conf.MAX_TABLE_CELLS:
+                raise ValueError(
+                    f"Table has more than {conf.MAX_TABLE_CELLS} non-empty cells. "
+                    "Use streaming CSV mode (--stream-csv) for larger files."
                 )
-            )
+            sheet.cells.append(cell)
 
     return TableDocument(
         path=path,
@@ -250,6 +362,112 @@ def load_csv(path: str) -> TableDocument:
     )
 
 
+def _detect_csv_encoding(path: str) -> tuple[str, bool]:
+    """Same choice as ``_decode_csv_bytes``, decoded block by block."""
+    with open(path, "rb") as handle:
+        if handle.read(3) == b"\xef\xbb\xbf":
+            return "utf-8-sig", True
+    for encoding in ("utf-8", "cp1252"):
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(path, "rb") as handle:
+                while block := handle.read(_CSV_SNIFF_CHARS):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return encoding, False
+    return "latin-1", False
+
+
+def sniff_csv(path: str) -> TableDocument:
+    """Encoding, BOM and dialect of a CSV without reading its rows.
+
+    Returns a ``TableDocument`` with no sheets for ``iter_csv_row_batches``
+    and ``rewrite_csv``. The dialect and line terminator are sniffed from
+    the head of the file; there is no size or cell cap.
+    """
+    encoding, had_bom = _detect_csv_encoding(path)
+    with open(path, "r", encoding=encoding, newline="") as handle:
+        sample = handle.read(_CSV_SNIFF_CHARS)
+    dialect_kwargs = _dialect_kwargs(_sniff_dialect(sample))
+    dialect_kwargs["lineterminator"] = _detect_lineterminator(sample)
+    return TableDocument(
+        path=path,
+        kind="csv",
+        encoding=encoding,
+        had_bom=had_bom,
+        dialect=dialect_kwargs,
+    )
+
+
+def iter_csv_rows(source: TableDocument) -> Iterator[list[str]]:
+    """Rows of ``source.path`` one at a time, parsed with its dialect."""
+    reader_kwargs = {
+        key: value for key, value in source.dialect.items() if key != "lineterminator"
+    }
+    with open(source.path, "r", encoding=source.encoding, newline="") as handle:
+        yield from csv.reader(handle, **reader_kwargs)
+
+
+def iter_csv_row_batches(
+    source: TableDocument, rows_per_batch: int
+) -> Iterator[TableSheet]:
+    """``TableSheet`` slices of at most ``rows_per_batch`` rows.
+
+    Cells keep their absolute row numbers, so ``row_numbers()`` and cell
+    addresses match a full ``load_csv``. Only one slice is alive at a time.
+    """
+    rows_per_batch = max(rows_per_batch, 1)
+    sheet: Optional[TableSheet] = None
+    for row_idx, row in enumerate(iter_csv_rows(source), start=1):
+        if sheet is None:
+            sheet = TableSheet(name="Sheet1", hidden=False, max_row=0, max_column=0)
+        sheet.max_row = row_idx
+        sheet.max_column = max(sheet.max_column, len(row))
+        for col_idx, value in enumerate(row, start=1):
+            cell = _csv_cell(sheet.name, row_idx, col_idx, value)
+            if cell is not None:
+                sheet.cells.append(cell)
+        if row_idx % rows_per_batch == 0:
+            yield sheet
+            sheet = None
+    if sheet is not None:
+        yield sheet
+
+
+def rewrite_csv(
+    source: TableDocument,
+    dest_path: str,
+    orig_to_written: Dict[str, str],
+    entity_texts: Iterable[str],
+) -> int:
+    """Stream ``source`` to ``dest_path`` row by row with entities replaced.
+
+    Writes the same bytes ``save_csv`` would for a loaded and mapped
+    document: BOM, dialect and formula neutralization are kept. Returns the
+    number of rows written.
+    """
+    locator = SpanLocator(text for text in entity_texts if text)
+    encoding = "utf-8-sig" if source.had_bom else "utf-8"
+    dialect = dict(source.dialect) if source.dialect else _dialect_kwargs(csv.excel)
+    written = 0
+    with open(dest_path, "w", encoding=encoding, newline="") as handle:
+        writer = csv.writer(handle, **dialect)
+        for row_idx, row in enumerate(iter_csv_rows(source), start=1):
+            values = []
+            for col_idx, value in enumerate(row, start=1):
+                cell = _csv_cell("Sheet1", row_idx, col_idx, value)
+                if cell is not None and locator.texts:
+                    cell.search_text = replace_entities(
+                        cell.search_text, (), orig_to_written, locator=locator
+                    )
+                values.append(_csv_write_value(cell))
+            writer.writerow(values)
+            written = row_idx
+    return written
+
+
 def _check_table_file_size(path: str) -> None:
     file_size = os.path.getsize(path)
     if file_size > conf.MAX_TABLE_BYTES:
@@ -292,24 +510,61 @@ def _xlsx_assign_value(excel_cell: Any, value: Any) -> None:
         excel_cell.data_type = "s"
 
 
-def _open_xlsx_workbooks(path: str) -> tuple[Any, Any]:
+def _open_workbook(path: str, *, data_only: bool, read_only: bool) -> Any:
     from openpyxl import load_workbook
 
-    styled = None
     try:
-        # Two live workbooks + TableDocument is peak RAM; save_results reloads
-        # then save_xlsx opens styled again (five loads per run).
-        styled = load_workbook(path, data_only=False, read_only=False, keep_vba=False)
-        values = load_workbook(path, data_only=True, read_only=True, keep_vba=False)
+        return load_workbook(
+            path, data_only=data_only, read_only=read_only, keep_vba=False
+        )
     except ValueError:
-        if styled is not None:
-            styled.close()
         raise
     except Exception as exc:
-        if styled is not None:
-            styled.close()
         raise ValueError(f"Cannot open workbook {path}") from exc
-    return styled, values
+
+
+class _CachedValues:
+    """Formula results from a ``data_only`` read of the same file.
+
+    The read-only values workbook is opened for the first sheet with a
+    formula, and only such sheets are walked, so workbooks without formulas
+    are parsed once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._workbook: Any = None
+        self._sheets: Dict[str, Dict[tuple[int, int], Any]] = {}
+
+    def sheet(self, title: str) -> Dict[tuple[int, int], Any]:
+        cached = self._sheets.get(title)
+        if cached is None:
+            if self._workbook is None:
+                self._workbook = _open_workbook(
+                    self.path, data_only=True, read_only=True
+                )
+            values_ws = (
+                self._workbook[title] if title in self._workbook.sheetnames else None
+            )
+            cached = _cached_values_map(values_ws)
+            self._sheets[title] = cached
+        return cached
+
+    def close(self) -> None:
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+        self._sheets.clear()
+
+
+def _sheet_has_formulas(ws: Any, max_row: int, max_column: int) -> bool:
+    if getattr(ws, "array_formulae", None):
+        return True
+    return any(
+        _styled_is_formula(cell.value, getattr(cell, "data_type", None))
+        for row in ws.iter_rows(min_row=1, max_row=max_row, max_col=max_column)
+        for cell in row
+    )
 
 
 def _cached_values_map(values_ws: Any) -> Dict[tuple[int, int], Any]:
@@ -323,24 +578,29 @@ def _cached_values_map(values_ws: Any) -> Dict[tuple[int, int], Any]:
     return cached
 
 
-def load_xlsx(path: str) -> TableDocument:
+def load_xlsx(path: str, *, keep_workbook: bool = False) -> TableDocument:
     """Load .xlsx via openpyxl.
 
+    The styled workbook is parsed once. Cached formula results come from a
+    read-only ``data_only`` pass that only runs for sheets with formulas.
+    With ``keep_workbook=True`` the styled workbook stays on
+    ``TableDocument.workbook`` so ``save_xlsx`` writes through it instead of
+    parsing the source again; call ``TableDocument.close()`` when done.
+
     Comments, headers/footers, validation lists, defined names, hyperlinks,
     charts, and pivot caches are not walked and may retain identifiers.
     """
     _require_openpyxl()
     _check_table_file_size(path)
 
-    styled, values = _open_xlsx_workbooks(path)
+    styled = _open_workbook(path, data_only=False, read_only=False)
+    values = _CachedValues(path)
     missing_cache = 0
     nonempty = 0
     sheets: list[TableSheet] = []
     try:
-        values_by_name = {ws.title: ws for ws in values.worksheets}
         # worksheets skips chartsheets; includes hidden / veryHidden.
         for ws in styled.worksheets:
-            cached = _cached_values_map(values_by_name.get(ws.title))
             merge_ranges = [str(rng) for rng in ws.merged_cells.ranges]
             merge_origins = {
                 (rng.min_row, rng.min_col) for rng in ws.merged_cells.ranges
@@ -355,16 +615,23 @@ def load_xlsx(path: str) -> TableDocument:
                 merge_ranges=merge_ranges,
             )
             if max_row and max_column:
+                # Loaded before the walk: a spill or array-result cell may
+                # come before the formula that owns it.
+                cached: Dict[tuple[int, int], Any] = (
+                    values.sheet(ws.title)
+                    if _sheet_has_formulas(ws, max_row, max_column)
+                    else {}
+                )
                 for row in ws.iter_rows(
                     min_row=1, max_row=max_row, max_col=max_column
                 ):
                     for scell in row:
                         addr = (scell.row, scell.column)
                         styled_value = scell.value
-                        cached_value = cached.get(addr)
                         is_formula = _styled_is_formula(
                             styled_value, getattr(scell, "data_type", None)
                         )
+                        cached_value = cached.get(addr)
                         present = (
                             is_formula
                             or (styled_value is not None and styled_value != "")
@@ -416,8 +683,10 @@ def load_xlsx(path: str) -> TableDocument:
                             )
                         )
             sheets.append(sheet)
-    finally:
+    except BaseException:
         styled.close()
+        raise
+    finally:
         values.close()
 
     if missing_cache:
@@ -426,12 +695,19 @@ def load_xlsx(path: str) -> TableDocument:
             missing_cache,
         )
 
-    return TableDocument(path=path, kind="xlsx", sheets=sheets)
+    doc = TableDocument(path=path, kind="xlsx", sheets=sheets)
+    if keep_workbook:
+        doc.workbook = styled
+    else:
+        styled.close()
+    return doc
 
 
-def load_table(path: str) -> TableDocument:
+def load_table(path: str, *, keep_workbook: bool = False) -> TableDocument:
     """Load a ``.csv`` or ``.xlsx`` file as a ``TableDocument``.
 
+    ``keep_workbook`` is passed to ``load_xlsx`` and ignored for CSV.
+
     Raises ``ValueError`` for rejected spreadsheet suffixes, a missing
     ``[excel]`` extra, or a file over the size / cell cap.
     """
@@ -441,7 +717,7 @@ def load_table(path: str) -> TableDocument:
     if suffix == ".csv":
         return load_csv(path)
     if suffix == ".xlsx":
-        return load_xlsx(path)
+        return load_xlsx(path, keep_workbook=keep_workbook)
     raise ValueError(f"Not a supported table file: {path}")
 
 
@@ -471,7 +747,7 @@ def save_csv(doc: TableDocument, path: str) -> None:
     sheet = doc.sheets[0] if doc.sheets else TableSheet(
         name="Sheet1", hidden=False, max_row=0, max_column=0
     )
-    lookup = _cells_by_address(sheet)
+    lookup = sheet.address_index()
     encoding = "utf-8-sig" if doc.had_bom else "utf-8"
     dialect = dict(doc.dialect) if doc.dialect else _dialect_kwargs(csv.excel)
     with open(path, "w", encoding=encoding, newline="") as handle:
@@ -489,19 +765,21 @@ def save_csv(doc: TableDocument, path: str) -> None:
 
 
 def save_xlsx(doc: TableDocument, path: str) -> None:
-    _require_openpyxl()
-    from openpyxl import load_workbook
+    """Write ``doc`` through its styled workbook.
 
-    try:
-        styled = load_workbook(doc.path, data_only=False, read_only=False, keep_vba=False)
-    except ValueError:
-        raise
-    except Exception as exc:
-        raise ValueError(f"Cannot open workbook {doc.path}") from exc
+    Uses ``doc.workbook`` when ``load_xlsx(keep_workbook=True)`` attached
+    one; otherwise the source workbook is opened again for its styles.
+    """
+    _require_openpyxl()
+    owned = doc.workbook is None
+    if owned:
+        styled = _open_workbook(doc.path, data_only=False, read_only=False)
+    else:
+        styled = doc.workbook
 
     dropped = 0
     try:
-        cells_by_sheet = {sheet.name: _cells_by_address(sheet) for sheet in doc.sheets}
+        cells_by_sheet = {sheet.name: sheet.address_index() for sheet in doc.sheets}
         for ws in styled.worksheets:
             lookup = cells_by_sheet.get(ws.title, {})
             recorded_formulas: set[tuple[int, int]] = set()
@@ -529,7 +807,8 @@ def save_xlsx(doc: TableDocument, path: str) -> None:
                             excel_cell.value = None
         styled.save(path)
     finally:
-        styled.close()
+        if owned:
+            styled.close()
 
     if dropped:
         logging.info("Dropped %s formula(s); wrote cached values.", dropped)
@@ -548,15 +827,31 @@ def apply_mapping_to_table(
     doc: TableDocument,
     orig_to_written: Dict[str, str],
     entity_texts: Iterable[str],
+    *,
+    locator: Optional[SpanLocator] = None,
+    index: Optional[CellTextIndex] = None,
 ) -> TableDocument:
-    """Replace detected entity texts in each cell. Does not use mapping keys."""
-    texts = [text for text in entity_texts if text]
-    if not texts:
+    """Replace detected entity texts in each cell. Does not use mapping keys.
+
+    One ``SpanLocator`` is built for the document (or passed in) and every
+    cell runs through it, instead of compiling the entity patterns per cell.
+    With an ``index`` built on the unreplaced cells, only the cells that
+    contain an entity are visited.
+    """
+    if locator is None:
+        locator = SpanLocator(text for text in entity_texts if text)
+    if not locator.texts:
         return doc
-    for cell in iter_cells(doc):
+    cells: Iterable[TableCell] = iter_cells(doc)
+    if index is not None:
+        hit_ids = {
+            id(cell) for text in locator.texts for cell in index.cells_containing(text)
+        }
+        cells = [cell for cell in index.cells if id(cell) in hit_ids]
+    for cell in cells:
         if not cell.search_text:
             continue
-        new = replace_entities(cell.search_text, texts, orig_to_written)
+        new = replace_entities(cell.search_text, (), orig_to_written, locator=locator)
         if new != cell.search_text:
             cell.search_text = new
     return doc
@@ -584,7 +879,7 @@ def flatten_table_for_review(doc: TableDocument, *, anonymized: bool = True) ->
     for sheet in doc.sheets:
         parts.append(f"# Sheet: {sheet.name}")
         parts.append("")
-        lookup = _cells_by_address(sheet)
+        lookup = sheet.address_index()
         for row in range(1, sheet.max_row + 1):
             values = [
                 _flatten_cell_value(lookup.get((row, col)), anonymized=anonymized)
@@ -614,10 +909,9 @@ def unneutralize_csv_equals(text: str) -> str:
 
 def header_labels(sheet: TableSheet) -> Dict[int, str]:
     """First-row values when they look like unique headers; else Col A, Col B."""
-    lookup = _cells_by_address(sheet)
     texts: list[str] = []
     for col in range(1, sheet.max_column + 1):
-        cell = lookup.get((1, col))
+        cell = sheet.cell_at(1, col)
         if cell and cell.kind == "text" and cell.search_text.strip():
             texts.append(cell.search_text.strip())
         else:
@@ -636,10 +930,13 @@ def write_anonymized_table(
     orig_to_written: Dict[str, str],
     entity_texts: Iterable[str],
 ) -> None:
-    doc = load_table(source_path)
-    apply_mapping_to_table(doc, orig_to_written, entity_texts)
-    dest = Path(dest_path)
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    save_table(doc, dest_path)
+    doc = load_table(source_path, keep_workbook=True)
+    try:
+        apply_mapping_to_table(doc, orig_to_written, entity_texts)
+        dest = Path(dest_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        save_table(doc, dest_path)
+    finally:
+        doc.close()
 
 
@@ -9,13 +9,14 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pdf_anonymizer_core.conf import (
     DEFAULT_ANONYMIZED_DIR,
     DEFAULT_DEANONYMIZED_DIR,
     DEFAULT_MAPPINGS_DIR,
     DEFAULT_STATS_DIR,
+    TEXT_READ_BLOCK_CHARS,
 )
 from pdf_anonymizer_core.mapping_crypto import (
     encrypt_mapping,
@@ -23,8 +24,12 @@ from pdf_anonymizer_core.mapping_crypto import (
     sha256_file,
 )
 from pdf_anonymizer_core.secure_io import write_private_json
+from pdf_anonymizer_core.spans import (
+    trie_pattern,
+    write_slices,
+)
 from pdf_anonymizer_core.tables import (
-    flatten_table_for_review,
+    TableDocument,
     is_tabular_path,
     iter_cells,
     load_table,
@@ -43,6 +48,47 @@ def looks_like_placeholder(text: str) -> bool:
 
 _PLACEHOLDER_PARSE = re.compile(r"^([A-Z][A-Z0-9_]*)_([0-9]+)(?:\.v_([0-9]+))?$")
 
+# One placeholder-shaped token, variation included. Restoration and
+# consolidation find every candidate with this fixed pattern and look it up
+# in a dict, so their cost does not grow with the number of placeholders.
+_PLACEHOLDER_TOKEN = re.compile(r"\b[A-Z_][A-Z0-9_]*_[0-9]+(?:\.v_[0-9]+)*\b")
+_VARIATION = ".v_"
+
+
+def _literal_keys(keys: Iterable[str]) -> List[str]:
+    """Written forms among ``keys`` that are not placeholder-shaped."""
+    return [key for key in keys if key and not _PLACEHOLDER_TOKEN.fullmatch(key)]
+
+
+def _token_pattern(literals: List[str]) -> re.Pattern[str]:
+    """Pattern for placeholder tokens and the given other written forms.
+
+    Placeholder-shaped keys are all found by :data:`_PLACEHOLDER_TOKEN`.
+    Other written forms (fake, mask, hash values) go through a trie, which
+    is tried first so that a longer literal wins as it would longest-first.
+    """
+    if not literals:
+        return _PLACEHOLDER_TOKEN
+    literal = rf"\b(?:{trie_pattern(literals)})(?:\.v_[0-9]+)?\b"
+    return re.compile(f"{literal}|{_PLACEHOLDER_TOKEN.pattern}")
+
+
+def _resolve_token(mapping: Dict[str, str], token: str) -> Optional[Tuple[str, int]]:
+    """Longest key of ``mapping`` that ``token`` starts with, and its extent.
+
+    Keys end at a ``.v_`` boundary. As with the old longest-first regex, the
+    key takes one following variation along (``PERSON_1.v_2`` restores
+    through ``PERSON_1``); anything after that is left in the text. Returns
+    ``(key, consumed)`` or ``None``.
+    """
+    ends = [i for i in range(len(token)) if token.startswith(_VARIATION, i)]
+    ends.append(len(token))
+    for index in range(len(ends) - 1, -1, -1):
+        key = token[: ends[index]]
+        if key in mapping:
+            return key, ends[min(index + 1, len(ends) - 1)]
+    return None
+
 
 def mapping_to_original_to_written(raw: Dict[str, str]) -> Dict[str, str]:
     """Accept either placeholder→original or original→placeholder."""
@@ -133,17 +179,19 @@ def consolidate_mapping(
                 if key_to_replace in consolidated_mapping:
                     del consolidated_mapping[key_to_replace]
 
-    # Update the anonymized text in a single pass
+    # Update the anonymized text in a single pass; a variation keeps its suffix
     if consolidation_map:
-        # Use word boundaries to avoid replacing parts of other words
-        # Replace by longest keys first to ensure correct matching
-        sorted_keys = sorted(consolidation_map.keys(), key=len, reverse=True)
-        pattern = re.compile(
-            r"\b(" + "|".join(re.escape(key) for key in sorted_keys) + r")\b"
-        )
-        anonymized_text = pattern.sub(
-            lambda m: consolidation_map[m.group(1)], anonymized_text
-        )
+
+        def rename(match: re.Match[str]) -> str:
+            token = match.group(0)
+            resolved = _resolve_token(consolidation_map, token)
+            if resolved is None:
+                return token
+            key = resolved[0]
+            return consolidation_map[key] + token[len(key) :]
+
+        pattern = _token_pattern(_literal_keys(consolidation_map))
+        anonymized_text = pattern.sub(rename, anonymized_text)
 
     return anonymized_text, consolidated_mapping
 
@@ -157,6 +205,7 @@ def save_results(
     ephemeral_mapping: bool = False,
     entity_texts: Optional[Iterable[str]] = None,
     orig_to_written: Optional[Dict[str, str]] = None,
+    table: Optional[TableDocument] = None,
 ) -> tuple[str, str]:
     """
     Save the anonymized text and the mapping to files.
@@ -176,28 +225,20 @@ def save_results(
         orig_to_written: Engine original → written map used to re-apply on
             tables. Required for colliding mask/generalize/fake forms; when
             omitted, ``mapping_to_original_to_written(final_mapping)`` is used.
+        table: Table already anonymized by
+            ``anonymize_tabular_file(document=...)``. It is written as is,
+            without loading the source or applying the mapping again, and
+            ``entity_texts`` is not needed.
 
     Returns:
         tuple[str, str]: The paths to the anonymized text file and the mapping
         file. The mapping path is ``""`` when ``ephemeral_mapping`` is true.
     """
-    original_path = Path(file_path)
-    file_stem = original_path.stem
-    file_extension = original_path.suffix.lower()
-
-    anonymized_dir = DEFAULT_ANONYMIZED_DIR
-    mappings_dir = DEFAULT_MAPPINGS_DIR
-    os.makedirs(anonymized_dir, exist_ok=True)
-
-    if file_extension == ".pdf":
-        output_extension = ".md"
-    else:
-        output_extension = file_extension
-
-    anonymized_output_file = (
-        f"{anonymized_dir}/{file_stem}.anonymized{output_extension}"
-    )
-    if is_tabular_path(file_path):
+    anonymized_output_file = anonymized_output_path(file_path)
+    os.makedirs(DEFAULT_ANONYMIZED_DIR, exist_ok=True)
+    if table is not None:
+        save_table(table, anonymized_output_file)
+    elif is_tabular_path(file_path):
         if entity_texts is None:
             raise ValueError(
                 "save_results() on a table requires entity_texts= "
@@ -219,11 +260,38 @@ def save_results(
         )
     else:
         with open(anonymized_output_file, "w", encoding="utf-8") as f:
-            f.write(full_anonymized_text)
+            write_slices(f, full_anonymized_text)
 
     if ephemeral_mapping:
         return anonymized_output_file, ""
 
+    return anonymized_output_file, save_mapping(
+        final_mapping, file_path, mapping_passphrase
+    )
+
+
+def anonymized_output_path(file_path: str) -> str:
+    """Where ``save_results`` writes the anonymized copy of ``file_path``."""
+    original_path = Path(file_path)
+    file_extension = original_path.suffix.lower()
+    output_extension = ".md" if file_extension == ".pdf" else file_extension
+    return f"{DEFAULT_ANONYMIZED_DIR}/{original_path.stem}.anonymized{output_extension}"
+
+
+def save_mapping(
+    final_mapping: dict[str, str],
+    file_path: str,
+    mapping_passphrase: str | None = None,
+) -> str:
+    """Write the placeholder → original mapping for ``file_path``.
+
+    Encrypted to ``*.mapping.json.enc`` when ``mapping_passphrase`` is set,
+    plaintext ``*.mapping.json`` otherwise. Returns the mapping path.
+    """
+    original_path = Path(file_path)
+    file_stem = original_path.stem
+    mappings_dir = DEFAULT_MAPPINGS_DIR
+
     source_digest = ""
     if original_path.is_file():
         source_digest = sha256_file(original_path)
@@ -241,33 +309,106 @@ def save_results(
         # Persist mapping as placeholder -> original for correct deanonymization
         write_private_json(mapping_file, final_mapping)
 
-    return anonymized_output_file, mapping_file
+    return mapping_file
 
 
-def restore_placeholders_in_text(
-    text: str, placeholder_to_original: Dict[str, str]
-) -> tuple[str, set[str]]:
-    """Replace longest-first ``PLACEHOLDER`` / ``PLACEHOLDER.v_n`` tokens."""
-    used_placeholders: set[str] = set()
-    sorted_placeholders = sorted(
-        placeholder_to_original.keys(), key=len, reverse=True
-    )
-    if not sorted_placeholders:
-        return text, used_placeholders
+class PlaceholderRestorer:
+    """Placeholder restorer for one mapping.
 
-    pattern = re.compile(
-        r"\b("
-        + "|".join(re.escape(placeholder) for placeholder in sorted_placeholders)
-        + r")(?:\.v_\d+)?\b"
-    )
+    Placeholder tokens are found with one fixed pattern and looked up in the
+    mapping; other written forms share the pattern through a trie. Build it
+    once per document and call :meth:`restore` on the whole text or on every
+    cell of a table, or :meth:`restore_stream` on a text read in blocks.
+    :attr:`used` and :attr:`not_found` collect the statistics across calls.
+    """
 
-    def replace_match(match: re.Match[str]) -> str:
-        full_match = match.group(0)
-        base_placeholder = match.group(1)
-        used_placeholders.add(full_match)
-        return placeholder_to_original[base_placeholder]
+    def __init__(self, placeholder_to_original: Dict[str, str]):
+        self.placeholder_to_original = placeholder_to_original
+        self.used: set[str] = set()
+        self.not_found: set[str] = set()
+        literals = _literal_keys(placeholder_to_original)
+        self._pattern = _token_pattern(literals)
+        # How far past a match start the pattern can look, placeholder
+        # tokens aside (they stop at the first space or newline).
+        self._reach = max(map(len, literals), default=0)
+
+    def _replace(self, match: re.Match[str], used: set[str]) -> str:
+        token = match.group(0)
+        resolved = _resolve_token(self.placeholder_to_original, token)
+        if resolved is None:
+            self.not_found.add(token)
+            return token
+        key, consumed = resolved
+        used.add(token[:consumed])
+        return self.placeholder_to_original[key] + token[consumed:]
+
+    def restore(self, text: str) -> tuple[str, set[str]]:
+        """Replace ``PLACEHOLDER`` / ``PLACEHOLDER.v_n`` tokens.
+
+        A variation missing from the mapping falls back to its base. Returns
+        the restored text and the tokens replaced in it.
+        """
+        used_placeholders: set[str] = set()
+        restored = self._pattern.sub(
+            lambda match: self._replace(match, used_placeholders), text
+        )
+        self.used |= used_placeholders
+        return restored, used_placeholders
+
+    def restore_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Restore a text that arrives in pieces, yielding restored pieces.
+
+        Joined, the output equals ``restore("".join(pieces))[0]``. Each
+        window is restored up to the longest written form before its last
+        space or newline; the rest is carried into the next window, so no
+        token is cut at a window edge. Memory stays around one piece plus
+        the longest stretch without a space or newline.
+        """
+        buffer = ""
+        start = 0
+        for piece in pieces:
+            buffer += piece
+            limit = max(buffer.rfind(" "), buffer.rfind("\n")) - self._reach
+            if limit <= start:
+                continue
+            restored, cut = self._restore_window(buffer, start, limit)
+            yield restored
+            # Keep the character before the cut: ``\b`` looks at it.
+            buffer, start = buffer[cut - 1 :], 1
+        if len(buffer) > start:
+            yield self._restore_window(buffer, start, len(buffer))[0]
+
+    def _restore_window(self, buffer: str, start: int, limit: int) -> Tuple[str, int]:
+        """Restore matches in ``buffer`` that start before ``limit``.
+
+        Returns the restored text from ``start`` and the offset it ends at:
+        ``limit``, or the end of a match that runs past it.
+        """
+        parts = []
+        position = start
+        for match in self._pattern.finditer(buffer, start):
+            if match.start() >= limit:
+                break
+            parts.append(buffer[position : match.start()])
+            parts.append(self._replace(match, self.used))
+            position = match.end()
+        cut = max(position, limit)
+        parts.append(buffer[position:cut])
+        return "".join(parts), cut
+
+    def unused(self) -> list[str]:
+        """Mapping keys whose base never occurred, neither plain nor varied."""
+        used_bases = {token.split(_VARIATION)[0] for token in self.used}
+        return sorted(
+            key for key in self.placeholder_to_original if key not in used_bases
+        )
 
-    return pattern.sub(replace_match, text), used_placeholders
+
+def restore_placeholders_in_text(
+    text: str, placeholder_to_original: Dict[str, str]
+) -> tuple[str, set[str]]:
+    """Replace ``PLACEHOLDER`` / ``PLACEHOLDER.v_n`` tokens."""
+    return PlaceholderRestorer(placeholder_to_original).restore(text)
 
 
 def deanonymize_file(
@@ -276,6 +417,8 @@ def deanonymize_file(
     mapping_passphrase: str | None = None,
     *,
     expected_source_sha256: str | None = None,
+    stream: bool = False,
+    block_chars: int = TEXT_READ_BLOCK_CHARS,
 ) -> tuple[str, str]:
     """Deanonymize a file using a mapping file.
 
@@ -295,6 +438,12 @@ def deanonymize_file(
         expected_source_sha256: Optional SHA-256 of the original source
             document. When set, an encrypted mapping locked to a different
             file is rejected (AAD mismatch).
+        stream: Restore a text file in windows of ``block_chars`` characters
+            and write each one as it is done, instead of holding the whole
+            document and its restored copy in memory. The output is the
+            same. CSV / Excel files are always loaded whole (within the
+            table size caps).
+        block_chars: Characters read per window when ``stream`` is set.
 
     Returns:
         A tuple (deanonymized_file_path, stats_file_path).
@@ -334,41 +483,8 @@ def deanonymize_file(
             if isinstance(placeholder, str):
                 placeholder_to_original.setdefault(placeholder, original)
 
-    sorted_placeholders = sorted(placeholder_to_original.keys(), key=len, reverse=True)
     tabular = is_tabular_path(anonymized_file_path)
-
-    if tabular:
-        doc = load_table(anonymized_file_path)
-        anonymized_text = flatten_table_for_review(doc, anonymized=True)
-        used_placeholders: set[str] = set()
-        for cell in iter_cells(doc):
-            if not cell.search_text:
-                continue
-            restored, cell_used = restore_placeholders_in_text(
-                cell.search_text, placeholder_to_original
-            )
-            used_placeholders |= cell_used
-            if doc.kind == "csv":
-                restored = unneutralize_csv_equals(restored)
-            if restored != cell.search_text:
-                cell.search_text = restored
-    else:
-        with open(anonymized_file_path, "r", encoding="utf-8") as f:
-            anonymized_text = f.read()
-        deanonymized_text, used_placeholders = restore_placeholders_in_text(
-            anonymized_text, placeholder_to_original
-        )
-
-    # Gather stats
-    all_placeholders_in_text = set(
-        re.findall(r"[A-Z_]+_[0-9]+(?:\.v_[0-9]+)?", anonymized_text)
-    )
-
-    not_found_mappings = sorted(list(all_placeholders_in_text - used_placeholders))
-
-    # Unused mappings: base placeholders that never occurred (neither base nor any variation)
-    used_bases = {p.split(".v_")[0] for p in used_placeholders}
-    unused_mappings = sorted([p for p in sorted_placeholders if p not in used_bases])
+    restorer = PlaceholderRestorer(placeholder_to_original)
 
     anonymized_path = Path(anonymized_file_path)
     file_stem = anonymized_path.name.replace(f".anonymized{anonymized_path.suffix}", "")
@@ -381,11 +497,39 @@ def deanonymize_file(
 
     deanonymized_file = f"{deanonymized_dir}/{file_stem}.deanonymized{output_extension}"
     if tabular:
-        save_table(doc, deanonymized_file)
+        doc = load_table(anonymized_file_path, keep_workbook=True)
+        for cell in iter_cells(doc):
+            if not cell.search_text:
+                continue
+            restored, _cell_used = restorer.restore(cell.search_text)
+            if doc.kind == "csv":
+                restored = unneutralize_csv_equals(restored)
+            if restored != cell.search_text:
+                cell.search_text = restored
+        try:
+            save_table(doc, deanonymized_file)
+        finally:
+            doc.close()
+    elif stream:
+        with (
+            open(anonymized_file_path, "r", encoding="utf-8") as source,
+            open(deanonymized_file, "w", encoding="utf-8") as target,
+        ):
+            blocks = iter(lambda: source.read(block_chars), "")
+            for restored in restorer.restore_stream(blocks):
+                target.write(restored)
     else:
+        with open(anonymized_file_path, "r", encoding="utf-8") as f:
+            anonymized_text = f.read()
+        deanonymized_text, _used = restorer.restore(anonymized_text)
         with open(deanonymized_file, "w", encoding="utf-8") as f:
             f.write(deanonymized_text)
 
+    # Stats were collected while restoring: placeholder tokens missing from
+    # the map, and map entries whose base never occurred.
+    not_found_mappings = sorted(restorer.not_found)
+    unused_mappings = restorer.unused()
+
     stats_file = f"{stats_dir}/{file_stem}.deanonymization_stat.json"
     stats = {
         "anonymized_file": anonymized_file_path,
@@ -0,0 +1,11 @@
+"""Shared fixtures: tests never read or write the on-disk LLM cache."""
+
+import pytest
+
+from pdf_anonymizer_core import llm_provider
+
+
+@pytest.fixture(autouse=True)
+def _no_llm_cache(monkeypatch):
+    monkeypatch.setattr(llm_provider, "_cache_enabled", False)
+    monkeypatch.setattr(llm_provider, "_cache_instance", None)
@@ -0,0 +1,66 @@
+"""Async provider path: acall, aidentify_entities_with_llm, aanonymize_file."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from pdf_anonymizer_core import llm_provider
+from pdf_anonymizer_core.call_llm import aidentify_entities_with_llm
+from pdf_anonymizer_core.core import aanonymize_file, anonymize_file
+
+ADA = {"text": "Ada Lovelace", "type": "PERSON", "base_form": "Ada Lovelace"}
+PAYLOAD = json.dumps({"entities": [ADA]})
+
+
+class _EchoProvider(llm_provider.LLMProvider):
+    def _new_client(self):
+        return None
+
+    def _new_async_client(self):
+        return None
+
+    def _call_raw(self, prompt, model_name, max_output_tokens=None):
+        return f"{model_name}:{prompt}"
+
+
+def test_default_acall_runs_sync_provider(monkeypatch) -> None:
+    monkeypatch.setattr(llm_provider, "_cache_enabled", False)
+    out = asyncio.run(_EchoProvider().acall("hi", "m"))
+    assert out == "m:hi"
+
+
+def test_aidentify_retries_with_async_sleep(mocker) -> None:
+    provider = MagicMock()
+    provider.acall = AsyncMock(side_effect=[Exception("503 server error"), PAYLOAD])
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+    sleep = mocker.patch("pdf_anonymizer_core.call_llm.asyncio.sleep", new=AsyncMock())
+    entities = asyncio.run(
+        aidentify_entities_with_llm("Ada Lovelace", "{text}", "gemini-2.5-flash")
+    )
+    assert entities == [ADA]
+    assert provider.acall.await_count == 2
+    sleep.assert_awaited_once()
+    provider.call.assert_not_called()
+
+
+def test_aanonymize_file_matches_sync(mocker) -> None:
+    text = "Ada Lovelace met john@example.com."
+    chunks = [text, "Later, Ada Lovelace wrote back."]
+    mocker.patch("os.path.getsize", return_value=0)
+    mocker.patch(
+        "pdf_anonymizer_core.core.load_and_extract_text_from_file",
+        return_value=(" ".join(chunks), chunks),
+    )
+    provider = MagicMock()
+    provider.call.return_value = PAYLOAD
+    provider.acall = AsyncMock(return_value=PAYLOAD)
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+
+    expected = anonymize_file("dummy.pdf", 1000, "{text}", "gemini-2.5-flash")
+    actual = asyncio.run(
+        aanonymize_file(
+            "dummy.pdf", 1000, "{text}", "gemini-2.5-flash", max_concurrency=2
+        )
+    )
+    assert actual == expected
+    assert provider.acall.await_count == 2
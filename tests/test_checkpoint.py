@@ -0,0 +1,272 @@
+"""Per-chunk checkpoint journal and resume for anonymize_file."""
+
+import asyncio
+import json
+import os
+import stat
+
+import pytest
+from typer.testing import CliRunner
+
+from pdf_anonymizer_cli.cli import app
+from pdf_anonymizer_core.call_llm import LLMDetectionError, identify_entities_with_llm
+from pdf_anonymizer_core.checkpoint import ChunkJournal, checkpoint_config
+from pdf_anonymizer_core.core import aanonymize_file, anonymize_file
+
+CHUNKS = [
+    "Ada Lovelace wrote to Jane Smith.",
+    "Jane Smith replied to Alan Turing.",
+    "Alan Turing met Ada Lovelace.",
+    "Grace Hopper joined later.",
+]
+NAMES = ("Ada Lovelace", "Jane Smith", "Alan Turing", "Grace Hopper")
+
+
+def _entities(text):
+    return [
+        {"text": name, "type": "PERSON", "base_form": name}
+        for name in NAMES
+        if name in text
+    ]
+
+
+@pytest.fixture
+def source(tmp_path, mocker):
+    path = tmp_path / "letters.txt"
+    path.write_text(" ".join(CHUNKS), encoding="utf-8")
+    mocker.patch(
+        "pdf_anonymizer_core.core.load_and_extract_text_from_file",
+        return_value=(" ".join(CHUNKS), list(CHUNKS)),
+    )
+    return path
+
+
+def _run(path, checkpoint_dir, **kwargs):
+    return anonymize_file(
+        str(path), 1000, "{text}", "dummy", checkpoint_dir=str(checkpoint_dir), **kwargs
+    )
+
+
+def _journals(directory):
+    return sorted(directory.glob("*.jsonl")) if directory.exists() else []
+
+
+def test_crash_then_resume_only_detects_the_tail(source, tmp_path, mocker) -> None:
+    checkpoints = tmp_path / "checkpoints"
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=lambda text, *_a, **_k: _entities(text),
+    )
+    expected = anonymize_file(str(source), 1000, "{text}", "dummy")
+
+    def crash_on_third(text, *_args, **_kwargs):
+        if text == CHUNKS[2]:
+            raise KeyboardInterrupt
+        return _entities(text)
+
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=crash_on_third,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        _run(source, checkpoints)
+    [journal_path] = _journals(checkpoints)
+    lines = journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["chunk"] for line in lines[1:]] == [0, 1]
+    assert stat.S_IMODE(os.stat(journal_path).st_mode) == 0o600
+
+    resumed = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=lambda text, *_a, **_k: _entities(text),
+    )
+    actual = _run(source, checkpoints, resume=True)
+    assert [call.args[0] for call in resumed.call_args_list] == CHUNKS[2:]
+    assert actual == expected
+    assert actual[1]["Grace Hopper"] == "PERSON_4"
+    assert _journals(checkpoints) == []
+
+
+def test_without_resume_the_journal_starts_over(source, tmp_path, mocker) -> None:
+    checkpoints = tmp_path / "checkpoints"
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=lambda text, *_a, **_k: _entities(text),
+    )
+    config = checkpoint_config(
+        characters_to_anonymize=1000,
+        chunk_overlap=1000,
+        prompt_template="{text}",
+        model_name="dummy",
+        regex_patterns={},
+        use_llm=True,
+    )
+    journal = ChunkJournal.open(str(source), config, directory=str(checkpoints))
+    journal.record(0, CHUNKS[0], [], [])
+    journal.close()
+    _run(source, checkpoints, regex_patterns={}, chunk_overlap=1000)
+    assert llm.call_count == len(CHUNKS)
+
+
+def test_settings_and_source_are_part_of_the_key(source, tmp_path) -> None:
+    checkpoints = tmp_path / "checkpoints"
+    base = dict(
+        characters_to_anonymize=1000,
+        chunk_overlap=100,
+        prompt_template="{text}",
+        model_name="model-a",
+        regex_patterns={"EMAIL": "x"},
+        use_llm=True,
+    )
+    first = ChunkJournal.open(
+        str(source), checkpoint_config(**base), directory=str(checkpoints)
+    )
+    first.record(0, CHUNKS[0], [], _entities(CHUNKS[0]))
+    first.close()
+
+    same = ChunkJournal.open(
+        str(source), checkpoint_config(**base), directory=str(checkpoints), resume=True
+    )
+    assert same.path == first.path
+    assert same.result(0, CHUNKS[0]) == ([], _entities(CHUNKS[0]))
+    assert same.result(0, "different chunk text") is None
+    same.close()
+
+    other_model = ChunkJournal.open(
+        str(source),
+        checkpoint_config(**{**base, "model_name": "model-b"}),
+        directory=str(checkpoints),
+        resume=True,
+    )
+    assert other_model.path != first.path
+    assert len(other_model) == 0
+    other_model.discard()
+
+    source.write_text("edited", encoding="utf-8")
+    edited = ChunkJournal.open(
+        str(source), checkpoint_config(**base), directory=str(checkpoints), resume=True
+    )
+    assert edited.path != first.path
+    assert len(edited) == 0
+    edited.discard()
+
+
+def test_torn_last_line_is_ignored(source, tmp_path) -> None:
+    checkpoints = tmp_path / "checkpoints"
+    config = checkpoint_config(
+        characters_to_anonymize=10,
+        chunk_overlap=0,
+        prompt_template="{text}",
+        model_name="m",
+        regex_patterns={},
+        use_llm=True,
+    )
+    journal = ChunkJournal.open(str(source), config, directory=str(checkpoints))
+    journal.record(0, CHUNKS[0], [], [])
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as handle:
+        handle.write('{"chunk": 1, "sha256": "trunc')
+
+    resumed = ChunkJournal.open(
+        str(source), config, directory=str(checkpoints), resume=True
+    )
+    assert len(resumed) == 1
+    resumed.record(1, CHUNKS[1], [], [])
+    resumed.close()
+    again = ChunkJournal.open(
+        str(source), config, directory=str(checkpoints), resume=True
+    )
+    assert again.result(1, CHUNKS[1]) == ([], [])
+    again.close()
+
+
+def test_unanswered_chunk_is_retried_on_resume(
+    source, tmp_path, mocker, caplog
+) -> None:
+    checkpoints = tmp_path / "checkpoints"
+
+    def outage_on_second(text, *_args, raise_on_failure=False, **_kwargs):
+        assert raise_on_failure is True
+        if text == CHUNKS[1]:
+            raise LLMDetectionError("no answer")
+        return _entities(text)
+
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=outage_on_second,
+    )
+    _text, mapping = _run(source, checkpoints)
+    assert "Jane Smith" in mapping  # chunk 0 names her too
+    assert len(_journals(checkpoints)) == 1
+    assert "1 chunk(s) had no language-model answer (part 2)" in caplog.text
+
+    retried = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        side_effect=lambda text, *_a, **_k: _entities(text),
+    )
+    _run(source, checkpoints, resume=True)
+    assert [call.args[0] for call in retried.call_args_list] == [CHUNKS[1]]
+    assert _journals(checkpoints) == []
+
+
+def test_async_resume_skips_finished_chunks(source, tmp_path, mocker) -> None:
+    checkpoints = tmp_path / "checkpoints"
+    config = checkpoint_config(
+        characters_to_anonymize=1000,
+        chunk_overlap=1000,
+        prompt_template="{text}",
+        model_name="dummy",
+        regex_patterns={},
+        use_llm=True,
+    )
+    journal = ChunkJournal.open(str(source), config, directory=str(checkpoints))
+    for index in (0, 1):
+        journal.record(index, CHUNKS[index], [], _entities(CHUNKS[index]))
+    journal.close()
+
+    async def identify(text, *_args, **_kwargs):
+        return _entities(text)
+
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.aidentify_entities_with_llm", side_effect=identify
+    )
+    _text, mapping = asyncio.run(
+        aanonymize_file(
+            str(source),
+            1000,
+            "{text}",
+            "dummy",
+            regex_patterns={},
+            checkpoint_dir=str(checkpoints),
+            resume=True,
+        )
+    )
+    assert [call.args[0] for call in llm.call_args_list] == CHUNKS[2:]
+    assert set(mapping) == set(NAMES)
+    assert _journals(checkpoints) == []
+
+
+@pytest.mark.parametrize(
+    "flags, journaled",
+    [([], False), (["--checkpoint"], True), (["--resume"], True)],
+)
+def test_cli_journals_only_when_asked(
+    source, tmp_path, monkeypatch, mocker, flags, journaled
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    opened = mocker.spy(ChunkJournal, "open")
+    args = ["run", str(source), "--no-llm", "--no-verify", "--no-risk", *flags]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert opened.called is journaled
+
+
+def test_raise_on_failure_after_retries(mocker) -> None:
+    provider = mocker.Mock()
+    provider.call.side_effect = RuntimeError("503 service unavailable")
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+    mocker.patch("pdf_anonymizer_core.call_llm.time.sleep")
+    assert identify_entities_with_llm("Ann", "{text}", "google/m", max_retries=2) == []
+    with pytest.raises(LLMDetectionError):
+        identify_entities_with_llm(
+            "Ann", "{text}", "google/m", max_retries=2, raise_on_failure=True
+        )
@@ -0,0 +1,136 @@
+"""Duplicate chunks are detected once; overlap can be sent only once."""
+
+import asyncio
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from pdf_anonymizer_core.core import aanonymize_file, anonymize_file
+from pdf_anonymizer_core.load_and_extract import boundary_chunks
+
+NAMES = ("Ada Lovelace", "Alan Turing", "Grace Hopper")
+DISCLAIMER = "Confidential. Do not forward. Contact legal@example.com."
+
+
+def _entities(text, *_args, **_kwargs):
+    return [
+        {"text": name, "type": "PERSON", "base_form": name}
+        for name in NAMES
+        if name in text
+    ]
+
+
+def _patch_chunks(mocker, chunks):
+    mocker.patch(
+        "pdf_anonymizer_core.core.load_and_extract_text_from_file",
+        return_value=("\n".join(chunks), list(chunks)),
+    )
+
+
+def test_identical_chunks_are_sent_once(tmp_path, mocker) -> None:
+    source = tmp_path / "memo.txt"
+    source.write_text("x", encoding="utf-8")
+    chunks = [
+        "Ada Lovelace wrote.",
+        DISCLAIMER,
+        "Alan Turing replied.",
+        DISCLAIMER,
+        DISCLAIMER,
+    ]
+    _patch_chunks(mocker, chunks)
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm", side_effect=_entities
+    )
+    text, mapping = anonymize_file(
+        str(source), 1000, "{text}", "dummy", max_concurrency=2
+    )
+    assert sorted(call.args[0] for call in llm.call_args_list) == sorted(
+        ["Ada Lovelace wrote.", DISCLAIMER, "Alan Turing replied."]
+    )
+    assert mapping["Ada Lovelace"] == "PERSON_1"
+    assert mapping["Alan Turing"] == "PERSON_2"
+    assert "legal@example.com" in mapping
+    assert text.count(mapping["legal@example.com"]) == 3
+
+
+def test_async_identical_chunks_are_sent_once(tmp_path, mocker) -> None:
+    source = tmp_path / "memo.txt"
+    source.write_text("x", encoding="utf-8")
+    _patch_chunks(mocker, [DISCLAIMER, "Grace Hopper.", DISCLAIMER])
+
+    async def identify(text, *_args, **_kwargs):
+        return _entities(text)
+
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.aidentify_entities_with_llm", side_effect=identify
+    )
+    _text, mapping = asyncio.run(
+        aanonymize_file(str(source), 1000, "{text}", "dummy", max_concurrency=4)
+    )
+    assert llm.call_count == 2
+    assert mapping["Grace Hopper"] == "PERSON_1"
+
+
+class TestBoundaryChunks:
+    def _split(self, text, size):
+        splitter = RecursiveCharacterTextSplitter(chunk_size=size, chunk_overlap=0)
+        return splitter.split_text(text)
+
+    def test_entity_split_by_a_cut_is_seen_whole(self) -> None:
+        text = " ".join(f"line{i} Ada Lovelace" for i in range(40))
+        chunks = self._split(text, 100)
+        cut_names = [
+            (left, right)
+            for left, right in zip(chunks, chunks[1:])
+            if left.endswith("Ada") and right.startswith("Lovelace")
+        ]
+        assert cut_names, "test text should split a name across a cut"
+        windows = boundary_chunks(text, chunks, 300, window=40)
+        for left, right in cut_names:
+            tail = left.rsplit(" ", 1)[-1]
+            head = right.split(" ", 1)[0]
+            assert any(f"{tail} {head}" in window for window in windows)
+
+    def test_windows_are_packed_within_the_chunk_size(self) -> None:
+        text = " ".join(f"word{i}" for i in range(2000))
+        chunks = self._split(text, 200)
+        windows = boundary_chunks(text, chunks, 500, window=60)
+        assert all(len(window) <= 500 for window in windows)
+        assert len(windows) < len(chunks) - 1
+        assert sum(len(window) for window in windows) < 70 * len(chunks)
+
+    def test_single_chunk_has_no_boundaries(self) -> None:
+        assert boundary_chunks("short text", ["short text"], 100) == []
+
+
+def test_overlap_once_finds_the_same_entities_with_fewer_characters(
+    tmp_path, mocker
+) -> None:
+    sentences = [
+        f"Entry {i}: {NAMES[i % 3]} met {NAMES[(i + 1) % 3]} in room {i}."
+        for i in range(300)
+    ]
+    source = tmp_path / "log.txt"
+    source.write_text(" ".join(sentences), encoding="utf-8")
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm", side_effect=_entities
+    )
+
+    baseline = anonymize_file(
+        str(source), 2000, "{text}", "dummy", chunk_overlap=1000, regex_patterns={}
+    )
+    sent_with_overlap = sum(len(call.args[0]) for call in llm.call_args_list)
+    calls_with_overlap = llm.call_count
+
+    llm.reset_mock()
+    once = anonymize_file(
+        str(source),
+        2000,
+        "{text}",
+        "dummy",
+        chunk_overlap=1000,
+        regex_patterns={},
+        overlap_once=True,
+    )
+    assert once == baseline
+    assert sum(len(call.args[0]) for call in llm.call_args_list) < sent_with_overlap
+    assert llm.call_count < calls_with_overlap
@@ -0,0 +1,88 @@
+"""Bounded-concurrency chunk detection keeps chunk order and the same mapping."""
+
+import threading
+import time
+
+from pdf_anonymizer_core.conf import ConfigProfile, get_config_for_profile
+from pdf_anonymizer_core.core import anonymize_file, collect_entities_from_chunks
+
+CHUNKS = [
+    "Ada Lovelace wrote to Jane Smith.",
+    "Jane Smith replied to Alan Turing.",
+    "Alan Turing met Ada Lovelace.",
+    "Grace Hopper joined later.",
+]
+NAMES = ("Ada Lovelace", "Jane Smith", "Alan Turing", "Grace Hopper")
+
+
+def _fake_llm(delays):
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def identify(text, *_args, **_kwargs):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        # Later chunks finish first so completion order differs from chunk order.
+        time.sleep(delays[CHUNKS.index(text)])
+        with lock:
+            in_flight["now"] -= 1
+        names = [name for name in NAMES if name in text]
+        return [{"text": name, "type": "PERSON", "base_form": name} for name in names]
+
+    return identify, in_flight
+
+
+def _collect(max_concurrency):
+    return collect_entities_from_chunks(
+        CHUNKS,
+        prompt_template="{text}",
+        model_name="dummy",
+        regex_patterns={},
+        max_retries=1,
+        base_retry_delay=0.0,
+        max_retry_delay=0.0,
+        use_llm=True,
+        max_concurrency=max_concurrency,
+    )
+
+
+def test_concurrent_collect_keeps_chunk_order(mocker) -> None:
+    identify, in_flight = _fake_llm([0.08, 0.06, 0.04, 0.0])
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm", side_effect=identify
+    )
+    sequential = _collect(1)
+    assert in_flight["peak"] == 1
+    concurrent = _collect(4)
+    assert in_flight["peak"] > 1
+    assert concurrent == sequential
+
+
+def test_concurrent_anonymize_file_same_mapping(mocker) -> None:
+    identify, _ = _fake_llm([0.05, 0.03, 0.01, 0.0])
+    mocker.patch("os.path.getsize", return_value=0)
+    mocker.patch(
+        "pdf_anonymizer_core.core.load_and_extract_text_from_file",
+        return_value=(" ".join(CHUNKS), list(CHUNKS)),
+    )
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm", side_effect=identify
+    )
+    expected = anonymize_file("dummy.pdf", 1000, "{text}", "dummy")
+    actual = anonymize_file("dummy.pdf", 1000, "{text}", "dummy", max_concurrency=3)
+    assert actual == expected
+    assert actual[1]["Ada Lovelace"] == "PERSON_1"
+    assert actual[1]["Grace Hopper"] == "PERSON_4"
+
+
+def test_profile_carries_max_concurrency() -> None:
+    assert get_config_for_profile(ConfigProfile.BEST_SPEED).max_concurrency == 1
+    config = get_config_for_profile(ConfigProfile.BEST_SPEED, max_concurrency=8)
+    assert config.max_concurrency == 8
+
+
+def test_profile_carries_extract_workers() -> None:
+    config = get_config_for_profile(ConfigProfile.BEST_SPEED, extract_workers=4)
+    assert config.extract_workers == 4
+    assert get_config_for_profile(ConfigProfile.BEST_SPEED).extract_workers == 1
@@ -62,6 +62,23 @@ class TestConsolidation(unittest.TestCase):
         self.assertEqual(consolidated_text, expected_text)
         self.assertEqual(consolidated_mapping, expected_mapping)
 
+    def test_consolidate_mapping_keeps_variation_suffix(self):
+        anonymized_text = "PERSON_2, PERSON_2.v_1 and PERSON_22 met."
+        mapping = {
+            "PERSON_1": "John Doe",
+            "PERSON_2": "John Doe",
+            "PERSON_22": "Jane Smith",
+        }
+
+        consolidated_text, consolidated_mapping = consolidate_mapping(
+            anonymized_text, mapping
+        )
+
+        self.assertEqual(consolidated_text, "PERSON_1, PERSON_1.v_1 and PERSON_22 met.")
+        self.assertEqual(
+            consolidated_mapping, {"PERSON_1": "John Doe", "PERSON_22": "Jane Smith"}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,127 @@
+"""Shared placeholder numbering for --jobs runs."""
+
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+from typer.testing import CliRunner
+
+from pdf_anonymizer_cli.cli import _init_worker, app
+from pdf_anonymizer_core.coordinator import MappingCoordinator
+from pdf_anonymizer_core.core import anonymize_file
+
+
+def _person(text, base_form=None):
+    return {"text": text, "type": "PERSON", "base_form": base_form or text}
+
+
+class TestMappingCoordinator:
+    def test_later_files_reuse_numbers_and_merge_base_forms(self) -> None:
+        coordinator = MappingCoordinator({"Grace Hopper": "PERSON_1"})
+        first = coordinator.assign(
+            [
+                _person("Ada Lovelace"),
+                {"text": "ada@example.com", "type": "EMAIL", "base_form": None},
+            ]
+        )
+        second = coordinator.assign([_person("Lovelace"), _person("Grace Hopper")])
+
+        assert first == {"Ada Lovelace": "PERSON_2", "ada@example.com": "EMAIL_1"}
+        assert second == {
+            "Lovelace": "PERSON_2.v_1",
+            "Ada Lovelace": "PERSON_2",
+            "Grace Hopper": "PERSON_1",
+        }
+        assert len(coordinator.snapshot()) == 4
+
+    def test_concurrent_assign_never_reuses_a_number(self) -> None:
+        coordinator = MappingCoordinator()
+
+        def worker(n: int) -> None:
+            for i in range(50):
+                coordinator.assign([_person(f"Person {n}-{i}"), _person("Shared")])
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mapping = coordinator.snapshot()
+        assert len(mapping) == 201
+        assert len(set(mapping.values())) == 201
+
+    def test_anonymize_file_uses_the_coordinator(self, tmp_path, mocker) -> None:
+        coordinator = MappingCoordinator({"Ada Lovelace": "PERSON_7"})
+        source = tmp_path / "a.txt"
+        source.write_text("Ada Lovelace met Alan Turing.", encoding="utf-8")
+        mocker.patch(
+            "pdf_anonymizer_core.core.identify_entities_with_llm",
+            return_value=[_person("Ada Lovelace"), _person("Alan Turing")],
+        )
+        text, mapping = anonymize_file(
+            str(source), 1000, "{text}", "dummy", coordinator=coordinator
+        )
+        assert text == "PERSON_7 met PERSON_8."
+        assert mapping == {"Ada Lovelace": "PERSON_7", "Alan Turing": "PERSON_8"}
+
+
+def test_cli_jobs_keeps_placeholders_consistent(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"memo{i}.txt"
+        path.write_text(
+            f"Write to shared@example.com or to own{i}@example.com.",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+
+    result = CliRunner().invoke(
+        app,
+        ["run", *paths, "--no-llm", "--jobs", "2", "--no-verify", "--no-risk"],
+    )
+    assert result.exit_code == 0, result.output
+
+    mappings = [
+        json.loads(
+            (tmp_path / "data" / "mappings" / f"memo{i}.mapping.json").read_text()
+        )
+        for i in range(3)
+    ]
+    shared = {
+        placeholder
+        for mapping in mappings
+        for placeholder, original in mapping.items()
+        if original == "shared@example.com"
+    }
+    assert len(shared) == 1
+    own = [
+        placeholder
+        for mapping in mappings
+        for placeholder, original in mapping.items()
+        if original.startswith("own")
+    ]
+    assert len(set(own)) == 3 and not shared & set(own)
+
+
+def test_spawned_workers_open_the_configured_cache(tmp_path) -> None:
+    cache_dir = tmp_path / "cache"
+    config = SimpleNamespace(
+        enable_cache=True,
+        cache_dir=str(cache_dir),
+        cache_file="run.sqlite3",
+        cache_max_bytes=None,
+        cache_max_age_seconds=None,
+    )
+    job = SimpleNamespace(use_llm=True, config=config)
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(job,),
+    ) as pool:
+        assert pool.submit(os.path.exists, str(cache_dir / "run.sqlite3")).result()
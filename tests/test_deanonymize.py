@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
 
-from pdf_anonymizer_core.utils import deanonymize_file
+from pdf_anonymizer_core.utils import PlaceholderRestorer, deanonymize_file
 
 
-def test_deanonymize_file(tmp_path: Path):
+def test_deanonymize_file(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     # Create dummy anonymized file in temp dir
     anonymized_content = (
         "Hello PERSON_1, welcome to LOCATION_1. Your email is EMAIL_1. "
@@ -45,3 +46,83 @@ def test_deanonymize_file(tmp_path: Path):
     assert stats_content["deanonymized_file"] == deanonymized_output_file
     assert stats_content["unused_mappings"] == ["PERSON_37"]
     assert stats_content["not_found_mappings"] == ["PERSON_4"]
+
+
+def test_restorer_handles_variations_and_written_forms():
+    mapping = {
+        "PERSON_1": "Ada Lovelace",
+        "PERSON_1.v_1": "Ada",
+        "PERSON_12": "Grace Hopper",
+        "Jane Roe": "Mary Shelley",
+        "Jane": "Mary",
+        "H_3f2a9c": "Alan Turing",
+    }
+    restorer = PlaceholderRestorer(mapping)
+    restored, used = restorer.restore(
+        "PERSON_1, PERSON_1.v_1, PERSON_1.v_4 and PERSON_12 met Jane Roe, "
+        "Jane, H_3f2a9c, PERSON_3 and XPERSON_1."
+    )
+    assert restored == (
+        "Ada Lovelace, Ada, Ada Lovelace and Grace Hopper met Mary Shelley, "
+        "Mary, Alan Turing, PERSON_3 and XPERSON_1."
+    )
+    assert used == {
+        "PERSON_1",
+        "PERSON_1.v_1",
+        "PERSON_1.v_4",
+        "PERSON_12",
+        "Jane Roe",
+        "Jane",
+        "H_3f2a9c",
+    }
+    assert restorer.not_found == {"PERSON_3", "XPERSON_1"}
+    assert restorer.unused() == ["PERSON_1.v_1"]
+
+
+def test_restorer_scales_to_large_mappings():
+    mapping = {f"PERSON_{i}": f"Person {i}" for i in range(1, 50_001)}
+    mapping.update({f"Fake Name {i}": f"Real Name {i}" for i in range(500)})
+    text = " ".join(f"PERSON_{i}.v_2 / Fake Name {i}" for i in range(1, 500))
+    restorer = PlaceholderRestorer(mapping)
+    restored, _used = restorer.restore(text)
+    assert restored.startswith("Person 1 / Real Name 1 Person 2 /")
+    assert len(restorer.unused()) == len(mapping) - 2 * 499
+
+
+def test_restore_stream_carries_tokens_across_window_edges():
+    mapping = {"PERSON_1": "Ada Lovelace", "Jane Roe": "Mary Shelley"}
+    text = "Jane Roe met PERSON_1.v_2 and\nJane Roe again; PERSON_7 is missing."
+    whole = PlaceholderRestorer(mapping)
+    expected, _used = whole.restore(text)
+    for size in (1, 3, 10):
+        restorer = PlaceholderRestorer(mapping)
+        pieces = [text[i : i + size] for i in range(0, len(text), size)]
+        assert "".join(restorer.restore_stream(pieces)) == expected
+        assert restorer.used == whole.used
+        assert restorer.not_found == {"PERSON_7"}
+
+
+def test_deanonymize_file_stream_matches_in_memory(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    lines = [f"{i}: PERSON_{i % 5 + 1} wrote to Jane Roe, EMAIL_9" for i in range(200)]
+    anonymized_file = tmp_path / "log.anonymized.txt"
+    anonymized_file.write_text("\n".join(lines), encoding="utf-8")
+    mapping = {f"PERSON_{i}": f"Person {i}" for i in range(1, 7)}
+    mapping["Jane Roe"] = "Mary Shelley"
+    mapping_file = tmp_path / "log.mapping.json"
+    mapping_file.write_text(json.dumps(mapping), encoding="utf-8")
+
+    results = {}
+    for stream in (False, True):
+        out, stats = deanonymize_file(
+            str(anonymized_file), str(mapping_file), stream=stream, block_chars=64
+        )
+        results[stream] = (
+            Path(out).read_text(encoding="utf-8"),
+            json.loads(Path(stats).read_text(encoding="utf-8")),
+        )
+    assert results[True] == results[False]
+    restored, stats = results[True]
+    assert restored.startswith("0: Person 1 wrote to Mary Shelley, EMAIL_9\n")
+    assert stats["unused_mappings"] == ["PERSON_6"]
+    assert stats["not_found_mappings"] == ["EMAIL_9"]
@@ -0,0 +1,143 @@
+"""LLM caches: SQLite upserts, eviction, migration, process sharing, entity layer."""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from pdf_anonymizer_core import llm_cache, llm_provider
+from pdf_anonymizer_core.call_llm import identify_entities_with_llm
+from pdf_anonymizer_core.llm_cache import (
+    JsonLLMCache,
+    SQLiteLLMCache,
+    cache_key,
+    migrate_json_cache,
+)
+from pdf_anonymizer_core.prompts import detailed, prompt_version_for
+
+
+def test_upsert_replaces_response(tmp_path) -> None:
+    cache = SQLiteLLMCache(str(tmp_path))
+    assert cache.get("m", "prompt") is None
+    cache.set("m", "prompt", "first")
+    cache.set("m", "prompt", "second")
+    assert cache.get("m", "prompt") == "second"
+    assert cache.get("other", "prompt") is None
+    assert len(cache) == 1
+    cache.close()
+    # Survives reopening.
+    assert SQLiteLLMCache(str(tmp_path)).get("m", "prompt") == "second"
+
+
+def test_evicts_least_recently_used_by_count(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(llm_cache, "_TOUCH_INTERVAL", 0.0)
+    cache = SQLiteLLMCache(str(tmp_path), max_entries=2)
+    cache.set("m", "a", "A")
+    cache.set("m", "b", "B")
+    time.sleep(0.01)
+    assert cache.get("m", "a") == "A"  # a is now more recent than b
+    cache.set("m", "c", "C")
+    assert cache.evict() == 1
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") == "A" and cache.get("m", "c") == "C"
+
+
+def test_evicts_by_size_and_age(tmp_path) -> None:
+    cache = SQLiteLLMCache(str(tmp_path), max_bytes=10)
+    cache.set("m", "a", "x" * 6)
+    time.sleep(0.01)
+    cache.set("m", "b", "y" * 6)
+    cache.evict()
+    assert cache.get("m", "a") is None
+    assert cache.get("m", "b") == "y" * 6
+
+    aged = SQLiteLLMCache(str(tmp_path / "aged"), max_age_seconds=0.0)
+    aged.set("m", "a", "A")
+    time.sleep(0.01)
+    assert aged.get("m", "a") is None
+
+
+def test_migrates_json_cache(tmp_path) -> None:
+    legacy = JsonLLMCache(str(tmp_path), "llm_responses.json")
+    legacy.set("m", "p1", "one")
+    legacy.set("m", "p2", "two")
+    legacy.save()
+    json_path = tmp_path / "llm_responses.json"
+
+    cache = SQLiteLLMCache(str(tmp_path), legacy_json=str(json_path))
+    assert cache.get("m", "p1") == "one" and cache.get("m", "p2") == "two"
+    assert not json_path.exists()
+    assert (tmp_path / "llm_responses.json.migrated").exists()
+
+    # Explicit migration keeps rows that already exist.
+    json_path.write_text(json.dumps({cache_key("m", "p1"): "stale"}))
+    assert migrate_json_cache(str(json_path), cache) == 1
+    assert cache.get("m", "p1") == "one"
+
+
+def _write_entries(path: str, worker: int) -> None:
+    cache = SQLiteLLMCache(path)
+    for i in range(50):
+        cache.set("m", f"{worker}-{i}", f"response {worker} {i}")
+    cache.close()
+
+
+def test_processes_share_one_database(tmp_path) -> None:
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_write_entries, args=(str(tmp_path), n))
+        for n in range(3)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+    cache = SQLiteLLMCache(str(tmp_path))
+    assert len(cache) == 150
+    assert cache.get("m", "2-49") == "response 2 49"
+
+
+def test_configure_cache_picks_backend(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(llm_provider, "_cache_instance", None)
+    monkeypatch.setattr(llm_provider, "_cache_enabled", True)
+    llm_provider.configure_cache(True, str(tmp_path), "responses.json")
+    assert isinstance(llm_provider._cache_instance, JsonLLMCache)
+    llm_provider.configure_cache(True, str(tmp_path), "responses.sqlite3")
+    assert isinstance(llm_provider._cache_instance, SQLiteLLMCache)
+    with pytest.raises(ValueError):
+        llm_provider.configure_cache(True, str(tmp_path), backend="redis")
+    llm_provider.configure_cache(False)
+    assert llm_provider._cache_instance is None
+
+
+def test_entity_cache_skips_provider_for_unchanged_chunk(tmp_path, mocker) -> None:
+    llm_provider.configure_cache(True, str(tmp_path))
+    provider = mocker.MagicMock()
+    provider.call.return_value = '{"entities": [{"text": "Ann", "type": "PERSON"}]}'
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+
+    first = identify_entities_with_llm("Ann called.\r\n", "{text}", "google/m")
+    # Same chunk with other line endings, same prompt version, new wording.
+    again = identify_entities_with_llm(
+        "Ann called.", "Find PII: {text}", "google/m", prompt_version="v"
+    )
+    assert provider.call.call_count == 2  # different version -> miss
+    third = identify_entities_with_llm(
+        "  Ann called.  ", "Find  PII:\n{text}", "google/m", prompt_version="v"
+    )
+    assert provider.call.call_count == 2
+    assert (
+        first
+        == again
+        == third
+        == [{"text": "Ann", "type": "PERSON", "base_form": None}]
+    )
+    llm_provider.configure_cache(False)
+
+
+def test_prompt_versions() -> None:
+    assert prompt_version_for(detailed.prompt_template) == "detailed:1"
+    assert prompt_version_for("Find {text}") == prompt_version_for("Find\n  {text}")
+    assert prompt_version_for("Find {text}") != prompt_version_for("List {text}")
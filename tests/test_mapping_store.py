@@ -0,0 +1,166 @@
+"""SQLite mapping store for cross-document runs."""
+
+import json
+import stat
+
+import pytest
+from typer.testing import CliRunner
+
+from pdf_anonymizer_cli.cli import app
+from pdf_anonymizer_core.core import anonymize_file
+from pdf_anonymizer_core.mapping_store import SQLiteMappingStore, is_mapping_store
+
+ENTRIES = {
+    "Ada Lovelace": "PERSON_1",
+    "Ada": "PERSON_1.v_1",
+    "Acme Inc.": "ORGANIZATION_3",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fast_kdf(mocker):
+    mocker.patch(
+        "pdf_anonymizer_core.mapping_store.derive_store_key",
+        side_effect=lambda passphrase, salt: (passphrase.encode() * 32)[:32],
+    )
+
+
+class TestSQLiteMappingStore:
+    def test_entries_and_counters_persist(self, tmp_path) -> None:
+        path = tmp_path / "maps" / "corpus.sqlite3"
+        store = SQLiteMappingStore(path)
+        store.upsert(ENTRIES)
+        store.close()
+
+        reopened = SQLiteMappingStore(path)
+        assert is_mapping_store(path)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert len(reopened) == 3
+        assert reopened.lookup(["Ada", "Bob"]) == {"Ada": "PERSON_1.v_1"}
+        assert reopened.counters() == (
+            {"PERSON": 1, "ORGANIZATION": 3},
+            {"PERSON_1": 1},
+        )
+        assert dict(reopened.items()) == ENTRIES
+
+    def test_containing_needs_every_word(self, tmp_path) -> None:
+        store = SQLiteMappingStore(tmp_path / "m.sqlite3")
+        store.upsert({**ENTRIES, "Anna Lee": "PERSON_2"})
+        assert store.containing(["Lovelace"]) == {"Ada Lovelace": "PERSON_1"}
+        assert store.containing(["ada lovelace"]) == {}
+        assert store.containing(["Ann"]) == {}
+
+    def test_encrypted_store_hides_originals(self, tmp_path) -> None:
+        path = tmp_path / "m.sqlite3"
+        store = SQLiteMappingStore(path, "secret")
+        store.upsert(ENTRIES)
+        assert store.lookup(["Ada Lovelace"]) == {"Ada Lovelace": "PERSON_1"}
+        assert store.containing(["Lovelace"]) == {"Ada Lovelace": "PERSON_1"}
+        store.close()
+
+        raw = b"".join(p.read_bytes() for p in tmp_path.glob("m.sqlite3*"))
+        assert b"Lovelace" not in raw and b"PERSON_1" in raw
+        assert dict(SQLiteMappingStore(path, "secret").items()) == ENTRIES
+        with pytest.raises(ValueError, match="encrypted"):
+            SQLiteMappingStore(path)
+        with pytest.raises(ValueError, match="passphrase"):
+            SQLiteMappingStore(path, "wrong")
+
+    def test_json_file_is_not_a_store(self, tmp_path) -> None:
+        path = tmp_path / "m.json"
+        path.write_text("{}", encoding="utf-8")
+        assert not is_mapping_store(path)
+        with pytest.raises(ValueError):
+            SQLiteMappingStore(path)
+
+
+def _person(text, base_form=None):
+    return {"text": text, "type": "PERSON", "base_form": base_form or text}
+
+
+def test_anonymize_file_numbers_against_the_store(tmp_path, mocker) -> None:
+    store = SQLiteMappingStore(tmp_path / "m.sqlite3")
+    store.upsert(ENTRIES)
+    source = tmp_path / "note.txt"
+    source.write_text("Lovelace wrote to Grace Hopper.", encoding="utf-8")
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        return_value=[_person("Lovelace"), _person("Grace Hopper")],
+    )
+    mocker.patch("pdf_anonymizer_core.core.extract_entities_via_regex", return_value=[])
+
+    text, mapping = anonymize_file(
+        str(source), 1000, "{text}", "dummy", mapping_store=store
+    )
+    seeded_text, seeded = anonymize_file(
+        str(source), 1000, "{text}", "dummy", seed_mapping=ENTRIES
+    )
+
+    assert text == seeded_text == "PERSON_1.v_2 wrote to PERSON_2."
+    assert mapping == {
+        "Lovelace": "PERSON_1.v_2",
+        "Ada Lovelace": "PERSON_1",
+        "Grace Hopper": "PERSON_2",
+    }
+    assert mapping.items() <= seeded.items()
+    assert store.lookup(["Grace Hopper", "Lovelace"]) == {
+        "Grace Hopper": "PERSON_2",
+        "Lovelace": "PERSON_1.v_2",
+    }
+    assert store.counters()[0]["PERSON"] == 2
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_import_then_run_with_a_store(tmp_path, monkeypatch, jobs) -> None:
+    monkeypatch.chdir(tmp_path)
+    previous = tmp_path / "old.mapping.json"
+    previous.write_text(json.dumps({"EMAIL_4": "known@example.com"}), encoding="utf-8")
+    store = tmp_path / "corpus.sqlite3"
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["import-mapping", str(previous), "--store", str(store)]
+    )
+    assert result.exit_code == 0, result.output
+
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"memo{i}.txt"
+        path.write_text(
+            f"Mail known@example.com and new{i}@example.com.", encoding="utf-8"
+        )
+        paths.append(str(path))
+    args = ["run", *paths, "--no-llm", "--no-verify", "--no-risk"]
+    result = runner.invoke(app, [*args, "--mapping-in", str(store), "--jobs", jobs])
+    assert result.exit_code == 0, result.output
+
+    entries = dict(SQLiteMappingStore(store).items())
+    assert entries["known@example.com"] == "EMAIL_4"
+    assert {entries["new0@example.com"], entries["new1@example.com"]} == {
+        "EMAIL_5",
+        "EMAIL_6",
+    }
+    for i in range(2):
+        output = tmp_path / "data" / "anonymized" / f"memo{i}.anonymized.txt"
+        assert "EMAIL_4" in output.read_text(encoding="utf-8")
+
+
+def test_cli_closes_the_store_even_when_a_file_fails(
+    tmp_path, monkeypatch, mocker
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    store = tmp_path / "corpus.sqlite3"
+    broken = tmp_path / "broken.mapping.json"
+    broken.write_text(json.dumps(["not", "a", "mapping"]), encoding="utf-8")
+    closes = mocker.spy(SQLiteMappingStore, "close")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["import-mapping", str(broken), "--store", str(store)])
+    assert result.exit_code == 1
+    assert closes.call_count == 1
+
+    memo = tmp_path / "memo.txt"
+    memo.write_text("Mail known@example.com.", encoding="utf-8")
+    args = ["run", str(memo), "--no-llm", "--no-verify", "--no-risk"]
+    result = runner.invoke(app, [*args, "--mapping-in", str(store)])
+    assert result.exit_code == 0, result.output
+    assert closes.call_count == 2
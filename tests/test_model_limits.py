@@ -0,0 +1,240 @@
+"""Token-budget chunk sizing and shrink-on-truncation retries."""
+
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from pdf_anonymizer_core.call_llm import (
+    aidentify_entities_with_llm,
+    identify_entities_with_llm,
+)
+from pdf_anonymizer_core.conf import MIN_TOKEN_BUDGET_CHUNK
+from pdf_anonymizer_core import llm_provider
+from pdf_anonymizer_core.llm_provider import (
+    AnthropicProvider,
+    GoogleProvider,
+    HuggingFaceProvider,
+    LLMProvider,
+    OllamaProvider,
+    OpenAIProvider,
+    OpenRouterProvider,
+)
+from pdf_anonymizer_core.model_limits import (
+    DEFAULT_MODEL_LIMITS,
+    PROVIDER_LIMITS,
+    limits_for,
+    token_budget_chunk_size,
+)
+
+
+class TestLimitsTable:
+    def test_alias_and_provider_model_strings_resolve(self) -> None:
+        assert limits_for("gpt-4o").max_output_tokens == 16_384
+        assert limits_for("openai/gpt-4o") == limits_for("gpt-4o")
+        assert limits_for("gemini-2.5-flash").context_tokens == 1_048_576
+
+    def test_longest_prefix_wins(self) -> None:
+        assert limits_for("anthropic/claude-3-5-haiku").max_output_tokens == 8_192
+        assert limits_for("anthropic/claude-3-haiku").max_output_tokens == 4_096
+
+    def test_provider_entry_and_default(self) -> None:
+        assert limits_for("ollama/llama3.1:70b") == PROVIDER_LIMITS["ollama"]
+        assert limits_for("openai/some-new-model") == DEFAULT_MODEL_LIMITS
+
+    def test_unknown_model_string_raises(self) -> None:
+        with pytest.raises(ValueError):
+            limits_for("not-a-model")
+
+
+class TestTokenBudget:
+    def test_output_limit_bounds_large_context_models(self) -> None:
+        limits = limits_for("gpt-4o")
+        size = token_budget_chunk_size("gpt-4o", "{text}")
+        by_output = limits.max_output_tokens * limits.chars_per_token / 0.25
+        assert size == int(by_output * 0.8)
+
+    def test_context_bounds_small_windows(self) -> None:
+        prompt = "Find PII. " * 200 + "{text}"
+        limits = limits_for("ollama/phi4-mini")
+        size = token_budget_chunk_size("ollama/phi4-mini", prompt)
+        assert size < limits.context_tokens * limits.chars_per_token
+        assert size < token_budget_chunk_size("ollama/phi4-mini", "{text}")
+
+    def test_never_below_the_floor(self) -> None:
+        prompt = "x" * 20_000 + "{text}"
+        assert token_budget_chunk_size("ollama/phi4-mini", prompt) == (
+            MIN_TOKEN_BUDGET_CHUNK
+        )
+
+    def test_anthropic_max_tokens_follow_the_table(self) -> None:
+        assert AnthropicProvider._max_tokens("claude-3-5-sonnet", None) == 8_192
+        assert AnthropicProvider._max_tokens("claude-3-5-sonnet", 512) == 512
+
+
+def test_anthropic_sync_and_async_calls_return_message_text(monkeypatch) -> None:
+    calls = []
+    message = SimpleNamespace(content=[SimpleNamespace(text='{"entities": []}')])
+
+    class _Messages:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            return message
+
+    class _AsyncMessages:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            return message
+
+    class _Anthropic:
+        def __init__(self, api_key=None) -> None:
+            self.messages = _Messages()
+
+    class _AsyncAnthropic:
+        def __init__(self, api_key=None) -> None:
+            self.messages = _AsyncMessages()
+
+    sdk = SimpleNamespace(Anthropic=_Anthropic, AsyncAnthropic=_AsyncAnthropic)
+    monkeypatch.setitem(sys.modules, "anthropic", sdk)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+    provider = AnthropicProvider()
+
+    text = provider._call_raw("prompt", "claude-3-5-sonnet")
+    atext = asyncio.run(provider._acall_raw("prompt", "claude-3-5-sonnet", 512))
+    assert text == atext == '{"entities": []}'
+    assert [call["max_tokens"] for call in calls] == [8_192, 512]
+    assert all("stream" not in call for call in calls)
+
+
+class _Recorder:
+    """Stands in for any SDK client: every attribute leads to one call."""
+
+    def __init__(self, response) -> None:
+        self.response = response
+        self.kwargs: list = []
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, **kwargs):
+        self.kwargs.append(kwargs)
+        return self.response
+
+
+_MESSAGE = SimpleNamespace(message=SimpleNamespace(content="ok"))
+_CHAT = SimpleNamespace(choices=[_MESSAGE])
+
+
+@pytest.mark.parametrize(
+    "provider_class, response, limit",
+    [
+        (
+            GoogleProvider,
+            SimpleNamespace(text="ok"),
+            lambda kw: kw.get("config", {}).get("max_output_tokens"),
+        ),
+        (
+            OllamaProvider,
+            {"message": {"content": "ok"}},
+            lambda kw: kw.get("options", {}).get("num_predict"),
+        ),
+        (HuggingFaceProvider, _CHAT, lambda kw: kw.get("max_tokens")),
+        (OpenRouterProvider, _CHAT, lambda kw: kw.get("max_tokens")),
+        (OpenAIProvider, _CHAT, lambda kw: kw.get("max_completion_tokens")),
+    ],
+)
+def test_every_provider_sends_the_output_limit(provider_class, response, limit) -> None:
+    provider = provider_class.__new__(provider_class)
+    LLMProvider.__init__(provider)
+    provider._client = client = _Recorder(response)
+
+    assert provider._call_raw("prompt", "model", 512) == "ok"
+    assert provider._call_raw("prompt", "model") == "ok"
+    assert [limit(kwargs) for kwargs in client.kwargs] == [512, None]
+
+
+class _CutOffProvider(LLMProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def _new_client(self):
+        return None
+
+    def _new_async_client(self):
+        return None
+
+    def _call_raw(self, prompt, model_name, max_output_tokens=None):
+        self.calls += 1
+        return '{"entities": [{"text": "Ann'
+
+
+def test_cut_off_response_is_not_cached(tmp_path, mocker) -> None:
+    llm_provider.configure_cache(True, str(tmp_path))
+    provider = _CutOffProvider()
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+    mocker.patch("pdf_anonymizer_core.call_llm.time.sleep")
+    try:
+        entities = identify_entities_with_llm("Ann", "{text}", "gpt-4o", max_retries=2)
+        assert entities == []
+        assert provider.calls == 2
+        assert llm_provider.active_cache().get("gpt-4o", "Ann") is None
+    finally:
+        llm_provider.configure_cache(False)
+
+
+PARAGRAPHS = [f"Paragraph {i} mentions Person{i} Example." for i in range(60)]
+LONG_TEXT = "\n\n".join(PARAGRAPHS)
+
+
+def _answer(prompt, model_name, max_output_tokens=None, cacheable=None):
+    """Cut off any answer for the whole text; answer halves in full."""
+    names = [f"Person{i} Example" for i in range(60) if f"Person{i} " in prompt]
+    payload = json.dumps(
+        {"entities": [{"text": n, "type": "PERSON", "base_form": n} for n in names]}
+    )
+    if prompt == LONG_TEXT:
+        return payload[: len(payload) // 2]
+    return payload
+
+
+def test_cut_off_response_is_retried_as_halves(mocker) -> None:
+    provider = mocker.Mock()
+    provider.call.side_effect = _answer
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+    mocker.patch("pdf_anonymizer_core.call_llm.time.sleep")
+
+    entities = identify_entities_with_llm(LONG_TEXT, "{text}", "gpt-4o")
+
+    assert {e["text"] for e in entities} == {f"Person{i} Example" for i in range(60)}
+    halves = [call.args[0] for call in provider.call.call_args_list[1:]]
+    assert len(halves) == 2 and "".join(halves) == LONG_TEXT
+    assert halves[0].endswith("\n\n")
+    assert provider.call.call_args.kwargs["max_output_tokens"] == 16_384
+
+
+def test_short_chunk_that_is_cut_off_is_retried_whole(mocker) -> None:
+    provider = mocker.Mock()
+    provider.call.return_value = '{"entities": [{"text": "Ann'
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+    mocker.patch("pdf_anonymizer_core.call_llm.time.sleep")
+
+    assert identify_entities_with_llm("Ann", "{text}", "gpt-4o", max_retries=2) == []
+    assert provider.call.call_count == 2
+
+
+def test_async_cut_off_response_is_retried_as_halves(mocker) -> None:
+    provider = mocker.Mock()
+
+    async def acall(prompt, model_name, max_output_tokens=None, cacheable=None):
+        return _answer(prompt, model_name, max_output_tokens)
+
+    provider.acall.side_effect = acall
+    mocker.patch("pdf_anonymizer_core.call_llm.get_provider", return_value=provider)
+
+    entities = asyncio.run(aidentify_entities_with_llm(LONG_TEXT, "{text}", "gpt-4o"))
+
+    assert len(entities) == 60
+    assert provider.acall.call_count == 3
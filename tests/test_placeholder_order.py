@@ -0,0 +1,133 @@
+"""Order-independent placeholder numbering."""
+
+import threading
+
+from typer.testing import CliRunner
+
+from pdf_anonymizer_cli.cli import app
+from pdf_anonymizer_core.coordinator import MappingCoordinator
+from pdf_anonymizer_core.core import anonymize_file, build_mapping, order_for_numbering
+
+TEXT = "Zoe Adams called. Later Bob Young and Zoe met Acme Corp."
+ENTITIES = [
+    {"text": "Acme Corp", "type": "ORGANIZATION", "base_form": "Acme Corp"},
+    {"text": "Bob Young", "type": "PERSON", "base_form": "Bob Young"},
+    {"text": "Zoe", "type": "PERSON", "base_form": "Zoe Adams"},
+    {"text": "Zoe Adams", "type": "PERSON", "base_form": "Zoe Adams"},
+]
+
+
+def _run(tmp_path, mocker, entities, order):
+    source = tmp_path / "call.txt"
+    source.write_text(TEXT, encoding="utf-8")
+    mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm",
+        return_value=[dict(entity) for entity in entities],
+    )
+    return anonymize_file(str(source), 1000, "{text}", "dummy", placeholder_order=order)
+
+
+def test_arrival_follows_detection_order(tmp_path, mocker) -> None:
+    _text, mapping = _run(tmp_path, mocker, ENTITIES, "arrival")
+    assert mapping["Bob Young"] == "PERSON_1"
+    _text, reversed_mapping = _run(tmp_path, mocker, ENTITIES[::-1], "arrival")
+    assert reversed_mapping["Bob Young"] == "PERSON_2"
+
+
+def test_offset_numbers_by_first_occurrence(tmp_path, mocker) -> None:
+    forward = _run(tmp_path, mocker, ENTITIES, "offset")
+    backward = _run(tmp_path, mocker, ENTITIES[::-1], "offset")
+    assert forward == backward
+    _text, mapping = forward
+    assert mapping["Zoe Adams"] == "PERSON_1"
+    assert mapping["Zoe"] == "PERSON_1.v_1"
+    assert mapping["Bob Young"] == "PERSON_2"
+
+
+def test_sorted_numbers_by_type_and_text(tmp_path, mocker) -> None:
+    forward = _run(tmp_path, mocker, ENTITIES, "sorted")
+    assert forward == _run(tmp_path, mocker, ENTITIES[::-1], "sorted")
+    assert forward[1]["Bob Young"] == "PERSON_1"
+    assert forward[1]["Zoe"] == "PERSON_2.v_1"
+
+
+def test_missing_texts_sort_after_found_ones() -> None:
+    entities = [
+        {"text": "Nowhere", "type": "PERSON", "base_form": "Nowhere"},
+        {"text": "Bob Young", "type": "PERSON", "base_form": "Bob Young"},
+    ]
+    ordered = order_for_numbering(entities, "offset", TEXT)
+    assert [e["text"] for e in ordered] == ["Bob Young", "Nowhere"]
+
+
+def test_ordered_coordinator_matches_sequential_numbering() -> None:
+    files = [
+        [{"text": f"Person {i}", "type": "PERSON", "base_form": None}]
+        + [{"text": "Shared", "type": "PERSON", "base_form": None}]
+        for i in range(6)
+    ]
+    expected = {}
+    for entities in files:
+        expected = build_mapping(
+            [dict(e) for e in entities],
+            seed_mapping=expected,
+            operators=None,
+            fake_secret=None,
+        )
+
+    coordinator = MappingCoordinator(ordered=True)
+    results = {}
+
+    def worker(turn: int) -> None:
+        entities = [dict(e) for e in files[turn]]
+        results[turn] = coordinator.assign(entities, turn)
+
+    # Later files are started first; they wait for their turn.
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(5, -1, -1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results[5] == expected
+    assert coordinator.snapshot() == expected
+
+
+def test_released_turn_lets_later_files_go() -> None:
+    coordinator = MappingCoordinator(ordered=True)
+    coordinator.release(0)
+    entity = {"text": "Ann", "type": "PERSON", "base_form": None}
+    assert coordinator.assign([entity], 1) == {"Ann": "PERSON_1"}
+
+
+def test_cli_jobs_with_offset_order_matches_a_sequential_run(
+    tmp_path, monkeypatch
+) -> None:
+    sources = tmp_path / "in"
+    sources.mkdir()
+    paths = []
+    for i in range(4):
+        path = sources / f"memo{i}.txt"
+        path.write_text(
+            f"From own{i}@example.com to shared@example.com, "
+            f"cc team{3 - i}@example.com.",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+
+    outputs = {}
+    for name, extra in (("seq", []), ("jobs", ["--jobs", "3"])):
+        run_dir = tmp_path / name
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        args = ["run", *paths, "--no-llm", "--no-verify", "--no-risk"]
+        result = CliRunner().invoke(
+            app, [*args, "--placeholder-order", "offset", *extra]
+        )
+        assert result.exit_code == 0, result.output
+        outputs[name] = {
+            str(path.relative_to(run_dir)): path.read_bytes()
+            for path in sorted((run_dir / "data").rglob("*.*"))
+            if path.parent.name in ("anonymized", "mappings")
+        }
+    assert len(outputs["seq"]) == 8
+    assert outputs["jobs"] == outputs["seq"]
@@ -0,0 +1,98 @@
+"""Regex pre-masking of chunks sent to the LLM."""
+
+import asyncio
+
+from pdf_anonymizer_core.conf import DEFAULT_REGEX_PATTERNS
+from pdf_anonymizer_core.core import aanonymize_file, anonymize_file
+from pdf_anonymizer_core.premask import premask_chunk
+from pdf_anonymizer_core.regex_ner import extract_entities_via_regex
+
+TEXT = (
+    "Ann Lee <ann.lee@example.com> wrote twice to ann.lee@example.com. "
+    "Pay IBAN DE89370400440532013000 before Friday."
+)
+
+
+def _masked(text):
+    return premask_chunk(text, extract_entities_via_regex(text, DEFAULT_REGEX_PATTERNS))
+
+
+class TestPremaskChunk:
+    def test_same_value_gets_the_same_token(self) -> None:
+        masked = _masked(TEXT)
+        assert masked.text == (
+            "Ann Lee <[EMAIL_1]> wrote twice to [EMAIL_1]. "
+            "Pay IBAN [IBAN_1] before Friday."
+        )
+        assert masked.originals == {
+            "[EMAIL_1]": "ann.lee@example.com",
+            "[IBAN_1]": "DE89370400440532013000",
+        }
+
+    def test_nothing_to_mask(self) -> None:
+        assert _masked("Ann Lee wrote a letter.") is None
+
+    def test_token_shaped_text_is_sent_unmasked(self) -> None:
+        assert _masked("See [EMAIL_1] in ann@example.com") is None
+
+    def test_restore_puts_values_back_and_drops_token_only_hits(self) -> None:
+        masked = _masked(TEXT)
+        restored = masked.restore(
+            [
+                {
+                    "text": "Ann Lee <[EMAIL_1]>",
+                    "type": "PERSON",
+                    "base_form": "Ann Lee",
+                },
+                {"text": "[EMAIL_1]", "type": "EMAIL", "base_form": "[EMAIL_1]"},
+                {"text": "IBAN_1", "type": "IBAN", "base_form": None},
+            ]
+        )
+        assert restored == [
+            {
+                "text": "Ann Lee <ann.lee@example.com>",
+                "type": "PERSON",
+                "base_form": "Ann Lee",
+            }
+        ]
+
+
+def _person(text, *_args, **_kwargs):
+    return [{"text": "Ann Lee", "type": "PERSON", "base_form": "Ann Lee"}] + [
+        {"text": token, "type": "EMAIL", "base_form": token}
+        for token in ("[EMAIL_1]",)
+        if token in text
+    ]
+
+
+def test_anonymize_file_never_sends_regex_values(tmp_path, mocker) -> None:
+    source = tmp_path / "note.txt"
+    source.write_text(TEXT, encoding="utf-8")
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.identify_entities_with_llm", side_effect=_person
+    )
+
+    text, mapping = anonymize_file(str(source), 1000, "{text}", "dummy", premask=True)
+
+    [sent] = [call.args[0] for call in llm.call_args_list]
+    assert "ann.lee@example.com" not in sent and "DE8937" not in sent
+    assert "[EMAIL_1]" not in mapping
+    assert set(mapping) == {"Ann Lee", "ann.lee@example.com", "DE89370400440532013000"}
+    assert "ann.lee" not in text and "Ann Lee" not in text
+
+
+def test_async_premask(tmp_path, mocker) -> None:
+    source = tmp_path / "note.txt"
+    source.write_text(TEXT, encoding="utf-8")
+
+    async def identify(text, *_args, **_kwargs):
+        return _person(text)
+
+    llm = mocker.patch(
+        "pdf_anonymizer_core.core.aidentify_entities_with_llm", side_effect=identify
+    )
+    _text, mapping = asyncio.run(
+        aanonymize_file(str(source), 1000, "{text}", "dummy", premask=True)
+    )
+    assert "[IBAN_1]" in llm.call_args.args[0]
+    assert "[EMAIL_1]" not in mapping and "Ann Lee" in mapping
@@ -0,0 +1,162 @@
+"""Provider registry: one shared instance and pooled client per credentials."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pdf_anonymizer_core import llm_provider
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _AsyncClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _FakeProvider(llm_provider.LLMProvider):
+    credential_env = "FAKE_PROVIDER_KEY"
+    built = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        type(self).built += 1
+
+    def _new_client(self):
+        return _Client()
+
+    def _new_async_client(self):
+        return _AsyncClient()
+
+    def _call_raw(self, prompt, model_name, max_output_tokens=None):
+        return f"{id(self.client())}"
+
+
+@pytest.fixture
+def fake_registry(monkeypatch):
+    monkeypatch.setitem(llm_provider.PROVIDER_CLASSES, "fake", _FakeProvider)
+    monkeypatch.setattr(llm_provider, "_provider_registry", {})
+    monkeypatch.setattr(llm_provider, "_cache_enabled", False)
+    monkeypatch.setenv("FAKE_PROVIDER_KEY", "key-1")
+    _FakeProvider.built = 0
+    yield
+    llm_provider.close_providers()
+
+
+def test_same_instance_and_client_across_threads(fake_registry) -> None:
+    seen = []
+
+    def worker() -> None:
+        provider = llm_provider.get_provider("fake")
+        seen.append((provider, provider.client()))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _FakeProvider.built == 1
+    assert len({id(provider) for provider, _ in seen}) == 1
+    assert len({id(client) for _, client in seen}) == 1
+
+
+def test_rotated_credentials_get_a_new_instance(fake_registry, monkeypatch) -> None:
+    first = llm_provider.get_provider("fake")
+    old_client = first.client()
+    monkeypatch.setenv("FAKE_PROVIDER_KEY", "key-2")
+    second = llm_provider.get_provider("fake")
+    assert first is not second
+    # Calls already in flight on the old instance must be able to finish.
+    assert not old_client.closed
+    assert first.client() is old_client
+    assert list(llm_provider._provider_registry.values()) == [second]
+    for key in llm_provider._provider_registry:
+        assert "key-" not in "".join(key)
+
+
+def test_close_releases_clients_and_rebuilds(fake_registry) -> None:
+    provider = llm_provider.get_provider("fake")
+    client = provider.client()
+    llm_provider.close_providers()
+    assert client.closed
+    assert llm_provider._provider_registry == {}
+    assert provider.client() is not client
+
+
+def test_async_client_per_loop_and_aclose(fake_registry) -> None:
+    provider = llm_provider.get_provider("fake")
+
+    async def use() -> _AsyncClient:
+        client = provider.async_client()
+        assert provider.async_client() is client
+        return client
+
+    async def run() -> _AsyncClient:
+        client = await use()
+        await llm_provider.aclose_providers()
+        return client
+
+    client = asyncio.run(run())
+    assert client.closed
+
+
+def test_base_class_requires_client_factories() -> None:
+    class _NoClients(llm_provider.LLMProvider):
+        def _call_raw(self, prompt, model_name, max_output_tokens=None):
+            return ""
+
+    with pytest.raises(TypeError):
+        _NoClients()
+
+
+def test_google_async_client_keeps_its_parent(monkeypatch) -> None:
+    parents = []
+
+    class _Models:
+        async def generate_content(self, model, contents):
+            return type("Response", (), {"text": f"{model}:{contents}"})()
+
+    class _Aio:
+        def __init__(self) -> None:
+            self.models = _Models()
+            self.closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    class _GenaiClient(_Client):
+        def __init__(self) -> None:
+            super().__init__()
+            self.aio = _Aio()
+            parents.append(self)
+
+    monkeypatch.setenv("GOOGLE_API_KEY", "key")
+    monkeypatch.setattr(llm_provider, "_cache_enabled", False)
+    provider = llm_provider.GoogleProvider.__new__(llm_provider.GoogleProvider)
+    llm_provider.LLMProvider.__init__(provider)
+    provider.genai = type("genai", (), {"Client": _GenaiClient})
+
+    async def run() -> str:
+        out = await provider.acall("hi", "m")
+        await provider.aclose()
+        return out
+
+    assert asyncio.run(run()) == "m:hi"
+    assert len(parents) == 1
+    assert parents[0].aio.closed and parents[0].closed
+
+
+def test_unknown_provider_raises() -> None:
+    with pytest.raises(ValueError):
+        llm_provider.get_provider("nope")
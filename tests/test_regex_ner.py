@@ -1,7 +1,14 @@
 import unittest
 
 from pdf_anonymizer_core.conf import DEFAULT_REGEX_PATTERNS
-from pdf_anonymizer_core.regex_ner import extract_entities_via_regex
+import re2
+
+from pdf_anonymizer_core.regex_ner import (
+    SET_PREFILTER_MAX_CHARS,
+    RegexScanner,
+    extract_entities_via_regex,
+    get_regex_scanner,
+)
 
 
 def _extract_types(text: str, only: list[str] | None = None) -> list[str]:
@@ -304,5 +311,48 @@ class TestFullDefaultIntegration(unittest.TestCase):
         self.assertIn("1FTFW1EF0EFA00001", texts)
 
 
+def _scan_every_pattern(text: str, patterns: dict) -> list:
+    """Reference: run each pattern in dict order with no pre-pass."""
+    out = []
+    for pattern in patterns.values():
+        for match in re2.compile(pattern).finditer(text):
+            if match.group(0).strip():
+                out.append((match.group(0), match.start(), match.end()))
+    return out
+
+
+class TestRegexScanner(unittest.TestCase):
+    SAMPLES = [
+        "",
+        "Jane Smith",
+        "Austin, TX",
+        "alice@example.com 123-45-6789 DE89370400440532013000",
+        "Card 4242-4242-4242-4242, VIN 1FTFW1EF0EFA00001, 2024-01-31",
+    ]
+
+    def test_same_hits_as_every_pattern(self):
+        scanner = RegexScanner(DEFAULT_REGEX_PATTERNS)
+        long_text = " ".join(self.SAMPLES) * (SET_PREFILTER_MAX_CHARS // 50)
+        for text in [*self.SAMPLES, long_text]:
+            got = [(e["text"], e["start"], e["end"]) for e in scanner.scan(text)]
+            self.assertEqual(got, _scan_every_pattern(text, DEFAULT_REGEX_PATTERNS))
+
+    def test_scan_many_and_shared_instance(self):
+        scanner = get_regex_scanner(DEFAULT_REGEX_PATTERNS)
+        self.assertIs(scanner, get_regex_scanner(dict(DEFAULT_REGEX_PATTERNS)))
+        many = scanner.scan_many(self.SAMPLES)
+        self.assertEqual(many, [scanner.scan(text) for text in self.SAMPLES])
+        self.assertEqual(many[1], [])
+
+    def test_invalid_pattern_is_skipped_once(self):
+        with self.assertLogs(level="ERROR") as logs:
+            scanner = RegexScanner(
+                {"BAD": "(", "EMAIL": DEFAULT_REGEX_PATTERNS["EMAIL"]}
+            )
+        self.assertEqual(len(logs.records), 1)
+        types = {e["type"] for e in scanner.scan("bob@example.org")}
+        self.assertEqual(types, {"EMAIL"})
+
+
 if __name__ == "__main__":
     unittest.main()
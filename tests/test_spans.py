@@ -1,11 +1,18 @@
 """Span-based replacement: longest interval wins, no overlap."""
 
 from pdf_anonymizer_core.core import anonymize_file
+import io
+import random
+import re
+
 from pdf_anonymizer_core.spans import (
+    SpanLocator,
     apply_spans,
     locate_spans,
     pick_non_overlapping,
     replace_entities,
+    trie_pattern,
+    write_replaced_entities,
 )
 
 
@@ -46,3 +53,80 @@ def test_anonymize_uses_spans(mocker) -> None:
     assert "John Doe" not in anonymized
     assert "Johnson" in anonymized
     assert anonymized.startswith("PERSON_1")
+
+
+def test_locator_matches_per_entity_scan() -> None:
+    rng = random.Random(7)
+    alphabet = "ab _-.é1"
+    for _ in range(500):
+        entities = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        expected = sorted(locate_spans(text, entities))
+        assert sorted(SpanLocator(entities).locate(text)) == expected
+
+
+def test_locator_keeps_prefix_and_boundary_hits() -> None:
+    text = "John Doe, Johnson and aa aaaa (Acme) Inc."
+    entities = ["John", "John Doe", "aa", "(Acme)", "Inc."]
+    spans = SpanLocator(entities).locate(text)
+    assert sorted(spans) == sorted(locate_spans(text, entities))
+    assert (0, 4, "John") in spans and (0, 8, "John Doe") in spans
+    assert (10, 14, "John") not in spans
+
+
+def test_replace_entities_reuses_locator() -> None:
+    mapping = {"John Doe": "PERSON_1", "John": "PERSON_1.v_1"}
+    locator = SpanLocator(mapping)
+    texts = ["John Doe met John.", "Johnson saw John."]
+    out = [replace_entities(text, [], mapping, locator=locator) for text in texts]
+    assert out == ["PERSON_1 met PERSON_1.v_1.", "Johnson saw PERSON_1.v_1."]
+
+
+def _pick_by_linear_scan(spans):
+    ordered = sorted(
+        spans, key=lambda item: (item[1] - item[0], -item[0]), reverse=True
+    )
+    accepted = []
+    for start, end, text in ordered:
+        if any(not (end <= s or start >= e) for s, e, _ in accepted):
+            continue
+        accepted.append((start, end, text))
+    return accepted
+
+
+def test_pick_non_overlapping_matches_linear_scan() -> None:
+    rng = random.Random(11)
+    for size in (0, 1, 5, 50, 3000):
+        spans = []
+        for _ in range(size):
+            start = rng.randrange(size * 4 + 1)
+            spans.append((start, start + rng.randint(1, 12), "x"))
+        assert pick_non_overlapping(spans) == _pick_by_linear_scan(spans)
+
+
+def test_pick_non_overlapping_prefers_leftmost_on_ties() -> None:
+    spans = [(2, 5, "b"), (0, 3, "a"), (4, 7, "c")]
+    assert pick_non_overlapping(spans) == [(0, 3, "a"), (4, 7, "c")]
+
+
+def test_trie_pattern_escapes_and_prefers_the_longest_entry() -> None:
+    words = ["a.b", "a.bc", "a+", "ab", "a"]
+    pattern = re.compile(trie_pattern(words))
+    assert pattern.fullmatch("a.bc") and not pattern.fullmatch("axb")
+    assert [pattern.match(word).group() for word in words] == words
+    assert pattern.match("a.bcd").group() == "a.bc"
+
+
+def test_apply_spans_writes_to_handle() -> None:
+    text = "John Doe met John at Acme."
+    spans = pick_non_overlapping(locate_spans(text, ["John Doe", "John", "Acme"]))
+    mapping = {"John Doe": "PERSON_1", "John": "PERSON_1.v_1"}
+    expected = "PERSON_1 met PERSON_1.v_1 at Acme."
+    assert apply_spans(text, spans, mapping) == expected
+    buffer = io.StringIO()
+    write_replaced_entities(buffer, text, ["John Doe", "John"], mapping)
+    assert buffer.getvalue() == expected
+    assert apply_spans(text, [], mapping) == text
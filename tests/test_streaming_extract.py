@@ -0,0 +1,76 @@
+"""Streaming and parallel extraction: page batches, rolling chunk buffer, page slices."""
+
+import random
+import tracemalloc
+
+import pymupdf
+import pytest
+
+from pdf_anonymizer_core.load_and_extract import (
+    convert_pdf_parallel,
+    iter_document_text,
+    iter_pdf_markdown,
+    iter_text_chunks,
+    load_and_extract_text_from_file,
+)
+
+
+def _write_pdf(path, pages: int = 5) -> None:
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Chapter {number}", fontsize=20)
+        for line in range(15):
+            page.insert_text(
+                (72, 110 + line * 14),
+                f"Line {line} of page {number}: John Doe lives at 12 Main St.",
+                fontsize=10,
+            )
+    doc.save(str(path))
+
+
+def test_pdf_pages_and_chunks_match_one_shot(tmp_path) -> None:
+    pdf = tmp_path / "multi.pdf"
+    _write_pdf(pdf)
+    full_text, chunks = load_and_extract_text_from_file(str(pdf), 600, 60)
+    assert "".join(iter_pdf_markdown(str(pdf), pages_per_batch=2)) == full_text
+    assert len(list(iter_pdf_markdown(str(pdf), pages_per_batch=2))) == 3
+    assert list(iter_text_chunks(str(pdf), 600, 60, pages_per_batch=1)) == chunks
+
+
+def test_text_chunks_match_one_shot_with_bounded_memory(tmp_path) -> None:
+    rng = random.Random(3)
+    words = ["alpha", "beta", "gamma\n", "delta\n\n"]
+    path = tmp_path / "big.txt"
+    path.write_text(" ".join(rng.choice(words) for _ in range(100_000)))
+    _, chunks = load_and_extract_text_from_file(str(path), 1000, 100)
+
+    tracemalloc.start()
+    try:
+        count = 0
+        for chunk, expected in zip(iter_text_chunks(str(path), 1000, 100), chunks):
+            assert chunk == expected
+            count += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert count == len(chunks)
+    assert peak < path.stat().st_size / 4
+
+
+def test_streaming_rejects_tables(tmp_path) -> None:
+    path = tmp_path / "people.csv"
+    path.write_text("name\nAnn\n")
+    with pytest.raises(ValueError):
+        iter_document_text(str(path))
+
+
+def test_parallel_conversion_joins_pages_in_order(tmp_path) -> None:
+    pdf = tmp_path / "multi.pdf"
+    _write_pdf(pdf, pages=3)
+    full_text, chunks = load_and_extract_text_from_file(str(pdf), 600, 60)
+    assert convert_pdf_parallel(str(pdf), 2) == full_text
+    assert load_and_extract_text_from_file(str(pdf), 600, 60, extract_workers=2) == (
+        full_text,
+        chunks,
+    )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import random
 import sys
 from pathlib import Path
 
@@ -10,12 +11,20 @@ import pytest
 from typer.testing import CliRunner
 
 from pdf_anonymizer_cli.cli import app
-from pdf_anonymizer_core.core import anonymize_file, anonymize_tabular_file
+from pdf_anonymizer_core import tables, utils
+from pdf_anonymizer_core.core import (
+    anonymize_csv_stream,
+    anonymize_file,
+    anonymize_tabular_file,
+    build_llm_batches,
+)
 from pdf_anonymizer_core.load_and_extract import load_and_extract_text_from_file
 from pdf_anonymizer_core.risk import assess_linkage_risk
+from pdf_anonymizer_core.spans import locate_spans
 from pdf_anonymizer_core.tables import (
     EXCEL_EXTRA_MESSAGE,
     TABLE_SUFFIXES,
+    CellTextIndex,
     TableCell,
     TableDocument,
     TableSheet,
@@ -24,6 +33,7 @@ from pdf_anonymizer_core.tables import (
     load_review_text,
     load_table,
     save_table,
+    sniff_csv,
 )
 from pdf_anonymizer_core.utils import deanonymize_file, save_results
 from pdf_anonymizer_core.verify import verify_anonymized_text
@@ -139,6 +149,23 @@ class TestCsvDeanonymize:
         assert restored[1][8] == '="Jane"&" Doe"'
         assert restored[3][3] == "+1-555-0100"
 
+    def test_matchers_are_built_once_per_document(
+        self, tmp_path, monkeypatch, mocker
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        review, mapping, entity_texts = _anonymize_people()
+        locators = mocker.spy(tables, "SpanLocator")
+        anon_path, mapping_path = save_results(
+            review,
+            {written: original for original, written in mapping.items()},
+            str(PEOPLE_CSV),
+            entity_texts=entity_texts,
+        )
+        assert locators.call_count == 1
+        restorers = mocker.spy(utils, "PlaceholderRestorer")
+        deanonymize_file(anon_path, mapping_path)
+        assert restorers.call_count == 1
+
 
 class TestCsvDialect:
     def test_semicolon_and_bom_are_preserved(self, tmp_path) -> None:
@@ -321,6 +348,73 @@ class TestSaveResultsInvert:
             )
 
 
+class TestSheetIndex:
+    def _sheet(self, rows: int, columns: int) -> TableSheet:
+        sheet = TableSheet(name="S", hidden=False, max_row=rows, max_column=columns)
+        for row in range(rows, 0, -1):
+            for column in range(columns, 0, -1):
+                text = f"r{row}c{column}"
+                sheet.cells.append(TableCell("S", row, column, text, text, "text"))
+        return sheet
+
+    def test_row_and_address_lookups(self) -> None:
+        sheet = self._sheet(3, 2)
+        assert [cell.column for cell in sheet.row_cells(2)] == [1, 2]
+        assert sheet.cell_at(3, 1).search_text == "r3c1"
+        assert sheet.cell_at(4, 1) is None
+        assert sheet.row_numbers() == [1, 2, 3]
+        sheet.cells.append(TableCell("S", 4, 1, "late", "late", "text"))
+        assert sheet.cell_at(4, 1).search_text == "late"
+
+    def test_batches_scale_with_cells(self) -> None:
+        sheet = self._sheet(20_000, 5)
+        doc = TableDocument(path="big.csv", kind="csv", sheets=[sheet])
+        batches = build_llm_batches(doc, 5000)
+        assert sum(batch.count("## Row ") for batch in batches) == 20_000
+        assert batches[0].startswith("# Sheet: S\n## Row 1\n")
+
+
+class TestCellTextIndex:
+    def test_matches_per_cell_scan(self) -> None:
+        rng = random.Random(5)
+        alphabet = "ab _-.é1("
+        for _ in range(100):
+            cells = [
+                TableCell("S", row, 1, text, text, "text")
+                for row, text in enumerate(
+                    "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+                    for _ in range(30)
+                )
+            ]
+            index = CellTextIndex(cells)
+            for _ in range(10):
+                entity = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                expected = [
+                    cell
+                    for cell in cells
+                    if cell.search_text and locate_spans(cell.search_text, [entity])
+                ]
+                assert index.cells_containing(entity) == expected
+
+    def test_apply_visits_only_indexed_hits(self) -> None:
+        cells = [
+            TableCell("S", 1, 1, "Ann Lee", "Ann Lee", "text"),
+            TableCell("S", 1, 2, "Annex", "Annex", "text"),
+            TableCell("S", 2, 1, "met Ann", "met Ann", "text"),
+        ]
+        sheet = TableSheet("S", False, 2, 2, cells=cells)
+        doc = TableDocument(path="m.csv", kind="csv", sheets=[sheet])
+        index = CellTextIndex(cells)
+        assert "Ann" in index and "Bob" not in index
+        assert [cell.row for cell in index.cells_containing("Ann")] == [1, 2]
+        apply_mapping_to_table(doc, {"Ann": "PERSON_1"}, ["Ann"], index=index)
+        assert [cell.search_text for cell in cells] == [
+            "PERSON_1 Lee",
+            "Annex",
+            "met PERSON_1",
+        ]
+
+
 class TestCsvRowWidths:
     def test_ragged_rows_and_empty_field_rows_round_trip(self, tmp_path) -> None:
         src = tmp_path / "ragged.csv"
@@ -477,6 +571,167 @@ class TestEmptyMappingStillWrites:
         assert Path(mapping_path).is_file()
 
 
+class TestStreamingCsv:
+    def _stream(self, src: Path, dest: Path, **kwargs):
+        defaults = dict(
+            characters_to_anonymize=1000,
+            prompt_template="unused",
+            model_name="unused",
+            use_llm=False,
+        )
+        defaults.update(kwargs)
+        return anonymize_csv_stream(str(src), str(dest), **defaults)
+
+    def _in_memory(self, src: Path) -> tuple[bytes, dict]:
+        review, mapping, entity_texts = anonymize_tabular_file(
+            str(src), 1000, "unused", "unused", use_llm=False
+        )
+        out, _mapping_path = save_results(
+            review,
+            {written: original for original, written in mapping.items()},
+            str(src),
+            entity_texts=entity_texts,
+            ephemeral_mapping=True,
+        )
+        return Path(out).read_bytes(), mapping
+
+    @pytest.mark.parametrize("rows_per_batch", [1, 2, 5000])
+    def test_matches_in_memory_path(
+        self, tmp_path, monkeypatch, rows_per_batch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        expected, expected_mapping = self._in_memory(PEOPLE_CSV)
+        dest = tmp_path / "people.stream.csv"
+        mapping, entity_texts = self._stream(
+            PEOPLE_CSV, dest, rows_per_batch=rows_per_batch
+        )
+        assert mapping == expected_mapping
+        assert set(entity_texts) == set(expected_mapping)
+        assert dest.read_bytes() == expected
+
+    def test_bom_dialect_crlf_and_formulas_are_kept(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        src = tmp_path / "eu.csv"
+        body = (
+            "Name;Email;Calc\r\n"
+            "Ada Lovelace;ada@example.com;=A2\r\n"
+            "Bob;bob@example.com;+1-555-0100\r\n"
+        )
+        src.write_bytes(b"\xef\xbb\xbf" + body.encode("utf-8"))
+        source = sniff_csv(str(src))
+        assert source.had_bom is True
+        assert source.dialect["delimiter"] == ";"
+        assert source.dialect["lineterminator"] == "\r\n"
+        expected, _mapping = self._in_memory(src)
+        dest = tmp_path / "eu.stream.csv"
+        self._stream(src, dest, rows_per_batch=1)
+        raw = dest.read_bytes()
+        assert raw == expected
+        assert raw.startswith(b"\xef\xbb\xbf")
+        text = raw.decode("utf-8-sig")
+        assert "ada@example.com" not in text
+        assert "'=A2" in text
+        assert text.endswith("\r\n")
+
+    def test_cp1252_source_is_decoded(self, tmp_path) -> None:
+        src = tmp_path / "legacy.csv"
+        src.write_bytes("Name,Email\nRen\xe9e,renee@example.com\n".encode("cp1252"))
+        assert sniff_csv(str(src)).encoding == "cp1252"
+        dest = tmp_path / "legacy.out.csv"
+        self._stream(src, dest)
+        text = dest.read_text(encoding="utf-8")
+        assert "Ren\xe9e" in text
+        assert "renee@example.com" not in text
+
+    def test_size_and_cell_caps_do_not_apply(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr("pdf_anonymizer_core.conf.MAX_TABLE_BYTES", 4)
+        monkeypatch.setattr("pdf_anonymizer_core.conf.MAX_TABLE_CELLS", 2)
+        src = tmp_path / "big.csv"
+        rows = ["Id,Email"] + [f"{i},user{i}@example.com" for i in range(200)]
+        src.write_text("\n".join(rows) + "\n", encoding="utf-8")
+        dest = tmp_path / "big.out.csv"
+        mapping, _texts = self._stream(src, dest, rows_per_batch=7)
+        assert len(mapping) == 200
+        out_rows = _grid(dest)
+        assert len(out_rows) == 201
+        assert all(row[1].startswith("EMAIL_") for row in out_rows[1:])
+
+    def test_memory_is_bounded_by_row_batch(self, tmp_path) -> None:
+        import tracemalloc
+
+        src = tmp_path / "wide.csv"
+        row = ",".join(["plain words without identifiers"] * 8)
+        with src.open("w", encoding="utf-8", newline="") as handle:
+            for _ in range(8000):
+                handle.write(row + "\n")
+        size = src.stat().st_size
+        dest = tmp_path / "wide.out.csv"
+        tracemalloc.start()
+        try:
+            self._stream(src, dest, rows_per_batch=50)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert dest.stat().st_size == size
+        assert peak < size / 4
+
+    def test_llm_batches_are_row_addressed_per_slice(self, tmp_path, mocker) -> None:
+        src = tmp_path / "notes.csv"
+        src.write_text(
+            "Name,Notes\nAnne,Met John Smith\nBo,Called Jane Roe\n",
+            encoding="utf-8",
+        )
+        prompts: list[str] = []
+
+        def fake_llm(batch, *_args, **_kwargs):
+            prompts.append(batch)
+            found = []
+            for name in ("John Smith", "Jane Roe"):
+                if name in batch:
+                    found.append({"text": name, "type": "PERSON"})
+            # Present in the file, but not in this slice's cells.
+            found.append({"text": "Ghost Person", "type": "PERSON"})
+            return found
+
+        mocker.patch(
+            "pdf_anonymizer_core.core.identify_entities_with_llm",
+            side_effect=fake_llm,
+        )
+        dest = tmp_path / "notes.out.csv"
+        mapping, _texts = self._stream(src, dest, use_llm=True, rows_per_batch=2)
+        assert len(prompts) == 2
+        assert "[Sheet1!B2] Notes: Met John Smith" in prompts[0]
+        assert "## Row 3" in prompts[1]
+        assert "[Sheet1!B3] Notes: Called Jane Roe" in prompts[1]
+        assert set(mapping) == {"John Smith", "Jane Roe"}
+        text = dest.read_text(encoding="utf-8")
+        assert "John Smith" not in text
+        assert "Jane Roe" not in text
+
+    def test_refuses_to_overwrite_source(self, tmp_path) -> None:
+        src = tmp_path / "people.csv"
+        src.write_text("a,b\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="overwrite"):
+            self._stream(src, src)
+
+    def test_cli_stream_csv_writes_output_and_mapping(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(
+            app, ["run", str(PEOPLE_CSV), "--no-llm", "--stream-csv"]
+        )
+        assert result.exit_code == 0, result.output
+        out = Path("data/anonymized/people.anonymized.csv")
+        mapping_path = Path("data/mappings/people.mapping.json")
+        assert out.is_file()
+        assert mapping_path.is_file()
+        deanonymized_path, _stats = deanonymize_file(str(out), str(mapping_path))
+        assert _grid(Path(deanonymized_path)) == _grid(PEOPLE_CSV)
+
+
 class TestCrossFileMap:
     def test_same_person_keeps_placeholder(self, mocker, tmp_path) -> None:
         first = tmp_path / "a.csv"
@@ -314,6 +314,75 @@ class TestXlsxAnonymize:
         assert "Called" in notes
 
 
+class TestXlsxSingleLoad:
+    def test_workbook_without_formulas_is_parsed_once(self, tmp_path, mocker) -> None:
+        import openpyxl
+
+        wb = Workbook()
+        wb.active["A1"] = "jane@acme.com"
+        src = tmp_path / "plain.xlsx"
+        wb.save(src)
+        wb.close()
+        spy = mocker.spy(openpyxl, "load_workbook")
+        doc = load_table(str(src))
+        assert spy.call_count == 1
+        assert doc.workbook is None
+
+    def test_cached_values_load_before_cells_ahead_of_the_formula(
+        self, tmp_path, mocker
+    ) -> None:
+        wb = Workbook()
+        wb.active["B2"] = "=A1"
+        src = tmp_path / "spill.xlsx"
+        wb.save(src)
+        wb.close()
+        # A1 has a value only in the data_only view, as a spill cell would.
+        mocker.patch(
+            "pdf_anonymizer_core.tables._cached_values_map",
+            return_value={(1, 1): "Jane Doe", (2, 2): "Jane Doe"},
+        )
+        doc = load_table(str(src))
+        found = {(c.row, c.column): c.search_text for c in doc.sheets[0].cells}
+        assert found[(1, 1)] == "Jane Doe"
+        assert found[(2, 2)] == "Jane Doe"
+
+    def test_document_flows_to_save_without_reload(
+        self, tmp_path, monkeypatch, mocker
+    ) -> None:
+        import openpyxl
+
+        monkeypatch.chdir(tmp_path)
+        src = _build_roster(tmp_path / "roster.xlsx")
+        review, mapping, entity_texts = _anonymize_xlsx(src)
+        placeholder_map = {written: original for original, written in mapping.items()}
+        reloaded, _ = save_results(
+            review, placeholder_map, str(src), entity_texts=entity_texts
+        )
+        expected = {
+            addr: cell.value
+            for addr, cell in _cells(Path(reloaded), "Employees").items()
+        }
+        Path(reloaded).unlink()
+
+        spy = mocker.spy(openpyxl, "load_workbook")
+        doc = load_table(str(src), keep_workbook=True)
+        # Styled workbook plus one read-only pass for the formula cache.
+        assert spy.call_count == 2
+        review2, mapping2, _texts = _anonymize_xlsx(src, document=doc)
+        out, _ = save_results(review2, placeholder_map, str(src), table=doc)
+        assert spy.call_count == 2
+        doc.close()
+        assert doc.workbook is None
+
+        assert review2 == review
+        assert mapping2 == mapping
+        written = {
+            addr: cell.value for addr, cell in _cells(Path(out), "Employees").items()
+        }
+        assert written == expected
+        assert _any_formula(Path(out)) is False
+
+
 class TestXlsxDispatchAndReview:
     def test_anonymize_file_dispatches_xlsx(self, tmp_path) -> None:
         src = _build_roster(tmp_path / "roster.xlsx")